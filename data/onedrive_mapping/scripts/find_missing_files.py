@@ -6,9 +6,15 @@ Update the CSV with found matches.
 
 import csv
 import os
+import sys
 from pathlib import Path
 from collections import defaultdict
 import json
+
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from fs_index import open_index
+from fuzzy_index import TrigramIndex
 import re
 from difflib import SequenceMatcher
 
@@ -19,26 +25,37 @@ OUTPUT_CSV = "/Users/z/Desktop/git/montlake-closeout/data/requirements_tracker_u
 REPORT_TXT = "/Users/z/Desktop/git/montlake-closeout/data/missing_files_found.txt"
 REPORT_JSON = "/Users/z/Desktop/git/montlake-closeout/data/missing_files_found.json"
 
+# Score given to a PDF whose filename contains the doc number
+DOC_NUMBER_SCORE = 0.6
+
+# Filenames scored with the full similarity ratio per search term
+MATCH_TOP_K = 100
+
+# Filename substrings up to this length are indexed for the doc-number check
+# (doc numbers are 1-3 digits; longer ones are looked up by their prefix)
+DOC_NUMBER_KEY_LENGTH = 3
+
 def find_all_pdfs(base_path):
     """Find all PDF files in the OneDrive directory with metadata."""
     print(f"Scanning for PDFs in {base_path}...")
     pdfs = []
 
-    for root, dirs, files in os.walk(base_path):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, base_path)
-
-                pdfs.append({
-                    'filename': file,
-                    'filename_no_ext': os.path.splitext(file)[0],
-                    'full_path': full_path,
-                    'relative_path': rel_path,
-                    'directory': os.path.dirname(rel_path),
-                    'filename_lower': file.lower(),
-                    'filename_no_ext_lower': os.path.splitext(file)[0].lower()
-                })
+    # Served from the OneDrive index; only changed folders are re-listed
+    index = open_index(base_path, stat_files=False)
+    for entry in index.files(base_path, extensions=['.pdf']):
+        file = entry.name
+        rel_path = os.path.relpath(entry.path, base_path)
+
+        pdfs.append({
+            'filename': file,
+            'filename_no_ext': os.path.splitext(file)[0],
+            'full_path': entry.path,
+            'relative_path': rel_path,
+            'directory': os.path.dirname(rel_path),
+            'filename_lower': file.lower(),
+            'filename_no_ext_lower': os.path.splitext(file)[0].lower()
+        })
+    index.close()
 
     print(f"Found {len(pdfs)} PDFs")
     return pdfs
@@ -59,12 +76,39 @@ def similarity_score(s1, s2):
     """Calculate similarity between two strings."""
     return SequenceMatcher(None, normalize_string(s1), normalize_string(s2)).ratio()
 
-def search_for_matches(doc, pdfs, threshold=0.7):
+def build_filename_index(pdfs):
+    """Trigram index over the normalized PDF filenames (without extension)."""
+    return TrigramIndex([pdf['filename_no_ext'] for pdf in pdfs], normalize=normalize_string)
+
+def build_doc_number_index(pdfs, key_length=DOC_NUMBER_KEY_LENGTH):
+    """{substring: [PDF positions]} for every lowercased filename substring up to key_length characters."""
+    number_index = defaultdict(list)
+    for i, pdf in enumerate(pdfs):
+        name = pdf['filename_lower']
+        parts = {name[start:start + length]
+                 for length in range(1, key_length + 1)
+                 for start in range(len(name) - length + 1)}
+        for part in parts:
+            number_index[part].append(i)
+    return number_index
+
+def pdfs_with_number(number, pdfs, number_index, key_length=DOC_NUMBER_KEY_LENGTH):
+    """Positions of the PDFs whose lowercased filename contains number, in order."""
+    candidates = number_index.get(number[:key_length], [])
+    if len(number) <= key_length:
+        return candidates
+    return [i for i in candidates if number in pdfs[i]['filename_lower']]
+
+def search_for_matches(doc, pdfs, threshold=0.7, index=None, number_index=None):
     """
     Search for PDF files that might match this document.
     Returns list of matches sorted by confidence score.
+    Only the filenames shortlisted by the trigram index are scored, and
+    filenames containing the doc number are looked up in the doc-number
+    index; pass prebuilt indexes when searching for many documents.
     """
-    matches = []
+    if index is None:
+        index = build_filename_index(pdfs)
 
     # Get search terms from document
     doc_name = doc.get('document_name', '')
@@ -77,36 +121,37 @@ def search_for_matches(doc, pdfs, threshold=0.7):
     if full_name and full_name != doc_name:
         search_terms.append(('full_name', full_name))
 
-    # Search through all PDFs
-    for pdf in pdfs:
-        best_score = 0
-        best_match_type = None
-
-        # Check filename without extension
-        for term_type, term in search_terms:
-            score = similarity_score(term, pdf['filename_no_ext'])
-            if score > best_score:
-                best_score = score
-                best_match_type = f"{term_type}_to_filename"
-
-        # Check if doc number appears in filename
-        if doc_number:
-            if doc_number.lower() in pdf['filename_lower']:
-                # Boost score if doc number found
-                best_score = max(best_score, 0.6)
-                if not best_match_type:
-                    best_match_type = "doc_number_in_filename"
-
-        # If score is above threshold, add to matches
-        if best_score >= threshold:
-            matches.append({
-                'pdf': pdf,
-                'score': best_score,
-                'match_type': best_match_type
-            })
-
-    # Sort by score (highest first)
-    matches.sort(key=lambda x: x['score'], reverse=True)
+    # Best score per PDF index; earlier terms win ties
+    best = {}
+
+    # Check filename without extension
+    for term_type, term in search_terms:
+        for i, score in index.search(term, threshold, top_k=MATCH_TOP_K):
+            if i not in best or score > best[i][0]:
+                best[i] = (score, f"{term_type}_to_filename")
+
+    # Check if doc number appears in filename (can only matter below the boost score)
+    if doc_number and threshold <= DOC_NUMBER_SCORE:
+        if number_index is None:
+            number_index = build_doc_number_index(pdfs)
+        for i in pdfs_with_number(doc_number.lower(), pdfs, number_index):
+            if i in best:
+                score, match_type = best[i]
+            else:
+                # Below the threshold, so not shortlisted: score it directly
+                score, match_type = 0, None
+                for term_type, term in search_terms:
+                    term_score = similarity_score(term, pdfs[i]['filename_no_ext'])
+                    if term_score > score:
+                        score, match_type = term_score, f"{term_type}_to_filename"
+            best[i] = (max(score, DOC_NUMBER_SCORE), match_type or "doc_number_in_filename")
+
+    # Sort by score (highest first), keeping PDF order for ties
+    matches = [{
+        'pdf': pdfs[i],
+        'score': score,
+        'match_type': match_type
+    } for i, (score, match_type) in sorted(best.items(), key=lambda item: (-item[1][0], item[0]))]
 
     return matches
 
@@ -152,8 +197,11 @@ def find_and_update(all_docs, missing_files, pdfs, fieldnames):
     # Create a mapping of doc_number to index for quick updates
     doc_lookup = {doc['Doc_Number']: i for i, doc in enumerate(all_docs)}
 
+    # Normalize and index the filenames once for all documents
+    index = build_filename_index(pdfs)
+
     for doc in missing_files:
-        matches = search_for_matches(doc, pdfs, threshold=0.7)
+        matches = search_for_matches(doc, pdfs, threshold=0.7, index=index)
 
         doc_info = {
             'doc_number': doc['Doc_Number'],
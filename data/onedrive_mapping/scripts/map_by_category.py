@@ -5,10 +5,15 @@ Map OneDrive files to CSV by using the Category structure.
 
 import csv
 import os
+import sys
 from pathlib import Path
 from collections import defaultdict
 import json
 
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from fs_index import open_index
+
 # Paths
 ONEDRIVE_BASE = "/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation"
 APPENDICES_DIR = os.path.join(ONEDRIVE_BASE, "TheBRIDGE - Montlake - Contract Documents/Appendices")
@@ -19,6 +24,15 @@ CSV_PATH = "/Users/z/Desktop/git/montlake-closeout/data/requirements_tracker.csv
 OUTPUT_CSV = "/Users/z/Desktop/git/montlake-closeout/data/requirements_tracker_updated.csv"
 REPORT_TXT = "/Users/z/Desktop/git/montlake-closeout/data/mapping_report.txt"
 
+_index = None
+
+def get_index():
+    """OneDrive index for the appendices tree, refreshed once per run."""
+    global _index
+    if _index is None:
+        _index = open_index(APPENDICES_DIR, stat_files=False)
+    return _index
+
 def scan_folder_recursively(folder_path, max_depth=5):
     """Scan a folder recursively and return all files and subdirectories."""
     items = {
@@ -28,45 +42,37 @@ def scan_folder_recursively(folder_path, max_depth=5):
         'folders_by_name': {}
     }
 
-    if not os.path.exists(folder_path):
+    index = get_index()
+    folder_path = os.path.abspath(folder_path)
+    if not index.exists(folder_path):
         return items
 
-    def scan(path, depth=0):
-        if depth > max_depth:
-            return
-
-        try:
-            entries = os.listdir(path)
-        except PermissionError:
-            return
-
-        for entry in entries:
-            if entry.startswith('.'):
+    for path, dir_entries, file_entries in index.walk(folder_path, max_depth=max_depth):
+        depth = 0 if path == folder_path else os.path.relpath(path, folder_path).count(os.sep) + 1
+
+        dir_entries[:] = [entry for entry in dir_entries if not entry.name.startswith('.')]
+        for entry in dir_entries:
+            folder_info = {
+                'name': entry.name,
+                'full_path': entry.path,
+                'relative_path': os.path.relpath(entry.path, folder_path),
+                'depth': depth
+            }
+            items['folders'].append(folder_info)
+            items['folders_by_name'][entry.name] = folder_info
+
+        for entry in file_entries:
+            if entry.name.startswith('.'):
                 continue
+            file_info = {
+                'name': entry.name,
+                'full_path': entry.path,
+                'relative_path': os.path.relpath(entry.path, folder_path),
+                'folder': path
+            }
+            items['files'].append(file_info)
+            items['files_by_name'][entry.name] = file_info
 
-            full_path = os.path.join(path, entry)
-
-            if os.path.isdir(full_path):
-                folder_info = {
-                    'name': entry,
-                    'full_path': full_path,
-                    'relative_path': os.path.relpath(full_path, folder_path),
-                    'depth': depth
-                }
-                items['folders'].append(folder_info)
-                items['folders_by_name'][entry] = folder_info
-                scan(full_path, depth + 1)
-            else:
-                file_info = {
-                    'name': entry,
-                    'full_path': full_path,
-                    'relative_path': os.path.relpath(full_path, folder_path),
-                    'folder': os.path.dirname(full_path)
-                }
-                items['files'].append(file_info)
-                items['files_by_name'][entry] = file_info
-
-    scan(folder_path)
     return items
 
 def find_files_in_category(category, doc_name, full_name, appendices_dir):
@@ -76,7 +82,7 @@ def find_files_in_category(category, doc_name, full_name, appendices_dir):
 
     category_path = os.path.join(appendices_dir, category)
 
-    if not os.path.exists(category_path):
+    if not get_index().exists(category_path):
         return None
 
     # Scan the category folder
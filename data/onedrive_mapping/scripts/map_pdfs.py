@@ -6,10 +6,15 @@ Creates a comprehensive mapping of all PDFs found in OneDrive and their relation
 
 import csv
 import os
+import sys
 from pathlib import Path
 from collections import defaultdict
 import json
 
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from fs_index import open_index
+
 # Paths
 ONEDRIVE_BASE = "/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation"
 CSV_PATH = "/Users/z/Desktop/git/montlake-closeout/data/requirements_tracker.csv"
@@ -20,17 +25,17 @@ def find_all_pdfs(base_path):
     """Find all PDF files in the OneDrive directory."""
     print(f"Scanning for PDFs in {base_path}...")
     pdfs = []
-    for root, dirs, files in os.walk(base_path):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, base_path)
-                pdfs.append({
-                    'filename': file,
-                    'full_path': full_path,
-                    'relative_path': rel_path,
-                    'directory': os.path.dirname(rel_path)
-                })
+    # Served from the OneDrive index; only changed folders are re-listed
+    index = open_index(base_path, stat_files=False)
+    for entry in index.files(base_path, extensions=['.pdf']):
+        rel_path = os.path.relpath(entry.path, base_path)
+        pdfs.append({
+            'filename': entry.name,
+            'full_path': entry.path,
+            'relative_path': rel_path,
+            'directory': os.path.dirname(rel_path)
+        })
+    index.close()
     print(f"Found {len(pdfs)} PDFs")
     return pdfs
 
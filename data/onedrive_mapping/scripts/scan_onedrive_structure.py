@@ -5,10 +5,15 @@ Comprehensively scan OneDrive structure and map to CSV documents.
 
 import csv
 import os
+import sys
 from pathlib import Path
 from collections import defaultdict
 import json
 
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from fs_index import open_index
+
 # Paths
 ONEDRIVE_BASE = "/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation"
 CSV_PATH = "/Users/z/Desktop/git/montlake-closeout/data/requirements_tracker.csv"
@@ -26,50 +31,47 @@ def scan_directory_structure(base_path, max_depth=10):
         'all_pdfs': []
     }
 
-    def scan_dir(path, depth=0):
-        if depth > max_depth:
-            return
+    # Listings come from the OneDrive index; only changed folders are re-listed
+    index = open_index(base_path, stat_files=False)
+    base_path = os.path.abspath(base_path)
+
+    for path, dir_entries, file_entries in index.walk(base_path, max_depth=max_depth):
+        depth = 0 if path == base_path else os.path.relpath(path, base_path).count(os.sep) + 1
+
+        # Skip hidden folders (and everything below them)
+        dir_entries[:] = [entry for entry in dir_entries if not entry.name.startswith('.')]
+        for entry in dir_entries:
+            structure['folders'].append({
+                'name': entry.name,
+                'full_path': entry.path,
+                'relative_path': os.path.relpath(entry.path, base_path),
+                'depth': depth
+            })
+
+        for entry in file_entries:
+            if entry.name.startswith('.'):
+                continue
 
-        try:
-            items = os.listdir(path)
-        except PermissionError:
-            return
+            rel_path = os.path.relpath(entry.path, base_path)
+            file_info = {
+                'name': entry.name,
+                'full_path': entry.path,
+                'relative_path': rel_path,
+                'folder': os.path.dirname(rel_path),
+                'extension': entry.ext
+            }
 
-        for item in items:
-            if item.startswith('.'):
-                continue
+            structure['all_files'].append(file_info)
+
+            folder_key = os.path.dirname(rel_path)
+            if folder_key not in structure['files_by_folder']:
+                structure['files_by_folder'][folder_key] = []
+            structure['files_by_folder'][folder_key].append(file_info)
+
+            if file_info['extension'] == '.pdf':
+                structure['all_pdfs'].append(file_info)
 
-            full_path = os.path.join(path, item)
-            rel_path = os.path.relpath(full_path, base_path)
-
-            if os.path.isdir(full_path):
-                structure['folders'].append({
-                    'name': item,
-                    'full_path': full_path,
-                    'relative_path': rel_path,
-                    'depth': depth
-                })
-                scan_dir(full_path, depth + 1)
-            else:
-                file_info = {
-                    'name': item,
-                    'full_path': full_path,
-                    'relative_path': rel_path,
-                    'folder': os.path.dirname(rel_path),
-                    'extension': os.path.splitext(item)[1].lower()
-                }
-
-                structure['all_files'].append(file_info)
-
-                folder_key = os.path.dirname(rel_path)
-                if folder_key not in structure['files_by_folder']:
-                    structure['files_by_folder'][folder_key] = []
-                structure['files_by_folder'][folder_key].append(file_info)
-
-                if file_info['extension'] == '.pdf':
-                    structure['all_pdfs'].append(file_info)
-
-    scan_dir(base_path)
+    index.close()
 
     print(f"  Found {len(structure['folders'])} folders")
     print(f"  Found {len(structure['all_files'])} files")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Appendix catalog loader and category index
+The catalog of contract appendices ((category, appendix id) -> document
+name) lives in data/onedrive_mapping/appendix_catalog.json, a versioned data
+file, instead of a dict literal in one of the mapping scripts.
+
+AppendixCatalog groups the entries by category and precomputes each name's
+lowercase form, volume number and word set, so a lookup only touches the
+entries of the document's own category.
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG_PATH = os.path.join(REPO_ROOT, 'data', 'onedrive_mapping', 'appendix_catalog.json')
+
+# Catalog file format this loader understands
+CATALOG_VERSION = 1
+
+# name_lower is name.lower(); tokens is the set of its words
+AppendixEntry = namedtuple('AppendixEntry', ['category', 'id', 'name', 'name_lower', 'volume', 'tokens'])
+
+
+def extract_volume_number(doc_name):
+    """Extract volume number from document names like 'Volume 01' or 'As-Built Plans Volume 14a'."""
+    # Match patterns like "Volume 01", "Volume 14a", etc.
+    match = re.search(r'[Vv]olume\s+(\d+[a-z]?)', doc_name)
+    if match:
+        return match.group(1).lower()  # Return '01', '14a', etc.
+    return None
+
+
+class AppendixCatalog:
+    """Catalog entries partitioned by category, in catalog order."""
+
+    def __init__(self, appendices):
+        """appendices: iterable of (category, appendix id, name)."""
+        self.by_category = {}
+        self._exact = {}    # category -> {stripped lowercase name: first entry}
+        self._volumes = {}  # category -> {volume number: first entry}
+        for category, appendix_id, name in appendices:
+            name_lower = name.lower()
+            entry = AppendixEntry(category, appendix_id, name, name_lower,
+                                  extract_volume_number(name), frozenset(name_lower.split()))
+            self.by_category.setdefault(category, []).append(entry)
+            self._exact.setdefault(category, {}).setdefault(name_lower.strip(), entry)
+            if entry.volume is not None:
+                self._volumes.setdefault(category, {}).setdefault(entry.volume, entry)
+
+    @classmethod
+    def load(cls, path=CATALOG_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CATALOG_VERSION:
+            raise ValueError(f"Unsupported appendix catalog version {data.get('version')!r} in {path} "
+                             f"(expected {CATALOG_VERSION})")
+        return cls((item['category'], item['id'], item['name']) for item in data['appendices'])
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.by_category.values())
+
+    def entries(self, category):
+        """Entries of one category in catalog order."""
+        return self.by_category.get(category, [])
+
+    def exact(self, category, name):
+        """First entry in the category whose name equals `name` (case-insensitive, stripped)."""
+        return self._exact.get(category, {}).get(name.lower().strip())
+
+    def volume(self, category, volume):
+        """First entry in the category with this volume number."""
+        return self._volumes.get(category, {}).get(volume)
+
+    def as_dict(self):
+        """The catalog as the old {(category, appendix id): name} mapping."""
+        return {(entry.category, entry.id): entry.name
+                for entries in self.by_category.values() for entry in entries}
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Load the appendix catalog data file into an AppendixCatalog."""
+    return AppendixCatalog.load(path)
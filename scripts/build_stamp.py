@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Generated-at stamps for the dashboards
+The "Generated <date> <AM/PM>" line used to be rendered into the HTML, so
+every run changed index.html and contractdocs.html even when the data had
+not changed, and update_dashboard.sh always found something to commit.
+
+The pages now fill that line in from assets/generated_at/<page>.json (see
+templates/partials/header.html). write_page() only rewrites a page whose
+HTML actually changed, and only then moves its stamp, so an unchanged
+dashboard leaves both files alone. One file per page keeps each dashboard's
+stamp an output of that dashboard's pipeline stage alone.
+"""
+
+import json
+import os
+from datetime import datetime
+
+STAMP_DIR = 'assets/generated_at'
+
+
+def _write_text(path, text):
+    # Write then rename so a page never sees a half-written file
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def stamp_path(page, stamp_dir=STAMP_DIR):
+    return os.path.join(stamp_dir, f"{page}.json")
+
+
+def load_stamp(page, stamp_dir=STAMP_DIR):
+    try:
+        with open(stamp_path(page, stamp_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def stamp(page, when=None, stamp_dir=STAMP_DIR):
+    """Record `when` (default now) as the generated-at time of a page."""
+    when = when or datetime.now()
+    entry = {
+        'time_part': when.strftime('%B %d, %Y at %I:%M'),
+        'am_pm': when.strftime('%p'),
+        'iso': when.isoformat(timespec='seconds'),
+    }
+    _write_text(stamp_path(page, stamp_dir), json.dumps(entry, indent=2, sort_keys=True) + '\n')
+    return entry
+
+
+def write_page(path, html, page, stamp_dir=STAMP_DIR):
+    """
+    Write html to path unless the file already holds exactly that, and stamp
+    the page when it changed (or has never been stamped). Returns True when
+    the file was written.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            changed = f.read() != html
+    except (OSError, UnicodeDecodeError):
+        changed = True
+
+    if changed:
+        _write_text(path, html)
+    if changed or load_stamp(page, stamp_dir) is None:
+        stamp(page, stamp_dir=stamp_dir)
+    return changed
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Shared figure JSON for the closeout dashboard charts
+Instead of one fig.to_html() per chart (each repeating the full Plotly theme
+template and its own newPlot script), every figure is serialized into one
+compact JSON blob: layout templates are stored once and referenced by index,
+and CHART_BOOTSTRAP_JS plots all figures from it.
+
+The page loads plotly.js pinned to the version bundled with the installed
+plotly package - from the CDN, or vendored as a content-hashed asset.
+"""
+
+import json
+
+import plotly.io as pio
+import plotly.offline
+
+from data_assets import write_asset_file, prune_assets
+
+PLOTLY_CDN_URL = 'https://cdn.plot.ly/plotly-{version}.min.js'
+VENDOR_DIR = 'assets/js'
+
+
+def figure_payload(figures, config=None):
+    """
+    Serialize {div id: figure} into one payload dict:
+      {"config": {...}, "templates": [template, ...],
+       "figures": {div id: {"data": [...], "layout": {...}, "template": i}}}
+    """
+    config = dict(config or {})
+    config.setdefault('responsive', True)  # Same default as fig.to_html()
+
+    templates = []
+    template_ids = {}
+    specs = {}
+    for div_id, fig in figures.items():
+        spec = json.loads(pio.to_json(fig, validate=False))
+        layout = spec.get('layout', {})
+        template = layout.pop('template', None)
+        template_index = None
+        if template is not None:
+            key = json.dumps(template, sort_keys=True)
+            if key not in template_ids:
+                template_ids[key] = len(templates)
+                templates.append(template)
+            template_index = template_ids[key]
+        specs[div_id] = {'data': spec.get('data', []), 'layout': layout, 'template': template_index}
+
+    return {'config': config, 'templates': templates, 'figures': specs}
+
+
+def figure_payload_json(figures, config=None):
+    """Compact JSON text for figure_payload(), safe to inline in a <script> tag."""
+    text = json.dumps(figure_payload(figures, config), separators=(',', ':'))
+    return text.replace('</', '<\\/')
+
+
+def chart_div(div_id, fig):
+    """Empty chart container sized like the one fig.to_html() emits."""
+    height = f"{fig.layout.height}px" if fig.layout.height else '100%'
+    width = f"{fig.layout.width}px" if fig.layout.width else '100%'
+    return (f'<div style="height:{height}; width:{width};">'
+            f'<div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+            f'</div>')
+
+
+def plotly_script_url(vendor=False):
+    """
+    URL of the pinned plotly.js bundle. With vendor=True the minified bundle
+    shipped with the plotly package is written to assets/js/ under a
+    content-hashed name (older copies are pruned).
+    """
+    version = plotly.offline.get_plotlyjs_version()
+    if not vendor:
+        return PLOTLY_CDN_URL.format(version=version)
+    bundle = plotly.offline.get_plotlyjs().encode('utf-8')
+    url = write_asset_file(f"plotly-{version}", bundle, '.min.js', asset_dir=VENDOR_DIR)
+    prune_assets('plotly-', keep=[url], asset_dir=VENDOR_DIR)
+    return url
+
+
+# Browser-side bootstrap: plotFigures(payload) draws every figure in the blob
+CHART_BOOTSTRAP_JS = """
+        function plotFigures(payload) {
+            Object.keys(payload.figures).forEach(function(divId) {
+                var element = document.getElementById(divId);
+                if (!element) return;
+                var spec = payload.figures[divId];
+                var layout = Object.assign({}, spec.layout);
+                if (spec.template !== null) {
+                    layout.template = payload.templates[spec.template];
+                }
+                Plotly.newPlot(element, spec.data, layout, payload.config);
+            });
+        }
+"""
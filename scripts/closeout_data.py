@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the closeout requirements CSV
+Returns the cleaned frame (filtered rows + normalized status) and keeps a
+pickled snapshot next to the CSV, keyed on the CSV's content hash, so
+unchanged inputs skip parsing and cleanup entirely. Within one process
+(see run_pipeline.py) the cleaned frame is also kept in memory.
+"""
+
+import hashlib
+import os
+import pickle
+
+import pandas as pd
+
+from status_rules import normalize_status
+
+CLOSEOUT_CSV = 'data/current_closeout.csv'
+
+# Bump when the cleanup below changes so stale snapshots are ignored
+LOADER_VERSION = 2
+
+# Subsection titles that mark non-applicable rows
+EXCLUDED_SUBSECTIONS = ['VACANT', 'NO COMPLETION REQUIREMENTS IDENTIFIED']
+
+_loaded = {}  # absolute CSV path -> (content hash, cleaned frame)
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_path(csv_path, content_hash):
+    """Snapshot lives next to the CSV, e.g. data/.current_closeout.<hash>.pkl"""
+    folder, name = os.path.split(csv_path)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(folder, f".{stem}.{content_hash[:16]}.pkl")
+
+
+def _remove_stale_snapshots(csv_path, keep):
+    folder, name = os.path.split(csv_path)
+    prefix = f".{os.path.splitext(name)[0]}."
+    for item in os.listdir(folder or '.'):
+        full_path = os.path.join(folder, item)
+        if item.startswith(prefix) and item.endswith('.pkl') and full_path != keep:
+            try:
+                os.remove(full_path)
+            except OSError:
+                pass
+
+
+def clean_closeout(df):
+    """Apply the row filters and status columns used by every closeout consumer."""
+    # Remove rows where Req ID is blank
+    df = df[df['Req ID'].notna()]
+    # Remove VACANT / NO COMPLETION REQUIREMENTS IDENTIFIED sections
+    df = df[~df['Subsection Title'].isin(EXCLUDED_SUBSECTIONS)].copy()
+
+    # Clean up and normalize Status values so charts and drilldowns align
+    # (rule table shared with the documents dashboard, see status_rules.py)
+    df['Status_Normalized'] = normalize_status(df['Status'])
+
+    # Define completion flags based on normalized status
+    df['Is_Complete'] = df['Status_Normalized'] == 'Complete'
+    df['Is_InProgress'] = df['Status_Normalized'] == 'In Progress'
+    df['Is_NotStarted'] = df['Status_Normalized'] == 'Not Started'
+    return df
+
+
+def load_closeout(csv_path=CLOSEOUT_CSV, use_snapshot=True):
+    """
+    Load the cleaned closeout requirements frame.
+    Reuses the snapshot when the CSV bytes are unchanged; otherwise parses
+    the CSV, cleans it and writes a fresh snapshot (replacing older ones).
+    Callers get their own copy, so adding columns is safe.
+    """
+    content_hash = file_hash(csv_path)
+    key = os.path.abspath(csv_path)
+    if use_snapshot and key in _loaded and _loaded[key][0] == content_hash:
+        return _loaded[key][1].copy()
+
+    snap = snapshot_path(csv_path, content_hash)
+
+    if use_snapshot and os.path.exists(snap):
+        try:
+            with open(snap, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('version') == LOADER_VERSION and cached.get('hash') == content_hash:
+                _loaded[key] = (content_hash, cached['frame'])
+                return cached['frame'].copy()
+        except Exception:
+            pass  # Corrupt or incompatible snapshot - rebuild below
+
+    df = clean_closeout(pd.read_csv(csv_path, encoding='utf-8-sig'))
+
+    if use_snapshot:
+        # Write atomically so an interrupted run never leaves a half-written snapshot
+        tmp_path = snap + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': LOADER_VERSION, 'hash': content_hash, 'frame': df}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snap)
+            _remove_stale_snapshots(csv_path, keep=snap)
+        except OSError:
+            pass  # Read-only checkout - the snapshot is only an optimization
+        _loaded[key] = (content_hash, df)
+        return df.copy()
+
+    return df
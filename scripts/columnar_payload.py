@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Columnar JSON payload encoder for dashboard row data
+Instead of one object per row (every key repeated per row), rows are sent as
+one array per column. Low-cardinality columns are dictionary-encoded: the
+distinct values are listed once and each row stores an integer code.
+
+Payload shape:
+    {"length": n,
+     "columns": {"Notes": ["...", ...]},
+     "dictionaries": {"Status": {"values": ["Complete", ...], "codes": [0, 2, ...]}}}
+
+DECODER_JS holds the matching browser-side decoder.
+"""
+
+import pandas as pd
+
+
+def encode_columnar(frame, dictionary_columns=()):
+    """
+    Encode a DataFrame of display strings into the columnar payload dict.
+    Missing values become '' so the browser never sees null.
+    """
+    columns = {}
+    dictionaries = {}
+    for column in frame.columns:
+        values = frame[column].fillna('').astype(str)
+        if column in dictionary_columns:
+            codes, uniques = pd.factorize(values)
+            dictionaries[column] = {'values': uniques.tolist(), 'codes': codes.tolist()}
+        else:
+            columns[column] = values.tolist()
+    return {'length': len(frame), 'columns': columns, 'dictionaries': dictionaries}
+
+
+# Browser-side decoder:
+#   rowReader(payload) -> function(i) returning row i as an object (decodes one row)
+#   decodeColumnar(payload) -> array of all row objects
+#   lazyRows(payload) -> getter that decodes everything on first call and memoizes
+DECODER_JS = """
+        function rowReader(payload) {
+            var names = Object.keys(payload.columns);
+            var dictNames = Object.keys(payload.dictionaries);
+            return function(i) {
+                var row = {};
+                for (var c = 0; c < names.length; c++) {
+                    row[names[c]] = payload.columns[names[c]][i];
+                }
+                for (var d = 0; d < dictNames.length; d++) {
+                    var dict = payload.dictionaries[dictNames[d]];
+                    row[dictNames[d]] = dict.values[dict.codes[i]];
+                }
+                return row;
+            };
+        }
+
+        function decodeColumnar(payload) {
+            var readRow = rowReader(payload);
+            var rows = new Array(payload.length);
+            for (var i = 0; i < payload.length; i++) {
+                rows[i] = readRow(i);
+            }
+            return rows;
+        }
+
+        function lazyRows(payload) {
+            var rows = null;
+            return function() {
+                if (rows === null) {
+                    rows = decodeColumnar(payload);
+                }
+                return rows;
+            };
+        }
+"""
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Content-hashed, precompressed data assets for the dashboards
+Generators write their data as assets/data/<name>.<hash>.json (plus .gz and,
+when the brotli package is installed, .br siblings) and the HTML shell fetches
+them. Unchanged data keeps the same filename, so browsers and GitHub Pages can
+keep serving it from cache across dashboard updates. prune_assets() keeps
+the version before the current one, so a page shell cached from the
+previous update can still load its data.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # Optional - .br siblings are skipped without it
+    brotli = None
+
+ASSET_DIR = 'assets/data'
+HASH_LENGTH = 12
+
+# Superseded versions of each asset kept by prune_assets()
+PREVIOUS_VERSIONS = 1
+
+
+def _safe_name(name):
+    return re.sub(r'[^A-Za-z0-9_.-]', '', name.replace(' ', '-'))
+
+
+def _write_bytes(path, data):
+    # Write then rename so a page never fetches a half-written asset
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _ensure_bytes(path, data):
+    # Leave a file that already holds data alone (keeps its mtime for
+    # prune_assets); rewrite one that is missing or was edited
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    _write_bytes(path, data)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0  # Only a .gz/.br sibling is left - prune it first
+
+
+def write_asset(name, payload, asset_dir=ASSET_DIR):
+    """
+    Write payload (a JSON-serializable object or ready-made JSON text) as a
+    content-hashed asset and return its URL relative to the repo root.
+    An asset already on disk with the same bytes is left untouched.
+    """
+    text = payload if isinstance(payload, str) else json.dumps(payload, separators=(',', ':'))
+    return write_asset_file(name, text.encode('utf-8'), '.json', asset_dir)
+
+
+def write_asset_file(name, data, extension, asset_dir=ASSET_DIR):
+    """
+    Write raw bytes as <asset_dir>/<name>.<hash><extension> (plus .gz/.br)
+    and return its URL. Used directly for non-JSON assets such as scripts.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    filename = f"{_safe_name(name)}.{digest}{extension}"
+    path = os.path.join(asset_dir, filename)
+
+    os.makedirs(asset_dir, exist_ok=True)
+    _ensure_bytes(path, data)
+    # mtime=0 keeps the gzip bytes identical for identical content
+    _ensure_bytes(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _ensure_bytes(path + '.br', brotli.compress(data))
+
+    return f"{asset_dir}/{filename}"
+
+
+def prune_assets(prefix, keep, asset_dir=ASSET_DIR, previous=PREVIOUS_VERSIONS):
+    """
+    Remove assets starting with prefix that are not in keep (URLs from
+    write_asset), except the newest `previous` other versions of each asset
+    name: a browser or proxy may still hold the last HTML shell, and that
+    shell fetches the asset it was built with.
+    """
+    if not os.path.isdir(asset_dir):
+        return 0
+    keep_files = {os.path.basename(url) for url in keep}
+
+    # Group siblings (.gz/.br) under their asset file, and asset files under their name
+    siblings = {}
+    removed = 0
+    for item in os.listdir(asset_dir):
+        if not item.startswith(prefix):
+            continue
+        if item.endswith('.tmp'):
+            os.remove(os.path.join(asset_dir, item))  # Left over from an interrupted write
+            removed += 1
+            continue
+        siblings.setdefault(re.sub(r'\.(gz|br)$', '', item), []).append(item)
+
+    versions = {}
+    for base in siblings:
+        if base not in keep_files:
+            name = re.sub(rf'\.[0-9a-f]{{{HASH_LENGTH}}}\..*$', '', base)
+            versions.setdefault(name, []).append(base)
+
+    for bases in versions.values():
+        bases.sort(key=lambda base: _mtime(os.path.join(asset_dir, base)), reverse=True)
+        for base in bases[previous:]:
+            for item in siblings[base]:
+                os.remove(os.path.join(asset_dir, item))
+                removed += 1
+    return removed
@@ -2,77 +2,214 @@
 """
 Extract actual document titles from PDFs
 Adds Document_Title column to tracker so we can see what we're actually reviewing
+
+Reading a PDF hydrates it from OneDrive, so this is the explicit hydration
+phase: every file is cleared through a HydrationBudget (hydration.py) first.
+Titles already in the tracker are kept; rerun to pick up skipped files.
+
+Titles, page counts and document info are kept in the PDF cache
+(pdf_cache.py), so unchanged files are never reopened. Every file not in
+the cache goes to a process pool sized to the cores, with a time limit per
+file. The worker reads it with the first-page-only reader (pdf_lazy.py)
+and falls back to a full PyPDF2 parse only when that reader cannot handle
+it; the limit covers both attempts. Results are appended to a checkpoint
+file as they come in; an interrupted run resumes from it and the
+checkpoint is removed once the tracker has been saved.
 """
 
+import json
+import os
+import signal
+import time
 import pandas as pd
 import PyPDF2
 import re
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
-def extract_title_from_pdf(pdf_path):
+from hydration import HydrationBudget
+from pdf_cache import PdfCache
+from pdf_lazy import LazyPdf, LazyPdfError
+
+# Hydration limits for one run (None = unlimited)
+HYDRATION_BYTE_BUDGET = 2 * 1024 ** 3        # 2 GB
+HYDRATION_BYTES_PER_SECOND = 25 * 1024 ** 2  # ~25 MB/s
+
+# Parallel extraction
+WORKERS = os.cpu_count() or 1
+FILE_TIMEOUT_SECONDS = 60     # Give up on a single PDF after this long
+CHECKPOINT_EVERY = 25         # Results per checkpoint write / progress line
+CHECKPOINT_PATH = 'data/.document_titles_checkpoint.jsonl'
+
+# Read only the trailer, Info dict and first page (falls back to PyPDF2)
+LAZY_PARSING = True
+
+# Also match cached files by content (rehashes changed files; reads them in full)
+CACHE_HASH_CONTENTS = False
+
+def choose_title(metadata_title, first_page_text):
+    """
+    Pick the document title
+    Tries: 1) PDF metadata, 2) First page text (first_page_text() returns ''
+    for a document without pages and is only called when the metadata has
+    no usable title)
     """
-    Extract document title from PDF
-    Tries: 1) PDF metadata, 2) First page text
+    # Try metadata first
+    if metadata_title:
+        title = metadata_title.strip()
+        if title and len(title) > 3:
+            return title
+
+    # Try extracting from first page
+    text = first_page_text()
+    if text:
+
+        # Clean up text
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+        # Skip common header junk and look for substantial text
+        skip_patterns = [
+            r'^SR\s*520',
+            r'^Appendix [A-Z]',
+            r'^Page \d+',
+            r'^\d+$',
+            r'^Washington State',
+            r'^Department of Transportation',
+            r'^Request for Proposal',
+            r'^February.*\d{4}',
+            r'^Montlake'
+        ]
+
+        for line in lines:
+            # Skip if too short
+            if len(line) < 5:
+                continue
+
+            # Skip if matches a header pattern
+            if any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
+                continue
+
+            # This might be the title
+            # Clean it up
+            title = line.strip()
+
+            # Remove common prefixes
+            title = re.sub(r'^Appendix [A-Z]+[0-9]*\.?\s*[-:]\s*', '', title, flags=re.IGNORECASE)
+
+            if len(title) > 10:  # Reasonable title length
+                return title
+
+        # If nothing found, return first substantial line
+        for line in lines:
+            if len(line) > 10:
+                return line[:200]  # Limit length
+
+    return ""
+
+def title_from_reader(pdf_reader):
+    """Extract document title from an open PdfReader"""
+    def first_page_text():
+        return pdf_reader.pages[0].extract_text() if len(pdf_reader.pages) > 0 else ''
+
+    return choose_title(pdf_reader.metadata.title if pdf_reader.metadata else None, first_page_text)
+
+def read_pdf_info_lazy(pdf_path):
+    """read_pdf_info() via the first-page-only reader; raises LazyPdfError when it cannot cope."""
+    with LazyPdf(pdf_path) as pdf:
+        metadata = pdf.info()
+        page_count = pdf.page_count()
+        title = choose_title(metadata.get('/Title'), pdf.first_page_text)
+    return {'title': title, 'page_count': page_count, 'metadata': metadata}
+
+def read_pdf_info(pdf_path, lazy=None):
     """
+    Title, page count and document info of a PDF as
+    {'title', 'page_count', 'metadata'}. A file that could not be read gets
+    an empty title and an 'error' message (e.g. not hydrated yet, or locked).
+    """
+    if LAZY_PARSING if lazy is None else lazy:
+        try:
+            return read_pdf_info_lazy(pdf_path)
+        except (LazyPdfError, OSError, ValueError, KeyError, IndexError, TypeError, AttributeError):
+            pass  # Fall back to the full reader
+
+    info = {'title': '', 'page_count': None, 'metadata': {}}
     try:
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-
-            # Try metadata first
-            if pdf_reader.metadata and pdf_reader.metadata.title:
-                title = pdf_reader.metadata.title.strip()
-                if title and len(title) > 3:
-                    return title
-
-            # Try extracting from first page
-            if len(pdf_reader.pages) > 0:
-                first_page = pdf_reader.pages[0]
-                text = first_page.extract_text()
-
-                # Clean up text
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-                # Skip common header junk and look for substantial text
-                skip_patterns = [
-                    r'^SR\s*520',
-                    r'^Appendix [A-Z]',
-                    r'^Page \d+',
-                    r'^\d+$',
-                    r'^Washington State',
-                    r'^Department of Transportation',
-                    r'^Request for Proposal',
-                    r'^February.*\d{4}',
-                    r'^Montlake'
-                ]
-
-                for line in lines:
-                    # Skip if too short
-                    if len(line) < 5:
-                        continue
-
-                    # Skip if matches a header pattern
-                    if any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
-                        continue
-
-                    # This might be the title
-                    # Clean it up
-                    title = line.strip()
-
-                    # Remove common prefixes
-                    title = re.sub(r'^Appendix [A-Z]+[0-9]*\.?\s*[-:]\s*', '', title, flags=re.IGNORECASE)
-
-                    if len(title) > 10:  # Reasonable title length
-                        return title
-
-                # If nothing found, return first substantial line
-                for line in lines:
-                    if len(line) > 10:
-                        return line[:200]  # Limit length
-
-        return ""
+            info['title'] = title_from_reader(pdf_reader)
+            try:
+                info['page_count'] = len(pdf_reader.pages)
+                if pdf_reader.metadata:
+                    info['metadata'] = {str(key): str(pdf_reader.metadata[key]) for key in pdf_reader.metadata}
+            except Exception:
+                pass  # The title is still usable
     except Exception as e:
         print(f"  Error reading {pdf_path}: {str(e)[:50]}")
-        return ""
+        info['error'] = str(e)
+    return info
+
+def extract_title_from_pdf(pdf_path):
+    """Extract document title from PDF (see title_from_reader)"""
+    return read_pdf_info(pdf_path)['title']
+
+
+class _FileTimeout(BaseException):
+    """Raised in a worker when one PDF runs past FILE_TIMEOUT_SECONDS (not caught as Exception)."""
+
+
+def _on_timeout(signum, frame):
+    raise _FileTimeout()
+
+
+def extract_title_worker(pdf_path, timeout=FILE_TIMEOUT_SECONDS):
+    """
+    Pool task: (pdf_path, info, status) with read_pdf_info() output and
+    status 'ok', or (pdf_path, None, 'timeout' / 'error'). Only 'ok' results
+    are cached; the others are retried on the next run.
+    The time limit uses SIGALRM, so it is only enforced where that exists.
+    """
+    use_alarm = timeout and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        info = read_pdf_info(pdf_path)
+        if 'error' in info:
+            return pdf_path, None, 'error'
+        return pdf_path, info, 'ok'
+    except _FileTimeout:
+        return pdf_path, None, 'timeout'
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def load_checkpoint(path=CHECKPOINT_PATH):
+    """
+    {pdf_path: (title, status)} from an interrupted run, or {} when there is
+    none. Only 'ok' records are finished; the rest are parsed again.
+    """
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # Partial last line from a crash mid-write
+            results[record['path']] = (record['title'], record['status'])
+    return results
+
+
+def append_checkpoint(records, path=CHECKPOINT_PATH):
+    """Append finished (pdf_path, title, status) records and flush them to disk."""
+    with open(path, 'a', encoding='utf-8') as f:
+        for pdf_path, title, status in records:
+            f.write(json.dumps({'path': pdf_path, 'title': title, 'status': status}, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
 
 def main():
     print("📄 Extracting Document Titles from PDFs...")
@@ -91,36 +228,132 @@ def main():
     print(f"📊 Processing {len(pdf_docs)} non-cover-sheet PDFs")
     print()
 
-    # Add Document_Title column
-    tracker_df['Document_Title'] = ''
+    # Add Document_Title column (keeping titles from earlier runs)
+    if 'Document_Title' not in tracker_df.columns:
+        tracker_df['Document_Title'] = ''
+    tracker_df['Document_Title'] = tracker_df['Document_Title'].fillna('')
+    budget = HydrationBudget(max_bytes=HYDRATION_BYTE_BUDGET, bytes_per_second=HYDRATION_BYTES_PER_SECOND)
+    cache = PdfCache(hash_contents=CACHE_HASH_CONTENTS)
+
+    # Resume from an interrupted run
+    checkpoint = load_checkpoint()
+    finished = {path: title for path, (title, status) in checkpoint.items() if status == 'ok'}
+    if checkpoint:
+        print(f"♻️  Resuming: {len(finished)} PDFs already done in {CHECKPOINT_PATH}, "
+              f"{len(checkpoint) - len(finished)} to retry")
+        print()
 
-    # Process in batches with progress
     total = len(pdf_docs)
-    processed = 0
     errors = 0
+    already = 0
+    skipped = 0
+    resumed = 0
+    cached = 0
 
+    # Work out which files to parse (the hydration budget is asked as each is queued)
+    todo = []
     for idx, row in pdf_docs.iterrows():
-        processed += 1
+        pdf_path = row['Full_Path']
 
-        if processed % 50 == 0:
-            print(f"  Progress: {processed}/{total} ({processed/total*100:.1f}%)")
+        if tracker_df.at[idx, 'Document_Title'] != '':
+            already += 1
+            continue
 
-        pdf_path = row['Full_Path']
+        # Timed-out and unreadable files go back in the queue
+        if pdf_path in finished:
+            tracker_df.at[idx, 'Document_Title'] = finished[pdf_path]
+            resumed += 1
+            continue
 
         # Check if file exists
-        if not Path(pdf_path).exists():
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
             errors += 1
             continue
 
-        # Extract title
-        title = extract_title_from_pdf(pdf_path)
+        # Unchanged files are answered from the PDF cache without being opened
+        info = cache.get(pdf_path, stat)
+        if info is not None:
+            tracker_df.at[idx, 'Document_Title'] = info['title']
+            cached += 1
+            continue
 
-        # Store in tracker
-        tracker_df.at[idx, 'Document_Title'] = title
+        size_mb = pd.to_numeric(row.get('Size_MB'), errors='coerce')
+        size = int(size_mb * 1024 * 1024) if pd.notna(size_mb) else None
+        todo.append((idx, pdf_path, size))
+
+    print(f"🚀 Extracting {len(todo)} PDFs with {WORKERS} workers "
+          f"({FILE_TIMEOUT_SECONDS}s limit per file)")
+
+    rows_by_path = {}
+    for idx, pdf_path, _ in todo:
+        rows_by_path.setdefault(pdf_path, []).append(idx)
+
+    extracted = 0
+    timeouts = 0
+    read_errors = 0
+    pending_records = []
+    started = time.monotonic()
+    queue = iter(todo)
+    queued = set()
+    in_flight = set()
+
+    with ProcessPoolExecutor(max_workers=WORKERS) as executor:
+        while True:
+            # Keep every worker busy, queueing only files the hydration budget allows
+            for idx, pdf_path, size in queue:
+                if pdf_path in queued:
+                    continue
+                if not budget.request(pdf_path, size):
+                    skipped += len(rows_by_path[pdf_path])
+                    queued.add(pdf_path)
+                    continue
+                queued.add(pdf_path)
+                in_flight.add(executor.submit(extract_title_worker, pdf_path))
+                if len(in_flight) >= WORKERS * 2:
+                    break
+            if not in_flight:
+                break
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                pdf_path, info, status = future.result()
+                title = info['title'] if info else ''
+                if info is not None:
+                    cache.put(pdf_path, info)
+                for idx in rows_by_path[pdf_path]:
+                    tracker_df.at[idx, 'Document_Title'] = title
+                if status == 'timeout':
+                    timeouts += 1
+                    print(f"  ⏱️  Timed out: {pdf_path}")
+                elif status == 'error':
+                    read_errors += 1
+                extracted += 1
+                pending_records.append((pdf_path, title, status))
+
+            # Checkpoint and report progress after every chunk
+            if len(pending_records) >= CHECKPOINT_EVERY:
+                cache.commit()
+                append_checkpoint(pending_records)
+                pending_records = []
+                elapsed = time.monotonic() - started
+                print(f"  Progress: {extracted}/{len(rows_by_path)} parsed "
+                      f"({extracted / elapsed:.1f} files/s, {timeouts} timed out)")
+
+    cache.close()
+    if pending_records:
+        append_checkpoint(pending_records)
+    print(f"  Progress: {extracted}/{len(rows_by_path)} parsed, {timeouts} timed out")
 
     print()
-    print(f"✅ Extracted titles from {processed - errors} PDFs")
-    print(f"⚠️  {errors} files had errors")
+    print(f"✅ Extracted titles from {extracted - timeouts - read_errors} PDFs ({total} candidates)")
+    print(f"♻️  {already} PDFs already had titles, {resumed} restored from checkpoint, "
+          f"{cached} unchanged PDFs served from the cache")
+    print(f"⚠️  {errors} files missing, {read_errors} could not be read (retried next run)")
+    print(f"⏱️  {timeouts} PDFs timed out")
+    print(f"⏭️  {skipped} PDFs skipped by the hydration budget (rerun to continue)")
+    print(f"☁️  Hydration: {budget.summary()}")
     print()
 
     # Show sample results
@@ -144,6 +377,10 @@ def main():
     print(f"💾 Saved updated tracker with Document_Title column")
     print()
 
+    # The tracker now holds everything the checkpoint did
+    if os.path.exists(CHECKPOINT_PATH):
+        os.remove(CHECKPOINT_PATH)
+
     # Statistics
     has_title = len(tracker_df[tracker_df['Document_Title'] != ''])
     print(f"📊 Documents with titles: {has_title}/{len(tracker_df)}")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Persistent filesystem index for the OneDrive folders
+The mapping and inventory scripts used to walk the same synced OneDrive trees
+from scratch with os.walk/os.listdir/rglob, which is very slow on a
+cloud-backed mount. FsIndex keeps one SQLite store of every entry (path,
+parent, name, size, mtime, extension) under the roots it has seen.
+
+refresh(root) stats each known directory once (concurrently, see
+parallel_walk.py) and only re-lists a directory (with os.scandir) when its
+mtime changed, i.e. when entries were added, removed or renamed in it.
+Everything else is answered from the store.
+A file edited in place does not bump its folder's mtime; use
+refresh(root, full=True) to re-list everything.
+
+With stat_files=False (metadata-only mode) nothing beyond the directory
+entry itself is read: files get no size/mtime, so OneDrive placeholders are
+never touched. Reading file contents belongs in an explicit hydration phase
+(see hydration.py).
+"""
+
+import os
+import sqlite3
+from collections import defaultdict, namedtuple
+
+from parallel_walk import parallel_walk, DEFAULT_WORKERS
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INDEX_PATH = os.path.join(REPO_ROOT, 'data', '.onedrive_index.sqlite')
+
+# Bump when the schema changes; older stores are rebuilt from scratch
+SCHEMA_VERSION = 2
+
+# One directory entry. size/mtime are None for directories and for files
+# listed in metadata-only mode.
+Entry = namedtuple('Entry', ['path', 'parent', 'name', 'is_dir', 'size', 'mtime', 'ext'])
+
+_COLUMNS = 'path, parent, name, is_dir, size, mtime, ext'
+
+
+def _subtree_bounds(path):
+    """Key range holding every path below `path` (children sort between sep and sep+1)."""
+    return path + os.sep, path + chr(ord(os.sep) + 1)
+
+
+def _row_to_entry(row):
+    path, parent, name, is_dir, size, mtime, ext = row
+    return Entry(path, parent, name, bool(is_dir), size, mtime, ext)
+
+
+class FsIndex:
+    """SQLite-backed index of directory listings, refreshed incrementally."""
+
+    def __init__(self, index_path=INDEX_PATH):
+        self.index_path = index_path
+        os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(index_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+    def _create_schema(self):
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS entries')
+            self.conn.execute('DROP TABLE IF EXISTS dirs')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'path TEXT PRIMARY KEY, parent TEXT NOT NULL, name TEXT NOT NULL, '
+            'is_dir INTEGER NOT NULL, size INTEGER, mtime REAL, ext TEXT NOT NULL)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent, name)')
+        # mtime_ns of each listed directory, compared on refresh, and whether
+        # its files were stat()ed when it was listed
+        self.conn.execute('CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, '
+                          'stat_files INTEGER NOT NULL)')
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------ refresh
+
+    def refresh(self, root, full=False, workers=DEFAULT_WORKERS, stat_files=True):
+        """
+        Bring the index for `root` up to date. Returns counts of directories
+        re-listed ('scanned') and served from the store ('reused').
+        Folders are checked on a pool of threads (see parallel_walk.py); all
+        database writes stay on the calling thread.
+        stat_files=False records only what the directory entry provides; a
+        folder listed that way is re-listed when a later refresh wants stats.
+        """
+        root = os.path.abspath(root)
+        counts = {'scanned': 0, 'reused': 0}
+
+        # Snapshot what is already known under root so workers never touch the database
+        low, high = _subtree_bounds(root)
+        known_mtimes = {path: mtime_ns for path, mtime_ns, has_stats in self.conn.execute(
+            'SELECT path, mtime_ns, stat_files FROM dirs WHERE path = ? OR (path >= ? AND path < ?)', (root, low, high))
+            if has_stats or not stat_files}
+        known_children = defaultdict(list)
+        for parent, path in self.conn.execute(
+                'SELECT parent, path FROM entries WHERE is_dir = 1 AND (parent = ? OR (parent >= ? AND parent < ?))',
+                (root, low, high)):
+            known_children[parent].append(path)
+
+        def visit(path, depth):
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                return ('missing', None, None), []
+            if not full and known_mtimes.get(path) == mtime_ns:
+                return ('reused', mtime_ns, None), known_children.get(path, [])
+            rows = self._list_directory(path, stat_files)
+            return ('scanned', mtime_ns, rows), [row[0] for row in rows if row[3]]
+
+        with self.conn:
+            for path, _, (status, mtime_ns, rows), _ in parallel_walk(root, visit, workers=workers):
+                if status == 'missing':
+                    self._forget(path)
+                elif status == 'reused':
+                    counts['reused'] += 1
+                else:
+                    counts['scanned'] += 1
+                    self._store_listing(path, mtime_ns, rows, stat_files)
+        return counts
+
+    def _list_directory(self, path, stat_files=True):
+        """Read one directory listing; returns entry rows (unreadable folders list as empty)."""
+        rows = []
+        try:
+            with os.scandir(path) as listing:
+                for item in listing:
+                    try:
+                        is_dir = item.is_dir()
+                        if is_dir or not stat_files:
+                            size, mtime = None, None
+                        else:
+                            info = item.stat()
+                            size, mtime = info.st_size, info.st_mtime
+                    except OSError:
+                        continue
+                    ext = '' if is_dir else os.path.splitext(item.name)[1].lower()
+                    rows.append((item.path, path, item.name, int(is_dir), size, mtime, ext))
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            pass
+        return rows
+
+    def _store_listing(self, path, mtime_ns, rows, stat_files):
+        """Replace the stored listing of `path`, dropping folders that disappeared."""
+        new_dirs = {row[0] for row in rows if row[3]}
+        old_dirs = {row[0] for row in self.conn.execute(
+            'SELECT path FROM entries WHERE parent = ? AND is_dir = 1', (path,))}
+        for gone in old_dirs - new_dirs:
+            self._forget(gone)
+
+        self.conn.execute('DELETE FROM entries WHERE parent = ?', (path,))
+        self.conn.executemany(f'INSERT OR REPLACE INTO entries ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        self.conn.execute('INSERT OR REPLACE INTO dirs (path, mtime_ns, stat_files) VALUES (?, ?, ?)',
+                          (path, mtime_ns, int(stat_files)))
+
+    def _forget(self, path):
+        """Drop a directory and everything stored below it."""
+        low, high = _subtree_bounds(path)
+        self.conn.execute('DELETE FROM entries WHERE path = ? OR (path >= ? AND path < ?)', (path, low, high))
+        self.conn.execute('DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)', (path, low, high))
+
+    # ------------------------------------------------------------------ queries
+
+    def stat(self, path):
+        """Stored Entry for a path, or None when it is not in the index."""
+        row = self.conn.execute(f'SELECT {_COLUMNS} FROM entries WHERE path = ?',
+                                (os.path.abspath(path),)).fetchone()
+        return _row_to_entry(row) if row else None
+
+    def exists(self, path):
+        """True for indexed entries and for indexed roots (which have no parent entry)."""
+        if self.stat(path) is not None:
+            return True
+        return self.conn.execute('SELECT 1 FROM dirs WHERE path = ?', (os.path.abspath(path),)).fetchone() is not None
+
+    def listdir(self, path):
+        """Entries directly inside a directory, sorted by name."""
+        rows = self.conn.execute(f'SELECT {_COLUMNS} FROM entries WHERE parent = ? ORDER BY name',
+                                 (os.path.abspath(path),))
+        return [_row_to_entry(row) for row in rows]
+
+    def walk(self, root, max_depth=None):
+        """
+        Top-down walk like os.walk, yielding (dirpath, dir_entries, file_entries)
+        in sorted order. Remove items from dir_entries to skip those folders.
+        max_depth matches the scanners: root is depth 0 and folders deeper than
+        max_depth are not listed.
+        """
+        stack = [(os.path.abspath(root), 0)]
+        while stack:
+            path, depth = stack.pop()
+            children = self.listdir(path)
+            dir_entries = [entry for entry in children if entry.is_dir]
+            file_entries = [entry for entry in children if not entry.is_dir]
+            yield path, dir_entries, file_entries
+            if max_depth is None or depth < max_depth:
+                stack.extend((entry.path, depth + 1) for entry in reversed(dir_entries))
+
+    def files(self, root, extensions=None):
+        """All files below root sorted by path, optionally limited to extensions like ['.pdf']."""
+        root = os.path.abspath(root)
+        low, high = _subtree_bounds(root)
+        query = f'SELECT {_COLUMNS} FROM entries WHERE path >= ? AND path < ? AND is_dir = 0'
+        params = [low, high]
+        if extensions:
+            extensions = [ext.lower() for ext in extensions]
+            query += f" AND ext IN ({', '.join('?' * len(extensions))})"
+            params.extend(extensions)
+        return [_row_to_entry(row) for row in self.conn.execute(query + ' ORDER BY path', params)]
+
+
+def open_index(*roots, index_path=INDEX_PATH, stat_files=True, full=False):
+    """
+    Open the shared index and refresh the given roots. Scripts that only need
+    names and paths pass stat_files=False (metadata-only mode); scripts that
+    report sizes or dates pass full=True so files edited in place are re-read.
+    """
+    index = FsIndex(index_path)
+    for root in roots:
+        counts = index.refresh(root, full=full, stat_files=stat_files)
+        print(f"🗂️  Index refreshed for {root}: {counts['scanned']} folders re-listed, "
+              f"{counts['reused']} unchanged")
+    return index
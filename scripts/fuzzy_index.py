@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Trigram index for fuzzy filename matching
+Scoring a name against every filename with difflib.SequenceMatcher is
+D x P ratio() calls. TrigramIndex normalizes each string once and indexes its
+character trigrams; search() shortlists the top_k strings sharing the most
+trigrams with the query (Dice coefficient), and only those get the full
+ratio(), after the cheap real_quick_ratio()/quick_ratio() upper bounds.
+
+Scores are the same SequenceMatcher(None, query, candidate).ratio() as a
+full scan; a string can only be missed when it shares too few trigrams with
+the query to make the shortlist.
+"""
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+# Candidates scored with the full ratio per query
+DEFAULT_TOP_K = 100
+
+
+def trigrams(key):
+    """Set of character trigrams of a normalized string (padded so short strings have some)."""
+    if not key:
+        return set()
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Trigram postings over a list of strings, normalized once."""
+
+    def __init__(self, strings, normalize=None):
+        self.normalize = normalize or (lambda s: s)
+        self.keys = [self.normalize(s) for s in strings]
+        self.sizes = []
+        self.postings = defaultdict(list)
+        self.empty = []  # Strings that normalize to '' (ratio 1.0 against an empty query)
+        for i, key in enumerate(self.keys):
+            grams = trigrams(key)
+            self.sizes.append(len(grams))
+            if not grams:
+                self.empty.append(i)
+            for gram in grams:
+                self.postings[gram].append(i)
+
+    def shortlist(self, key, top_k=DEFAULT_TOP_K):
+        """Positions of the top_k strings by trigram Dice similarity to a normalized key."""
+        grams = trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            for i in self.postings.get(gram, ()):
+                shared[i] += 1
+        ranked = sorted(shared.items(),
+                        key=lambda item: (-2 * item[1] / (len(grams) + self.sizes[item[0]]), item[0]))
+        return [i for i, _ in ranked[:top_k]]
+
+    def search(self, query, threshold, top_k=DEFAULT_TOP_K):
+        """
+        (position, ratio) for shortlisted strings whose ratio against the
+        query is >= threshold, in position order.
+        """
+        key = self.normalize(query)
+        if not key:
+            return [(i, 1.0) for i in self.empty] if threshold <= 1.0 else []
+
+        matcher = SequenceMatcher(None, key)
+        found = []
+        for i in sorted(self.shortlist(key, top_k)):
+            matcher.set_seq2(self.keys[i])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                found.append((i, score))
+        return found
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Budgeted hydration of OneDrive files
+Opening a cloud-only OneDrive placeholder makes the sync client download the
+whole file. The scanners only read directory entries (metadata-only mode,
+see fs_index.py); anything that has to read file contents asks a
+HydrationBudget first. The budget caps the total bytes pulled down in one
+run and paces downloads to a steady rate, so a title-extraction pass cannot
+quietly hydrate the entire project folder.
+
+Files already on disk are not charged. On macOS a cloud-only placeholder
+carries the SF_DATALESS flag; where that flag cannot be read every file is
+treated as needing a download.
+"""
+
+import os
+import time
+
+# Defaults for one run
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3        # 2 GB total
+DEFAULT_BYTES_PER_SECOND = 25 * 1024 ** 2  # ~25 MB/s
+DEFAULT_MAX_FILE_BYTES = 200 * 1024 ** 2   # Skip single files over 200 MB
+
+# st_flags bit set on dataless (cloud-only) files on macOS
+SF_DATALESS = 0x40000000
+
+
+def is_local(path):
+    """True when the file's contents are already on disk (no download needed)."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    flags = getattr(info, 'st_flags', None)
+    if flags is None:
+        return False
+    return not flags & SF_DATALESS
+
+
+class HydrationBudget:
+    """Decides which files may be opened and paces the downloads."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, bytes_per_second=DEFAULT_BYTES_PER_SECOND,
+                 max_file_bytes=DEFAULT_MAX_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes_per_second = bytes_per_second
+        self.max_file_bytes = max_file_bytes
+        self.used = 0
+        self.local = 0
+        self.skipped = {}  # path -> reason
+        self._started = None
+
+    def request(self, path, size=None):
+        """
+        Ask to read `path`. Returns True when it may be opened (sleeping first
+        if downloads are running ahead of the rate limit), False when it is
+        skipped. Pass size when it is already known to avoid another stat().
+        """
+        if is_local(path):
+            self.local += 1
+            return True
+        if size is None:
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                self.skipped[path] = 'missing'
+                return False
+        if self.max_file_bytes is not None and size > self.max_file_bytes:
+            self.skipped[path] = 'file too large'
+            return False
+        if self.max_bytes is not None and self.used + size > self.max_bytes:
+            self.skipped[path] = 'budget exhausted'
+            return False
+
+        if self._started is None:
+            self._started = time.monotonic()
+        self.used += size
+        if self.bytes_per_second:
+            # Keep the average rate since the first download under the limit
+            ahead = self.used / self.bytes_per_second - (time.monotonic() - self._started)
+            if ahead > 0:
+                time.sleep(ahead)
+        return True
+
+    def summary(self):
+        """One-line report for the end of a run."""
+        reasons = {}
+        for reason in self.skipped.values():
+            reasons[reason] = reasons.get(reason, 0) + 1
+        text = f"{self.used / 1024 ** 2:.1f} MB hydrated, {self.local} already local"
+        if reasons:
+            text += ', skipped: ' + ', '.join(f"{count} {reason}" for reason, count in sorted(reasons.items()))
+        return text
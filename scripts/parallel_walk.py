@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Concurrent directory walker for the cloud-backed OneDrive folders
+Each directory listing on the synced mount can take tens to hundreds of
+milliseconds, so listings run on a bounded pool of threads. Every worker
+keeps its own deque of pending directories (newest first, so it walks
+depth-first) and steals the oldest pending directory from another worker
+when it runs dry. Results are yielded as a stream while the walk continues.
+
+parallel_walk(root, visit) is the generic engine: visit(path, depth)
+returns (result, child_dirs). walk_tree() builds an os.walk-like iterator
+on top of it. Both accept max_depth (root is depth 0; folders deeper than
+max_depth are not listed, matching the scanners) and sort=True for a
+deterministic top-down order identical to a sequential sorted walk.
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+
+DEFAULT_WORKERS = 8
+
+# Bound on listed-but-not-consumed results, so a slow consumer applies backpressure
+RESULT_BUFFER = 256
+
+_DONE = object()
+
+
+class _WorkQueues:
+    """Per-worker deques of (path, depth) plus the outstanding-work count."""
+
+    def __init__(self, workers):
+        self.deques = [deque() for _ in range(workers)]
+        self.cond = threading.Condition()
+        self.outstanding = 0
+        self.finished = False
+
+    def take(self, worker):
+        """Own work first (LIFO), then steal the oldest item from another worker. Call with cond held."""
+        own = self.deques[worker]
+        if own:
+            return own.pop()
+        for offset in range(1, len(self.deques)):
+            victim = self.deques[(worker + offset) % len(self.deques)]
+            if victim:
+                return victim.popleft()
+        return None
+
+
+def parallel_walk(root, visit, max_depth=None, workers=DEFAULT_WORKERS, sort=False):
+    """
+    Walk the tree under root calling visit(path, depth) -> (result, child_dirs)
+    on a pool of worker threads. Yields (path, depth, result, child_dirs) as
+    listings complete; child_dirs only holds directories that will be visited.
+    With sort=True results come out in sequential top-down order with
+    children sorted by path.
+    """
+    root = os.path.abspath(root)
+    workers = max(1, workers)
+    work = _WorkQueues(workers)
+    results = queue.Queue(maxsize=RESULT_BUFFER)
+
+    work.deques[0].append((root, 0))
+    work.outstanding = 1
+
+    def run(worker):
+        while True:
+            with work.cond:
+                item = work.take(worker)
+                while item is None and not work.finished:
+                    work.cond.wait()
+                    item = work.take(worker)
+                if item is None:
+                    return
+            path, depth = item
+
+            try:
+                result, child_dirs = visit(path, depth)
+                error = None
+            except Exception as exc:  # Surface in the consumer instead of killing the worker
+                result, child_dirs, error = None, [], exc
+            if max_depth is not None and depth >= max_depth:
+                child_dirs = []
+            child_dirs = list(child_dirs)
+
+            results.put((path, depth, result, child_dirs, error))
+
+            last = False
+            with work.cond:
+                if not work.finished:
+                    for child in child_dirs:
+                        work.deques[worker].append((child, depth + 1))
+                    work.outstanding += len(child_dirs) - 1
+                    if work.outstanding == 0:
+                        work.finished = last = True
+                work.cond.notify_all()
+            if last:
+                results.put(_DONE)
+
+    threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    def stream():
+        while True:
+            item = results.get()
+            if item is _DONE:
+                return
+            path, depth, result, child_dirs, error = item
+            if error is not None:
+                raise error
+            yield path, depth, result, child_dirs
+
+    try:
+        if not sort:
+            yield from stream()
+            return
+
+        # Deterministic mode: buffer out-of-order listings and release them in
+        # sequential depth-first order
+        pending = {}
+        incoming = stream()
+        order = [root]
+        while order:
+            path = order.pop()
+            while path not in pending:
+                item = next(incoming)
+                pending[item[0]] = item
+            item = pending.pop(path)
+            yield item
+            order.extend(sorted(item[3], reverse=True))
+        for _ in incoming:
+            pass
+    finally:
+        # Stop the workers if the consumer exits early
+        with work.cond:
+            work.finished = True
+            work.cond.notify_all()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                results.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+
+def list_entries(path, skip_dir=None):
+    """
+    One directory listing as (dir_entries, file_entries) of os.DirEntry,
+    sorted by name. Unreadable folders list as empty.
+    """
+    dir_entries, file_entries = [], []
+    try:
+        with os.scandir(path) as listing:
+            for item in listing:
+                try:
+                    is_dir = item.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    if skip_dir is None or not skip_dir(item):
+                        dir_entries.append(item)
+                else:
+                    file_entries.append(item)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        pass
+    dir_entries.sort(key=lambda entry: entry.name)
+    file_entries.sort(key=lambda entry: entry.name)
+    return dir_entries, file_entries
+
+
+def walk_tree(root, max_depth=None, workers=DEFAULT_WORKERS, sort=True, skip_dir=None):
+    """
+    os.walk-style iterator yielding (dirpath, dir_entries, file_entries) with
+    os.DirEntry lists. skip_dir(entry) -> True prunes a folder before it is
+    queued (the concurrent walk cannot be pruned from the loop body).
+    """
+    def visit(path, depth):
+        dir_entries, file_entries = list_entries(path, skip_dir)
+        return (dir_entries, file_entries), [entry.path for entry in dir_entries]
+
+    for path, depth, (dir_entries, file_entries), _ in parallel_walk(
+            root, visit, max_depth=max_depth, workers=workers, sort=sort):
+        yield path, dir_entries, file_entries
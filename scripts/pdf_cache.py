@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of PDF titles, page counts and document info
+Parsing a PDF means hydrating it from OneDrive and walking its structure, and
+most files (e.g. the 2019 appendix cover sheets) never change. PdfCache keeps
+what was read from each file in SQLite, keyed on (path, size, mtime), so
+unchanged files are answered without being opened. A changed size or mtime
+makes the entry stale automatically.
+
+With hash_contents=True entries also carry a SHA-256 of the file. A file
+whose mtime changed but whose bytes did not (OneDrive re-syncs do this), or
+one that was moved or renamed, is then still a hit - at the cost of reading
+the file to hash it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(REPO_ROOT, 'data', '.pdf_metadata_cache.sqlite')
+
+# Bump when the stored fields change; older caches are rebuilt from scratch
+SCHEMA_VERSION = 1
+
+HASH_CHUNK = 1024 * 1024
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PdfCache:
+    """(path, size, mtime) -> {'title', 'page_count', 'metadata'} store."""
+
+    def __init__(self, cache_path=CACHE_PATH, hash_contents=False):
+        self.cache_path = cache_path
+        self.hash_contents = hash_contents
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS pdfs')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS pdfs ('
+            'path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, content_hash TEXT, '
+            'title TEXT NOT NULL, page_count INTEGER, metadata TEXT NOT NULL, cached_at REAL NOT NULL)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS pdfs_hash ON pdfs (content_hash)')
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    @staticmethod
+    def _record(row):
+        title, page_count, metadata = row
+        return {'title': title, 'page_count': page_count, 'metadata': json.loads(metadata)}
+
+    def get(self, path, stat=None):
+        """
+        Cached info for an unchanged file, or None (missing, changed or never
+        seen). Pass an os.stat_result when one is already at hand.
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = stat or os.stat(path)
+        except OSError:
+            return None
+
+        row = self.conn.execute('SELECT size, mtime_ns, content_hash, title, page_count, metadata FROM pdfs '
+                                'WHERE path = ?', (path,)).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            self.hits += 1
+            return self._record(row[3:])
+
+        if self.hash_contents:
+            # Same bytes under a new mtime or a new path
+            try:
+                content_hash = file_hash(path)
+            except OSError:
+                self.misses += 1
+                return None
+            match = self.conn.execute('SELECT title, page_count, metadata FROM pdfs WHERE content_hash = ? LIMIT 1',
+                                      (content_hash,)).fetchone()
+            if match:
+                record = self._record(match)
+                self.put(path, record, stat=stat, content_hash=content_hash)
+                self.hits += 1
+                return record
+
+        self.misses += 1
+        return None
+
+    def put(self, path, record, stat=None, content_hash=None):
+        """
+        Store {'title', 'page_count', 'metadata'} for a file as it is now.
+        The content hash is computed here when hash_contents is on and none is given.
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = stat or os.stat(path)
+            if content_hash is None and self.hash_contents:
+                content_hash = file_hash(path)
+        except OSError:
+            return
+        self.conn.execute(
+            'INSERT OR REPLACE INTO pdfs (path, size, mtime_ns, content_hash, title, page_count, metadata, cached_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (path, stat.st_size, stat.st_mtime_ns, content_hash, record.get('title') or '',
+             record.get('page_count'), json.dumps(record.get('metadata') or {}, ensure_ascii=False), time.time())
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+    def summary(self):
+        return f"{self.hits} cached, {self.misses} to parse"
@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+"""
+First-page-only PDF reader
+PyPDF2.PdfReader parses the whole cross-reference table up front and
+flattens the page tree to count pages, so reading the Info dictionary and
+page 1 of a multi-hundred-page as-built volume still walks structures that
+grow with the document. LazyPdf memory-maps the file and touches only:
+  - the trailer (found through startxref) and the xref entries it needs,
+    looked up by arithmetic in classic tables or xref streams
+  - the Info dictionary
+  - the page tree down its first branch (/Count gives the page count)
+  - the first page's fonts and content stream(s)
+so time and memory per file stay flat regardless of document size.
+
+It handles the common cases (classic and compressed xref, object streams,
+FlateDecode/ASCII85Decode/ASCIIHexDecode, simple fonts and ToUnicode CMaps) and raises LazyPdfError for
+anything else (encryption, other filters, Differences encodings, damaged
+files); callers then fall back to PyPDF2.
+"""
+
+import base64
+import mmap
+import re
+import zlib
+from collections import namedtuple
+
+# How far from the end of the file to look for startxref
+TAIL_BYTES = 2048
+
+# Most objects followed when resolving one chain (guards against loops)
+MAX_DEPTH = 64
+
+WHITESPACE = b'\x00\t\n\x0c\r '
+DELIMITERS = b'()<>[]{}/%'
+
+Ref = namedtuple('Ref', ['num', 'gen'])
+Stream = namedtuple('Stream', ['dict', 'data'])
+
+_NUMBER = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+_REF_TAIL = re.compile(rb'\s+(\d+)\s+R(?=[\s/<>\[\]()%]|$)')
+_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f',
+            b'(': b'(', b')': b')', b'\\': b'\\'}
+
+# PDFDocEncoding differs from Latin-1 in these positions
+_PDFDOC = {
+    0x80: '•', 0x81: '†', 0x82: '‡', 0x83: '…', 0x84: '—', 0x85: '–',
+    0x86: 'ƒ', 0x87: '⁄', 0x88: '‹', 0x89: '›', 0x8a: '−', 0x8b: '‰',
+    0x8c: '„', 0x8d: '“', 0x8e: '”', 0x8f: '‘', 0x90: '’', 0x91: '‚',
+    0x92: '™', 0x93: 'ﬁ', 0x94: 'ﬂ', 0x95: 'Ł', 0x96: 'Œ', 0x97: 'Š',
+    0x98: 'Ÿ', 0x99: 'Ž', 0x9a: 'ı', 0x9b: 'ł', 0x9c: 'œ', 0x9d: 'š',
+    0x9e: 'ž', 0xa0: '€',
+}
+
+
+class LazyPdfError(Exception):
+    """The lazy reader cannot handle this file; use the full reader."""
+
+
+class Name(str):
+    """A PDF name (stored without the leading slash)."""
+
+
+class Operator(str):
+    """A bare keyword in a content stream."""
+
+
+def decode_text_string(value):
+    """PDF text string (Info values) to str: UTF-16/UTF-8 with BOM, else PDFDocEncoding."""
+    if isinstance(value, Name):
+        return f'/{value}'
+    if not isinstance(value, bytes):
+        return str(value)
+    if value.startswith(b'\xfe\xff'):
+        return value[2:].decode('utf-16-be', errors='replace')
+    if value.startswith(b'\xef\xbb\xbf'):
+        return value[3:].decode('utf-8', errors='replace')
+    return ''.join(_PDFDOC.get(byte, chr(byte)) for byte in value)
+
+
+# ---------------------------------------------------------------- tokenizer
+
+def _skip_space(buf, pos):
+    end = len(buf)
+    while pos < end:
+        byte = buf[pos]
+        if byte in WHITESPACE:
+            pos += 1
+        elif byte == 0x25:  # % comment
+            while pos < end and buf[pos] not in b'\r\n':
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _read_token(buf, pos):
+    """Bare token (number or keyword) starting at pos."""
+    end = pos
+    while end < len(buf) and buf[end] not in WHITESPACE and buf[end] not in DELIMITERS:
+        end += 1
+    return bytes(buf[pos:end]), end
+
+
+def _literal_string(buf, pos):
+    """Parse (...) starting after the opening paren."""
+    out = bytearray()
+    depth = 1
+    end = len(buf)
+    while pos < end:
+        byte = buf[pos:pos + 1]
+        if byte == b'\\':
+            nxt = buf[pos + 1:pos + 2]
+            if nxt in _ESCAPES:
+                out += _ESCAPES[nxt]
+                pos += 2
+            elif nxt.isdigit():
+                digits = re.match(rb'[0-7]{1,3}', bytes(buf[pos + 1:pos + 4])).group(0)
+                out.append(int(digits, 8) & 0xff)
+                pos += 1 + len(digits)
+            elif nxt == b'\r':
+                pos += 3 if buf[pos + 2:pos + 3] == b'\n' else 2
+            elif nxt == b'\n':
+                pos += 2
+            else:
+                out += nxt
+                pos += 2
+            continue
+        if byte == b'(':
+            depth += 1
+        elif byte == b')':
+            depth -= 1
+            if depth == 0:
+                return bytes(out), pos + 1
+        out += byte
+        pos += 1
+    raise LazyPdfError('Unterminated string')
+
+
+def _hex_string(buf, pos):
+    """Parse <...> starting after the opening bracket."""
+    end = buf.find(b'>', pos)
+    if end == -1:
+        raise LazyPdfError('Unterminated hex string')
+    digits = re.sub(rb'\s', b'', bytes(buf[pos:end]))
+    if len(digits) % 2:
+        digits += b'0'
+    try:
+        return bytes.fromhex(digits.decode('ascii')), end + 1
+    except ValueError:
+        raise LazyPdfError('Bad hex string')
+
+
+def _name(buf, pos):
+    """Parse a name starting after the slash."""
+    token, pos = _read_token(buf, pos)
+    token = re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), token)
+    return Name(token.decode('latin-1')), pos
+
+
+def parse_object(buf, pos, operators=False):
+    """
+    Parse one object at pos; returns (object, next position).
+    References (n g R) come back as Ref. With operators=True unknown
+    keywords are returned as Operator (content streams).
+    """
+    pos = _skip_space(buf, pos)
+    if pos >= len(buf):
+        raise LazyPdfError('Unexpected end of data')
+    byte = buf[pos]
+
+    if byte == 0x2f:  # /
+        return _name(buf, pos + 1)
+    if byte == 0x28:  # (
+        return _literal_string(buf, pos + 1)
+    if byte == 0x3c:  # <
+        if buf[pos + 1:pos + 2] == b'<':
+            result = {}
+            pos += 2
+            while True:
+                pos = _skip_space(buf, pos)
+                if buf[pos:pos + 2] == b'>>':
+                    return result, pos + 2
+                key, pos = parse_object(buf, pos)
+                if not isinstance(key, Name):
+                    raise LazyPdfError('Dictionary key is not a name')
+                result[str(key)], pos = parse_object(buf, pos, operators)
+        return _hex_string(buf, pos + 1)
+    if byte == 0x5b:  # [
+        items = []
+        pos += 1
+        while True:
+            pos = _skip_space(buf, pos)
+            if buf[pos:pos + 1] == b']':
+                return items, pos + 1
+            item, pos = parse_object(buf, pos, operators)
+            items.append(item)
+
+    token, end = _read_token(buf, pos)
+    if not token:
+        raise LazyPdfError(f'Unexpected byte {chr(byte)!r}')
+    if _NUMBER.fullmatch(token):
+        if b'.' in token:
+            return float(token), end
+        number = int(token)
+        # Indirect reference: "num gen R"
+        ref = _REF_TAIL.match(bytes(buf[end:end + 32]))
+        if ref and number >= 0:
+            return Ref(number, int(ref.group(1))), end + ref.end()
+        return number, end
+    if token == b'true':
+        return True, end
+    if token == b'false':
+        return False, end
+    if token == b'null':
+        return None, end
+    if operators:
+        return Operator(token.decode('latin-1')), end
+    raise LazyPdfError(f'Unexpected keyword {token[:20]!r}')
+
+
+# ---------------------------------------------------------------- filters
+
+def _png_unpredict(data, columns, colors=1, bits=8):
+    """Undo PNG row predictors (Predictor >= 10)."""
+    bpp = max(1, colors * bits // 8)
+    row_length = (colors * bits * columns + 7) // 8
+    out = bytearray()
+    previous = bytearray(row_length)
+    for start in range(0, len(data), row_length + 1):
+        kind = data[start]
+        row = bytearray(data[start + 1:start + 1 + row_length])
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xff
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xff
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xff
+            elif kind == 4:
+                upper_left = previous[i - bpp] if i >= bpp else 0
+                estimate = left + up - upper_left
+                pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)
+                predictor = left if pa <= pb and pa <= pc else (up if pb <= pc else upper_left)
+                row[i] = (row[i] + predictor) & 0xff
+            elif kind != 0:
+                raise LazyPdfError(f'Unknown PNG predictor {kind}')
+        out += row
+        previous = row
+    return bytes(out)
+
+
+def _ascii85(data):
+    data = re.sub(rb'\s', b'', data)
+    if data.startswith(b'<~'):
+        data = data[2:]
+    end = data.find(b'~>')
+    return base64.a85decode(data if end == -1 else data[:end])
+
+
+def _ascii_hex(data):
+    data = re.sub(rb'\s', b'', data).split(b'>')[0]
+    if len(data) % 2:
+        data += b'0'
+    return bytes.fromhex(data.decode('ascii'))
+
+
+def decode_stream(stream, resolve):
+    """Decoded stream data for FlateDecode (with predictors), ASCII85Decode and ASCIIHexDecode."""
+    filters = resolve(stream.dict.get('Filter'))
+    params = resolve(stream.dict.get('DecodeParms'))
+    if filters is None:
+        return stream.data
+    if not isinstance(filters, list):
+        filters, params = [filters], [params]
+    elif not isinstance(params, list):
+        params = [params] * len(filters)
+
+    data = stream.data
+    for name, param in zip(filters, params):
+        name = resolve(name)
+        try:
+            if name in ('ASCII85Decode', 'A85'):
+                data = _ascii85(data)
+                continue
+            if name in ('ASCIIHexDecode', 'AHx'):
+                data = _ascii_hex(data)
+                continue
+            if name not in ('FlateDecode', 'Fl'):
+                raise LazyPdfError(f'Unsupported filter {name}')
+            data = zlib.decompressobj().decompress(data)
+        except (ValueError, zlib.error) as exc:
+            raise LazyPdfError(f'Bad {name} data: {exc}')
+        param = resolve(param) or {}
+        predictor = resolve(param.get('Predictor', 1))
+        if predictor >= 10:
+            data = _png_unpredict(data, resolve(param.get('Columns', 1)),
+                                  resolve(param.get('Colors', 1)), resolve(param.get('BitsPerComponent', 8)))
+        elif predictor != 1:
+            raise LazyPdfError(f'Unsupported predictor {predictor}')
+    return data
+
+
+# ---------------------------------------------------------------- document
+
+class LazyPdf:
+    """Memory-mapped PDF that resolves objects on demand."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self.buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise LazyPdfError('Empty file')
+        self._objects = {}
+        self._sections = []  # Newest first: ('table', subsections) or ('stream', widths, subsections, data)
+        try:
+            self.trailer = self._read_xref_chain()
+        except LazyPdfError:
+            self.close()
+            raise
+        except (ValueError, IndexError, KeyError, TypeError) as exc:
+            self.close()
+            raise LazyPdfError(f'Damaged file: {exc}')
+        if 'Encrypt' in self.trailer:
+            self.close()
+            raise LazyPdfError('Encrypted')
+
+    def close(self):
+        if getattr(self, 'buf', None) is not None:
+            self.buf.close()
+            self.buf = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------- xref
+
+    def _read_xref_chain(self):
+        tail_start = max(0, len(self.buf) - TAIL_BYTES)
+        marker = self.buf.rfind(b'startxref', tail_start)
+        if marker == -1:
+            raise LazyPdfError('No startxref')
+        offset, _ = parse_object(self.buf, marker + len(b'startxref'))
+
+        trailer = None
+        seen = set()
+        while isinstance(offset, int) and offset not in seen and len(seen) < MAX_DEPTH:
+            seen.add(offset)
+            section_trailer = self._read_xref_section(offset)
+            if trailer is None:
+                trailer = dict(section_trailer)
+            # Hybrid files keep compressed entries in an extra xref stream
+            if 'XRefStm' in section_trailer:
+                self._read_xref_section(section_trailer['XRefStm'])
+            offset = section_trailer.get('Prev')
+        if trailer is None:
+            raise LazyPdfError('No trailer')
+        return trailer
+
+    def _read_xref_section(self, offset):
+        pos = _skip_space(self.buf, offset)
+        if self.buf[pos:pos + 4] == b'xref':
+            return self._read_xref_table(pos + 4)
+        return self._read_xref_stream(pos)
+
+    def _read_xref_table(self, pos):
+        """Classic table: remember where each subsection's fixed 20-byte entries start."""
+        subsections = []
+        while True:
+            pos = _skip_space(self.buf, pos)
+            if self.buf[pos:pos + 7] == b'trailer':
+                trailer, _ = parse_object(self.buf, pos + 7)
+                break
+            start, pos = parse_object(self.buf, pos)
+            count, pos = parse_object(self.buf, pos)
+            pos = _skip_space(self.buf, pos)
+            if count and self.buf[pos + 17:pos + 20] not in (b'n\r\n', b'f\r\n', b'n \n', b'f \n',
+                                                               b'n \r', b'f \r'):
+                raise LazyPdfError('Irregular xref entries')
+            subsections.append((start, count, pos))
+            pos += 20 * count
+        self._sections.append(('table', subsections))
+        return trailer
+
+    def _read_xref_stream(self, pos):
+        stream = self._parse_indirect(pos)
+        if not isinstance(stream, Stream) or stream.dict.get('Type') != 'XRef':
+            raise LazyPdfError('No xref at startxref')
+        widths = stream.dict['W']
+        index = stream.dict.get('Index', [0, stream.dict['Size']])
+        data = decode_stream(stream, self.resolve)
+        subsections = []
+        row = 0
+        for i in range(0, len(index), 2):
+            subsections.append((index[i], index[i + 1], row))
+            row += index[i + 1]
+        self._sections.append(('stream', widths, subsections, data))
+        return stream.dict
+
+    def _locate(self, num):
+        """('offset', byte offset) or ('compressed', (stream number, index)) or None."""
+        for section in self._sections:
+            if section[0] == 'table':
+                for start, count, pos in section[1]:
+                    if start <= num < start + count:
+                        entry = bytes(self.buf[pos + 20 * (num - start):pos + 20 * (num - start) + 18])
+                        if entry[17:18] == b'f':
+                            return None
+                        return 'offset', int(entry[:10])
+            else:
+                _, widths, subsections, data = section
+                row_size = sum(widths)
+                for start, count, row in subsections:
+                    if start <= num < start + count:
+                        at = (row + num - start) * row_size
+                        fields = []
+                        for width in widths:
+                            fields.append(int.from_bytes(data[at:at + width], 'big') if width else None)
+                            at += width
+                        kind = 1 if fields[0] is None else fields[0]
+                        if kind == 0:
+                            return None
+                        if kind == 1:
+                            return 'offset', fields[1]
+                        if kind == 2:
+                            return 'compressed', (fields[1], fields[2])
+        return None
+
+    # -------------------------------------------------------------- objects
+
+    def _parse_indirect(self, pos):
+        """Parse "num gen obj ..." at pos (stream data included)."""
+        num, pos = parse_object(self.buf, pos)
+        gen, pos = parse_object(self.buf, pos)
+        pos = _skip_space(self.buf, pos)
+        if not isinstance(num, int) or self.buf[pos:pos + 3] != b'obj':
+            raise LazyPdfError('Object header not found')
+        value, pos = parse_object(self.buf, pos + 3)
+        pos = _skip_space(self.buf, pos)
+        if isinstance(value, dict) and self.buf[pos:pos + 6] == b'stream':
+            pos += 6
+            if self.buf[pos:pos + 2] == b'\r\n':
+                pos += 2
+            elif self.buf[pos:pos + 1] in (b'\n', b'\r'):
+                pos += 1
+            length = self.resolve(value.get('Length'))
+            if not isinstance(length, int) or self.buf[pos + length:pos + length + 20].find(b'endstream') == -1:
+                # Wrong /Length: fall back to the endstream marker
+                end = self.buf.find(b'endstream', pos)
+                if end == -1:
+                    raise LazyPdfError('Unterminated stream')
+                length = end - pos
+                while length and self.buf[pos + length - 1] in b'\r\n':
+                    length -= 1
+            value = Stream(value, bytes(self.buf[pos:pos + length]))
+        return value
+
+    def get(self, num):
+        """Resolve object number num."""
+        if num in self._objects:
+            return self._objects[num]
+        location = self._locate(num)
+        if location is None:
+            value = None
+        elif location[0] == 'offset':
+            value = self._parse_indirect(location[1])
+        else:
+            stream_num, index = location[1]
+            container = self.get(stream_num)
+            if not isinstance(container, Stream):
+                raise LazyPdfError('Object stream missing')
+            data = decode_stream(container, self.resolve)
+            header = data[:container.dict['First']].split()
+            offset = int(header[2 * index + 1])
+            value, _ = parse_object(data, container.dict['First'] + offset)
+        self._objects[num] = value
+        return value
+
+    def resolve(self, value, depth=0):
+        """Follow references until a direct object."""
+        while isinstance(value, Ref):
+            depth += 1
+            if depth > MAX_DEPTH:
+                raise LazyPdfError('Reference loop')
+            value = self.get(value.num)
+        return value
+
+    # -------------------------------------------------------------- document info
+
+    def info(self):
+        """Info dictionary as {'/Title': str, ...} (same keys as PyPDF2's metadata)."""
+        info = self.resolve(self.trailer.get('Info'))
+        if not isinstance(info, dict):
+            return {}
+        return {f'/{key}': decode_text_string(self.resolve(value)) for key, value in info.items()}
+
+    def _pages_root(self):
+        root = self.resolve(self.trailer.get('Root'))
+        if not isinstance(root, dict):
+            raise LazyPdfError('No document catalog')
+        return self.resolve(root.get('Pages'))
+
+    def page_count(self):
+        pages = self._pages_root()
+        if not isinstance(pages, dict):
+            return 0
+        return self.resolve(pages.get('Count', 0))
+
+    def first_page(self):
+        """(page dict, inherited Resources) for page 1, following only the first kids."""
+        node = self._pages_root()
+        resources = None
+        for _ in range(MAX_DEPTH):
+            if not isinstance(node, dict):
+                return None, None
+            if 'Resources' in node:
+                resources = self.resolve(node['Resources'])
+            kids = self.resolve(node.get('Kids'))
+            if node.get('Type') == 'Page' or not kids:
+                return (node, resources) if node.get('Type') == 'Page' else (None, None)
+            node = self.resolve(kids[0])
+        raise LazyPdfError('Page tree too deep')
+
+    def first_page_text(self):
+        """Text of page 1, one line per text line."""
+        page, resources = self.first_page()
+        if page is None:
+            return ''
+        contents = self.resolve(page.get('Contents'))
+        if contents is None:
+            return ''
+        streams = contents if isinstance(contents, list) else [contents]
+        data = b'\n'.join(decode_stream(self.resolve(stream), self.resolve) for stream in streams)
+        fonts = self.resolve((resources or {}).get('Font')) or {}
+        return _ContentText(self, fonts).extract(data)
+
+
+# ---------------------------------------------------------------- text
+
+def _parse_cmap(data):
+    """ToUnicode CMap -> ({code bytes: str}, code length)."""
+    mapping = {}
+    code_length = 1
+    for block in re.findall(rb'begincodespacerange(.*?)endcodespacerange', data, re.S):
+        codes = re.findall(rb'<([0-9A-Fa-f]+)>', block)
+        if codes:
+            code_length = max(len(code) for code in codes) // 2
+
+    def unicode_of(hex_digits):
+        return bytes.fromhex(hex_digits.decode('ascii')).decode('utf-16-be', errors='replace')
+
+    for block in re.findall(rb'beginbfchar(.*?)endbfchar', data, re.S):
+        for src, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>', block):
+            mapping[bytes.fromhex(src.decode('ascii'))] = unicode_of(dst)
+    for block in re.findall(rb'beginbfrange(.*?)endbfrange', data, re.S):
+        for src_lo, src_hi, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[[^\]]*\])',
+                                              block):
+            lo, hi = int(src_lo, 16), int(src_hi, 16)
+            width = len(src_lo) // 2
+            if dst.startswith(b'['):
+                targets = re.findall(rb'<([0-9A-Fa-f]*)>', dst)
+                for offset, target in enumerate(targets[:hi - lo + 1]):
+                    mapping[(lo + offset).to_bytes(width, 'big')] = unicode_of(target)
+            else:
+                base = bytes.fromhex(dst[1:-1].decode('ascii'))
+                for offset in range(min(hi - lo + 1, 0x10000)):
+                    target = base[:-2] + (int.from_bytes(base[-2:], 'big') + offset).to_bytes(2, 'big') \
+                        if len(base) >= 2 else base
+                    mapping[(lo + offset).to_bytes(width, 'big')] = target.decode('utf-16-be', errors='replace')
+    return mapping, code_length
+
+
+class _Font:
+    """Decodes string operands for one font."""
+
+    def __init__(self, pdf, font):
+        font = pdf.resolve(font) or {}
+        self.cmap = None
+        self.code_length = 1
+        to_unicode = pdf.resolve(font.get('ToUnicode'))
+        if isinstance(to_unicode, Stream):
+            self.cmap, self.code_length = _parse_cmap(decode_stream(to_unicode, pdf.resolve))
+        elif font.get('Subtype') == 'Type0':
+            raise LazyPdfError('Composite font without ToUnicode')
+        else:
+            encoding = pdf.resolve(font.get('Encoding'))
+            if isinstance(encoding, dict) or encoding not in (None, 'WinAnsiEncoding', 'StandardEncoding'):
+                raise LazyPdfError(f'Unsupported font encoding {encoding}')
+
+    def decode(self, raw):
+        if self.cmap is None:
+            return raw.decode('cp1252', errors='replace')
+        out = []
+        step = self.code_length
+        for i in range(0, len(raw), step):
+            out.append(self.cmap.get(raw[i:i + step], ''))
+        return ''.join(out)
+
+
+class _ContentText:
+    """Minimal text extraction from a content stream: Tj/TJ/'/" with line breaks on vertical moves."""
+
+    def __init__(self, pdf, fonts):
+        self.pdf = pdf
+        self.fonts = fonts
+        self._decoders = {}
+
+    def _font(self, name):
+        if name not in self._decoders:
+            self._decoders[name] = _Font(self.pdf, self.fonts.get(name))
+        return self._decoders[name]
+
+    def extract(self, data):
+        out = []
+        operands = []
+        font = None
+        line_y = None
+        pos = 0
+        end = len(data)
+        while True:
+            pos = _skip_space(data, pos)
+            if pos >= end:
+                break
+            value, pos = parse_object(data, pos, operators=True)
+            if not isinstance(value, Operator):
+                operands.append(value)
+                continue
+
+            op = str(value)
+            if op == 'Tf' and operands:
+                font = self._font(str(operands[0]))
+            elif op in ('Td', 'TD') and len(operands) >= 2 and operands[1]:
+                out.append('\n')
+            elif op == 'Tm' and len(operands) >= 6:
+                if line_y is not None and operands[5] != line_y:
+                    out.append('\n')
+                line_y = operands[5]
+            elif op == 'T*':
+                out.append('\n')
+            elif op in ('Tj', "'", '"') and operands:
+                if op != 'Tj':
+                    out.append('\n')
+                if isinstance(operands[-1], bytes):
+                    out.append(self._decode(font, operands[-1]))
+            elif op == 'TJ' and operands and isinstance(operands[-1], list):
+                for item in operands[-1]:
+                    if isinstance(item, bytes):
+                        out.append(self._decode(font, item))
+                    elif isinstance(item, (int, float)) and item <= -250:
+                        out.append(' ')
+            elif op == 'ET':
+                out.append('\n')
+            elif op == 'BI':
+                # Inline image: skip binary data up to EI
+                marker = re.compile(rb'\sEI(?=[\s]|$)')
+                match = marker.search(data, pos)
+                pos = match.end() if match else end
+            operands = []
+        return ''.join(out)
+
+    def _decode(self, font, raw):
+        if font is None:
+            raise LazyPdfError('Text shown without a font')
+        return font.decode(raw)
@@ -6,9 +6,10 @@ Maps documents in documents_tracker.csv to OneDrive files with better accuracy.
 
 import csv
 import os
-import re
 from difflib import SequenceMatcher
 
+from appendix_catalog import load_catalog, extract_volume_number
+
 # Paths
 ONEDRIVE_BASE = "/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation"
 APPENDICES_DIR = os.path.join(ONEDRIVE_BASE, "TheBRIDGE - Montlake - Contract Documents/Appendices")
@@ -16,29 +17,10 @@ CSV_PATH = "data/documents_tracker.csv"
 OUTPUT_CSV = "data/documents_tracker_REMAPPED.csv"
 REPORT_TXT = "data/remapping_report.txt"
 
-# Load complete APPENDIX_DATA dictionary from the original mapping script
+# Load the appendix catalog (data/onedrive_mapping/appendix_catalog.json)
 print("📚 Loading appendix mapping data...")
-with open('data/onedrive_mapping/scripts/complete_appendix_mapping_ALL.py', 'r') as f:
-    content = f.read()
-    # Extract the APPENDIX_DATA dictionary definition
-    start = content.find('APPENDIX_DATA = {')
-    end = content.find('\n}', start) + 2
-    appendix_code = content[start:end]
-    # Execute it to create the APPENDIX_DATA variable
-    exec(appendix_code)
-    print(f"✅ Loaded {len(APPENDIX_DATA)} appendix mappings\n")
-
-def similarity_ratio(a, b):
-    """Calculate similarity ratio between two strings."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
-
-def extract_volume_number(doc_name):
-    """Extract volume number from document names like 'Volume 01' or 'As-Built Plans Volume 14a'."""
-    # Match patterns like "Volume 01", "Volume 14a", etc.
-    match = re.search(r'[Vv]olume\s+(\d+[a-z]?)', doc_name)
-    if match:
-        return match.group(1).lower()  # Return '01', '14a', etc.
-    return None
+APPENDIX_CATALOG = load_catalog()
+print(f"✅ Loaded {len(APPENDIX_CATALOG)} appendix mappings\n")
 
 def match_document_to_appendix_improved(doc_name, full_name, category):
     """
@@ -59,24 +41,22 @@ def match_document_to_appendix_improved(doc_name, full_name, category):
     if not search_terms:
         return None, 0, "No search terms"
 
+    # Only this category's catalog entries are considered
+    entries = APPENDIX_CATALOG.entries(category)
+
     # Strategy 1: Exact match
     for search_term in search_terms:
-        for (app_category, app_id), app_doc_name in APPENDIX_DATA.items():
-            if app_category != category:
-                continue
-            if search_term.lower().strip() == app_doc_name.lower().strip():
-                return app_id, 100, f"Exact match: '{search_term}' == '{app_doc_name}'"
+        entry = APPENDIX_CATALOG.exact(category, search_term)
+        if entry:
+            return entry.id, 100, f"Exact match: '{search_term}' == '{entry.name}'"
 
     # Strategy 2: Volume number matching for As-Built plans
     if 'as-built' in doc_name.lower() or 'volume' in doc_name.lower():
         vol_num = extract_volume_number(doc_name)
         if vol_num:
-            for (app_category, app_id), app_doc_name in APPENDIX_DATA.items():
-                if app_category != category:
-                    continue
-                app_vol_num = extract_volume_number(app_doc_name)
-                if app_vol_num == vol_num:
-                    return app_id, 95, f"Volume match: {vol_num}"
+            entry = APPENDIX_CATALOG.volume(category, vol_num)
+            if entry:
+                return entry.id, 95, f"Volume match: {vol_num}"
 
     # Strategy 3: High-threshold fuzzy matching
     best_match = None
@@ -84,19 +64,23 @@ def match_document_to_appendix_improved(doc_name, full_name, category):
     best_reason = ""
 
     for search_term in search_terms:
-        for (app_category, app_id), app_doc_name in APPENDIX_DATA.items():
-            if app_category != category:
+        matcher = SequenceMatcher(None, search_term.lower())
+        for entry in entries:
+            matcher.set_seq2(entry.name_lower)
+
+            # Skip entries whose similarity upper bound cannot beat the best so far
+            if int(matcher.real_quick_ratio() * 100) < max(best_score + 1, 70):
                 continue
 
             # Calculate similarity
-            ratio = similarity_ratio(search_term, app_doc_name)
+            ratio = matcher.ratio()
             score = int(ratio * 100)
 
             # Only consider matches with 70%+ similarity
             if score > best_score and score >= 70:
                 best_score = score
-                best_match = app_id
-                best_reason = f"Fuzzy match ({score}%): '{search_term}' ≈ '{app_doc_name}'"
+                best_match = entry.id
+                best_reason = f"Fuzzy match ({score}%): '{search_term}' ≈ '{entry.name}'"
 
     return best_match, best_score, best_reason
 
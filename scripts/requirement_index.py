@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Requirement matching index for match_requirements.py
+Comparing every tracker row with every requirement does the same substring
+and word-overlap work over and over. RequirementIndex is built once from the
+requirement rows:
+  - by_number: document_number -> requirement (first row wins)
+  - a token -> requirements inverted index over the cleaned document names
+  - requirements grouped by cleaned category, for category blocking
+best_match() then scores only the candidate requirements that can reach the
+minimum score, with the same heuristic (and the same tie-breaking) as the
+original pairwise loop:
+    +3  categories contain one another
+    +10 names equal, else +5 one name contains the other,
+        else +0.5 per shared word when more than one word is shared
+"""
+
+from bisect import bisect_right
+from collections import Counter, defaultdict
+
+# Minimum score for a general match
+MIN_SCORE = 3
+
+# Shared words needed to reach MIN_SCORE on word overlap alone
+MIN_OVERLAP = 6
+
+# Separator for the concatenated name text; cleaned names never contain it
+_SEPARATOR = '\n'
+
+
+def _inner_tokens(tokens):
+    """
+    Tokens of a name other than its first and last. If the name is a substring
+    of another, these appear as whole words in the other name.
+    """
+    return set(tokens[1:-1])
+
+
+class RequirementIndex:
+    """Precomputed lookups over requirement rows (dicts with cleaned name/category)."""
+
+    def __init__(self, requirements, name_key='clean_doc_name', category_key='clean_category',
+                 number_key='document_number', general=None):
+        """
+        requirements: list of requirement dicts in file order.
+        general(requirement) -> True for rows eligible for general matching.
+        """
+        self.requirements = requirements
+        self.by_number = {}
+        for req in requirements:
+            self.by_number.setdefault(req[number_key], req)
+
+        # Positions eligible for general matching, in file order
+        self.positions = [i for i, req in enumerate(requirements) if general is None or general(req)]
+        self.names = {i: requirements[i][name_key] or '' for i in self.positions}
+        self.tokens = {i: self.names[i].split() for i in self.positions}
+
+        # token -> positions
+        self.postings = defaultdict(list)
+        for i in self.positions:
+            for token in set(self.tokens[i]):
+                self.postings[token].append(i)
+
+        # All names in one string for "tracker name inside requirement name" lookups
+        self._text_starts = []
+        pieces = []
+        offset = 0
+        for i in self.positions:
+            self._text_starts.append(offset)
+            pieces.append(self.names[i])
+            offset += len(self.names[i]) + len(_SEPARATOR)
+        self._text = _SEPARATOR.join(pieces)
+
+        # Names with no inner token cannot be found through the inverted index
+        self._short_names = [i for i in self.positions if self.names[i] and len(self.tokens[i]) <= 2]
+
+        # Category blocking: positions grouped by cleaned category
+        self._by_category = defaultdict(list)
+        for i in self.positions:
+            category = requirements[i][category_key] or ''
+            if category:
+                self._by_category[category].append(i)
+        self._blocks = {}
+
+    def lookup(self, number):
+        """Requirement with this document number, or None."""
+        return self.by_number.get(number)
+
+    def category_block(self, category):
+        """Positions whose category contains, or is contained in, `category`."""
+        if not category:
+            return set()
+        block = self._blocks.get(category)
+        if block is None:
+            block = set()
+            for req_category, positions in self._by_category.items():
+                if category in req_category or req_category in category:
+                    block.update(positions)
+            self._blocks[category] = block
+        return block
+
+    def _names_containing(self, name, tokens, shared):
+        """Positions whose name contains `name`."""
+        inner = _inner_tokens(tokens)
+        if inner:
+            return {i for i, count in shared.items() if count >= len(inner) and name in self.names[i]}
+        found = set()
+        start = self._text.find(name)
+        while start != -1:
+            found.add(self.positions[bisect_right(self._text_starts, start) - 1])
+            start = self._text.find(name, start + 1)
+        return found
+
+    def _names_within(self, name, shared):
+        """Positions whose (non-empty) name is contained in `name`."""
+        found = {i for i in self._short_names if self.names[i] in name}
+        for i, count in shared.items():
+            if len(self.tokens[i]) > 2 and count >= len(_inner_tokens(self.tokens[i])) and self.names[i] in name:
+                found.add(i)
+        return found
+
+    def best_match(self, name, category):
+        """
+        Best requirement for a cleaned tracker name/category as
+        (requirement, score), or (None, 0) when nothing reaches MIN_SCORE.
+        The earliest requirement wins ties.
+        """
+        block = self.category_block(category)
+        tokens = name.split() if name else []
+        shared = Counter()
+        for token in set(tokens):
+            for i in self.postings.get(token, ()):
+                shared[i] += 1
+
+        related = set()
+        if name:
+            related = self._names_containing(name, tokens, shared) | self._names_within(name, shared)
+        candidates = block | related | {i for i, count in shared.items() if count >= MIN_OVERLAP}
+
+        best, best_score = None, 0
+        for i in sorted(candidates):
+            score = 0
+            if i in block:
+                score += 3
+            if name and self.names[i]:
+                if name == self.names[i]:
+                    score += 10
+                elif i in related:
+                    score += 5
+                elif shared[i] > 1:
+                    score += shared[i] * 0.5
+            if score > best_score and score >= MIN_SCORE:
+                best, best_score = i, score
+        if best is None:
+            return None, 0
+        return self.requirements[best], best_score
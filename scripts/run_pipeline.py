@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Dashboard update pipeline
+Runs the steps update_dashboard.sh used to run one after another (Google
+Sheets sync, closeout dashboard, documents dashboard) as stages that declare
+their inputs and outputs:
+  - a stage starts as soon as the stages producing its inputs are done, so
+    the closeout dashboard builds while the sheet is still downloading
+  - a stage whose input and template hashes match the ones recorded in the
+    build manifest for its artifacts, and whose artifacts (the page and the
+    asset files it loads) are still the files it wrote, is skipped
+  - each stage's wall time is reported at the end
+The end artifacts are unchanged: index.html, contractdocs.html (with their
+assets/ files) and data/documents_tracker.csv. When the requirements CSV
+is available the matching script and the coverage report run as well.
+
+With IN_PROCESS every stage is a function call in this one interpreter
+instead of a separate `python3 script.py`: each generator module is
+imported the first time one of its stages actually runs (skipped stages
+never load pandas or plotly), and frames parsed by one stage are reused by
+the next (see closeout_data.py and shared_frames.py).
+
+The manifest (data/.build_manifest.json) records, per artifact, the stage
+that built it, the hashes of its inputs and templates and of the artifact
+itself. A run that rewrites nothing reports so, and update_dashboard.sh
+then skips the commit and push.
+
+Run from the repo root: python3 scripts/run_pipeline.py
+"""
+
+import glob
+import hashlib
+import importlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+MANIFEST_PATH = os.path.join(REPO_ROOT, 'data', '.build_manifest.json')
+
+# Bump when the manifest changes shape; an older manifest just reruns everything
+MANIFEST_VERSION = 2
+
+# Stages run at the same time
+MAX_PARALLEL_STAGES = 3
+
+# Call each stage's function in this process instead of running its script
+IN_PROCESS = True
+
+# script: run with this interpreter from the repo root (when not IN_PROCESS)
+# function: 'module:function' in scripts/ doing the same work (when IN_PROCESS)
+# inputs/outputs: repo-relative files or directories (directories hash every file in them);
+#   outputs may also be glob patterns for content-hashed assets (all matches are hashed)
+# templates: template files/directories the stage renders, hashed like inputs
+# publish: (source, destination) copies made after the script succeeds
+# always: run even when the inputs are unchanged (remote sources)
+# optional: a missing input file means the stage is left out instead of failing
+Stage = namedtuple('Stage', ['name', 'script', 'function', 'inputs', 'outputs', 'templates', 'publish', 'always',
+                             'optional'],
+                   defaults=([], [], False, False))
+
+# Closeout requirements list exported from the "Montlake Docs" sheet (not in the repo)
+REQUIREMENTS_CSV = '/Users/z/Downloads/Montlake Docs - Sheet1 (2).csv'
+
+DASHBOARD_HELPERS = [
+    'scripts/status_rules.py',
+    'scripts/data_assets.py',
+    'scripts/template_engine.py',
+    'scripts/build_stamp.py',
+]
+
+STAGES = [
+    Stage(
+        name='sync_from_sheets',
+        script='scripts/sync_from_sheets.py',
+        function='sync_from_sheets:sync_from_sheets',
+        inputs=['scripts/sync_from_sheets.py'],
+        outputs=['data/documents_tracker.csv'],
+        always=True,  # Remote source: a conditional request tells us whether it changed
+    ),
+    Stage(
+        name='closeout_dashboard',
+        script='scripts/closeout_dashboard_v3.py',
+        function='closeout_dashboard_v3:build_closeout_dashboard',
+        inputs=['data/current_closeout.csv',
+                'scripts/closeout_dashboard_v3.py',
+                'scripts/closeout_data.py',
+                'scripts/status_cube.py',
+                'scripts/columnar_payload.py',
+                'scripts/chart_payload.py'] + DASHBOARD_HELPERS,
+        # The page is only usable with the assets it fetches
+        outputs=['index.html',
+                 'assets/data/closeout-requirements.*',
+                 'assets/js/plotly-*',
+                 'assets/generated_at/closeout.json'],
+        templates=['templates/closeout.html', 'templates/partials'],
+        # The generator writes to the Desktop; index.html is the GitHub Pages homepage
+        publish=[('/Users/z/Desktop/montlake_closeout.html', 'index.html')],
+    ),
+    Stage(
+        name='documents_dashboard',
+        script='scripts/generate_documents_dashboard.py',
+        function='generate_documents_dashboard:build_documents_dashboard',
+        inputs=['data/documents_tracker.csv',
+                'scripts/generate_documents_dashboard.py'] + DASHBOARD_HELPERS,
+        outputs=['contractdocs.html',
+                 'assets/data/contractdocs-*',
+                 'assets/generated_at/contractdocs.json'],
+        templates=['templates/contractdocs.html', 'templates/contractdocs_section.html', 'templates/partials'],
+    ),
+    Stage(
+        name='match_requirements',
+        script='scripts/match_requirements.py',
+        function='match_requirements:match_requirements',
+        inputs=[REQUIREMENTS_CSV,
+                'data/contract_documents_complete_tracker.csv',
+                'scripts/match_requirements.py',
+                'scripts/requirement_index.py',
+                'scripts/shared_frames.py'],
+        outputs=['reports/matched_requirements.csv'],
+        optional=True,
+    ),
+    Stage(
+        name='requirements_report',
+        script='scripts/generate_requirements_report.py',
+        function='generate_requirements_report:generate_requirements_report',
+        inputs=[REQUIREMENTS_CSV,
+                'data/contract_documents_complete_tracker.csv',
+                'scripts/generate_requirements_report.py',
+                'scripts/shared_frames.py'],
+        outputs=['reports/closeout_requirements_coverage.csv',
+                 'reports/missing_closeout_requirements.csv'],
+        optional=True,
+    ),
+]
+
+HASH_CHUNK = 1024 * 1024
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_pattern(path):
+    return any(char in path for char in '*?[')
+
+
+def path_hash(path):
+    """
+    SHA-256 of a repo-relative file, of every file under a directory or of
+    every file matching a glob pattern (names and contents, in sorted
+    order). None when a file or directory is missing; a pattern matching
+    nothing hashes like an empty directory.
+    """
+    full_path = os.path.join(REPO_ROOT, path)
+    if _is_pattern(path):
+        digest = hashlib.sha256()
+        for file_path in sorted(glob.glob(full_path)):
+            if os.path.isfile(file_path):
+                digest.update(os.path.relpath(file_path, REPO_ROOT).encode('utf-8') + b'\0')
+                digest.update(_file_digest(file_path).encode('ascii'))
+        return digest.hexdigest()
+    if os.path.isfile(full_path):
+        return _file_digest(full_path)
+    if not os.path.isdir(full_path):
+        return None
+
+    digest = hashlib.sha256()
+    for folder, dirs, files in os.walk(full_path):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for name in sorted(files):
+            file_path = os.path.join(folder, name)
+            digest.update(os.path.relpath(file_path, full_path).encode('utf-8') + b'\0')
+            digest.update(_file_digest(file_path).encode('ascii'))
+    return digest.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """artifact path -> {'stage', 'inputs', 'templates', 'sha256'} from the last successful builds."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('artifacts', {})
+
+
+def save_manifest(artifacts, path=MANIFEST_PATH):
+    # Write then rename so an interrupted run never leaves a half-written manifest
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'artifacts': artifacts}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def stage_dependencies(stages):
+    """stage name -> names of the stages that produce one of its inputs."""
+    producers = {}
+    for stage in stages:
+        for output in stage.outputs:
+            producers[output] = stage.name
+    return {
+        stage.name: {producers[path] for path in stage.inputs if path in producers and producers[path] != stage.name}
+        for stage in stages
+    }
+
+
+def is_up_to_date(stage, input_hashes, template_hashes, artifacts):
+    """
+    True when every artifact of the stage was built from these input and
+    template hashes and is still the file that build wrote.
+    """
+    if stage.always:
+        return False
+    for path in stage.outputs:
+        entry = artifacts.get(path)
+        if not entry or entry.get('inputs') != input_hashes or entry.get('templates') != template_hashes:
+            return False
+        current = path_hash(path)
+        if current is None or current != entry.get('sha256'):
+            return False
+    return True
+
+
+class _StageOutput:
+    """
+    sys.stdout/sys.stderr stand-in for in-process stages: writes from a
+    thread running a stage go to that stage's buffer, everything else to the
+    real stream.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self.stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    @classmethod
+    def capture(cls, function):
+        """Call function() with this thread's output collected. Returns (ok, output text, return value)."""
+        cls._local.buffer = io.StringIO()
+        value = None
+        try:
+            value = function()
+            ok = True
+        except (Exception, SystemExit):
+            traceback.print_exc()
+            ok = False
+        finally:
+            output = cls._local.buffer.getvalue()
+            cls._local.buffer = None
+        return ok, output, value
+
+
+def call_stage_function(spec):
+    """Import 'module:function' from scripts/ (on first use), call it and return its result."""
+    module_name, function_name = spec.split(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)()
+
+
+def run_stage(stage, in_process=IN_PROCESS):
+    """
+    Run the stage (function call or script) and publish its outputs.
+    Returns (ok, output text, unchanged): a stage function returning False
+    reports that its source had nothing new (e.g. the sheet sync).
+    """
+    unchanged = False
+    if in_process and stage.function:
+        ok, output, value = _StageOutput.capture(lambda: call_stage_function(stage.function))
+        if not ok:
+            return False, output, False
+        unchanged = value is False
+    else:
+        result = subprocess.run(
+            [sys.executable, stage.script],
+            cwd=REPO_ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        output = result.stdout
+        if result.returncode != 0:
+            return False, f"{output.rstrip()}\n(exit code {result.returncode})".lstrip(), False
+
+    for source, destination in stage.publish:
+        try:
+            shutil.copyfile(source, os.path.join(REPO_ROOT, destination))
+        except OSError as e:
+            return False, output + f"\nCould not copy {source} to {destination}: {e}", False
+    return True, output, unchanged
+
+
+def print_stage_output(name, output):
+    for line in output.rstrip().splitlines():
+        print(f"   [{name}] {line}")
+
+
+def run_pipeline(stages=STAGES, manifest_path=MANIFEST_PATH, max_parallel=MAX_PARALLEL_STAGES, in_process=IN_PROCESS):
+    """
+    Run the stages in dependency order, in parallel where possible.
+    Returns ({stage name: (status, seconds)}, [artifacts whose contents
+    changed]) with status 'ran', 'unchanged' (ran, found nothing new),
+    'skipped', 'failed', 'blocked' (an upstream
+    stage failed) or 'missing' (an optional stage without its input files).
+    """
+    if not in_process:
+        return _run_stages(stages, manifest_path, max_parallel, in_process)
+
+    # Stage functions use repo-relative paths and import their siblings from scripts/
+    os.chdir(REPO_ROOT)
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _StageOutput(real_stdout), _StageOutput(real_stderr)
+    try:
+        return _run_stages(stages, manifest_path, max_parallel, in_process)
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+
+
+def _run_stages(stages, manifest_path, max_parallel, in_process):
+    artifacts = load_manifest(manifest_path)
+    dependencies = stage_dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    pending = [stage.name for stage in stages]
+    results = {}
+    changed = []
+    running = {}  # future -> (stage name, start time)
+
+    def execute(stage):
+        input_hashes = {path: path_hash(path) for path in stage.inputs}
+        template_hashes = {path: path_hash(path) for path in stage.templates}
+        if stage.optional and None in input_hashes.values():
+            return 'missing', (input_hashes, template_hashes, {}), ''
+        if is_up_to_date(stage, input_hashes, template_hashes, artifacts):
+            return 'skipped', (input_hashes, template_hashes, {}), ''
+        # Artifacts as they were before the run, to report which ones really changed
+        hashes = (input_hashes, template_hashes, {path: path_hash(path) for path in stage.outputs})
+        ok, output, unchanged = run_stage(stage, in_process)
+        if not ok:
+            return 'failed', hashes, output
+        return ('unchanged' if unchanged else 'ran'), hashes, output
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while pending or running:
+            # Start every stage whose upstream stages are all finished
+            for name in list(pending):
+                upstream = dependencies[name]
+                if any(results.get(dep, ('',))[0] == 'missing' for dep in upstream):
+                    results[name] = ('missing', 0.0)
+                    pending.remove(name)
+                    print(f"⏭️  {name}: not run (upstream stage had no input)")
+                elif any(results.get(dep, ('',))[0] in ('failed', 'blocked') for dep in upstream):
+                    results[name] = ('blocked', 0.0)
+                    pending.remove(name)
+                    print(f"⏭️  {name}: not run (upstream stage failed)")
+                elif all(dep in results for dep in upstream):
+                    pending.remove(name)
+                    print(f"▶️  {name}")
+                    future = executor.submit(execute, by_name[name])
+                    running[future] = (name, time.perf_counter())
+
+            if not running:
+                if pending:
+                    raise ValueError(f"Stages depend on each other in a cycle: {', '.join(pending)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, started = running.pop(future)
+                status, (input_hashes, template_hashes, before), output = future.result()
+                elapsed = time.perf_counter() - started
+                results[name] = (status, elapsed)
+
+                if status == 'skipped':
+                    print(f"⏩ {name}: inputs unchanged, skipped")
+                    continue
+                if status == 'missing':
+                    missing = [path for path, digest in input_hashes.items() if digest is None]
+                    print(f"⏭️  {name}: not run (missing {', '.join(missing)})")
+                    continue
+                print_stage_output(name, output)
+                if status in ('ran', 'unchanged'):
+                    print(f"✅ {name}{': no changes' if status == 'unchanged' else ''} ({elapsed:.1f}s)")
+                    for path in by_name[name].outputs:
+                        digest = path_hash(path)
+                        if digest != before.get(path):
+                            changed.append(path)
+                        artifacts[path] = {
+                            'stage': name,
+                            'inputs': input_hashes,
+                            'templates': template_hashes,
+                            'sha256': digest,
+                        }
+                    save_manifest(artifacts, manifest_path)
+                else:
+                    print(f"❌ {name} failed ({elapsed:.1f}s)")
+                    # Forget the last good build so a fixed stage is never skipped
+                    for path in by_name[name].outputs:
+                        artifacts.pop(path, None)
+                    save_manifest(artifacts, manifest_path)
+
+    return results, changed
+
+
+def print_timings(results, total):
+    print()
+    print("⏱️  Stage timings:")
+    width = max(len(name) for name in list(results) + ['total wall time'])
+    for name, (status, seconds) in results.items():
+        print(f"   {name:<{width}}  {status:<8} {seconds:6.1f}s")
+    print(f"   {'total wall time':<{width}}  {'':<8} {total:6.1f}s")
+
+
+def main():
+    print("🚦 Running dashboard pipeline...")
+    print()
+    started = time.perf_counter()
+    results, changed = run_pipeline()
+    print_timings(results, time.perf_counter() - started)
+
+    print()
+    if changed:
+        print(f"📦 Changed: {', '.join(changed)}")
+    else:
+        print("📭 No artifacts changed")
+
+    failed = [name for name, (status, _) in results.items() if status in ('failed', 'blocked')]
+    if failed:
+        print()
+        print(f"❌ Pipeline failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
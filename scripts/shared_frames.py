@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+In-process cache of parsed CSV frames
+When several stages run in one process (see run_pipeline.py), the matching
+script and the coverage report both read the tracker and the requirements
+CSV. read_csv() parses each file once per (path, size, mtime, read options)
+and hands every caller its own copy, so one stage adding columns never
+leaks into the next.
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+_frames = {}  # (path, size, mtime_ns, options) -> DataFrame
+_lock = threading.Lock()  # Stages may run on pipeline threads
+
+
+def read_csv(path, **kwargs):
+    """pd.read_csv(path, **kwargs), parsed once while the file is unchanged."""
+    full_path = os.path.abspath(path)
+    stat = os.stat(full_path)
+    key = (full_path, stat.st_size, stat.st_mtime_ns, tuple(sorted(kwargs.items())))
+    with _lock:
+        frame = _frames.get(key)
+        if frame is None:
+            # Drop frames of older versions of the same file
+            for stale in [k for k in _frames if k[0] == full_path]:
+                del _frames[stale]
+            frame = pd.read_csv(full_path, **kwargs)
+            _frames[key] = frame
+        return frame.copy()
+
+
+def clear():
+    """Forget every cached frame."""
+    with _lock:
+        _frames.clear()
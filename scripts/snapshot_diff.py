@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Row-level diff between two snapshots of the tracker or the closeout CSV
+Rows are matched on a key (Doc_Number for data/documents_tracker.csv,
+Req ID for data/current_closeout.csv) and compared column by column in one
+vectorized pass, giving one record per added row, per removed row and per
+changed field:
+
+    <key>, Occurrence, Change (added/removed/changed), Field, Old, New, Label
+
+Rows identical in both snapshots are set aside first (one hash per row),
+so only rows that differ are compared field by field. Duplicate keys then
+pair up in file order (Occurrence 1, 2, ...); rows with a blank key
+(section headings in the closeout sheet) are left out.
+Cells are compared as text, so '007' vs '7' or a blank vs 'nan' is a change
+exactly when the sheet text changed.
+
+Run from the repo root to compare each CSV with its last committed version
+(what the dashboards were last published from): prints a summary, writes
+reports/changes/<name>_changes.csv and a one-line reports/changes/summary.txt
+that update_dashboard.sh uses in its default commit message.
+"""
+
+import os
+import subprocess
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+# name -> (CSV path, key column, label column shown with each record)
+DATASETS = {
+    'documents': ('data/documents_tracker.csv', 'Doc_Number', 'Document_Name'),
+    'closeout': ('data/current_closeout.csv', 'Req ID', 'Simple Description'),
+}
+
+CHANGES_DIR = 'reports/changes'
+
+# Records printed per dataset
+PREVIEW_ROWS = 10
+
+RECORD_COLUMNS = ['Occurrence', 'Change', 'Field', 'Old', 'New', 'Label']
+
+
+def read_snapshot(source):
+    """A CSV path or its bytes as an all-text frame (blanks stay '', nothing becomes NaN)."""
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    return pd.read_csv(source, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+
+def committed_snapshot(path, revision='HEAD'):
+    """Bytes of path as of a git revision, or None when it is not in that revision."""
+    result = subprocess.run(['git', 'show', f'{revision}:{path}'], capture_output=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def _keyed(frame, key, columns):
+    """
+    Rows with a non-blank key as text over `columns` (a missing column reads
+    as ''), with their stripped keys and which occurrence of that key each is.
+    """
+    keys = frame[key].astype(str).str.strip()
+    keep = (frame[key].notna() & (keys != '')).to_numpy()
+    rows = frame[keep].reindex(columns=columns)
+    rows = rows.where(rows.notna(), '').reset_index(drop=True)
+    keys = keys[keep].to_numpy()
+    return rows, keys, _numbered(keys).get_level_values(1).to_numpy() + 1
+
+
+def _numbered(values):
+    """(value, n) pairs, n counting earlier entries with the same value."""
+    n = pd.Series(values).groupby(values).cumcount().to_numpy()
+    return pd.MultiIndex.from_arrays([values, n])
+
+
+def _row_records(key, keys, occurrence, labels, change):
+    return pd.DataFrame({
+        key: keys,
+        'Occurrence': occurrence,
+        'Change': change,
+        'Field': '',
+        'Old': '',
+        'New': '',
+        'Label': labels,
+    })
+
+
+def diff_frames(old, new, key, label=None):
+    """
+    Keyed diff of two frames. Returns a frame of records (added rows, then
+    removed rows, then changed fields), each group in file order.
+    """
+    columns = list(old.columns) + [c for c in new.columns if c not in old.columns]
+    old_rows, old_keys, old_occurrence = _keyed(old, key, columns)
+    new_rows, new_keys, new_occurrence = _keyed(new, key, columns)
+
+    # Rows identical in both snapshots are paired on their content first, so
+    # dropping one of several rows with the same key does not shift the others
+    old_ids = _numbered(pd.util.hash_pandas_object(old_rows, index=False).to_numpy())
+    new_ids = _numbered(pd.util.hash_pandas_object(new_rows, index=False).to_numpy())
+    old_open = ~old_ids.isin(new_ids)
+    new_open = ~new_ids.isin(old_ids)
+
+    # What is left pairs up on key, in file order among that key's remaining rows
+    old_index = _numbered(old_keys[old_open])
+    new_index = _numbered(new_keys[new_open])
+    old_rest = old_rows[old_open].set_index(old_index)
+    new_rest = new_rows[new_open].set_index(new_index)
+    old_occurrence = old_occurrence[old_open]
+    new_occurrence = new_occurrence[new_open]
+    in_old = new_index.isin(old_index)
+    in_new = old_index.isin(new_index)
+
+    def labels(rows, mask):
+        return rows[label].to_numpy(dtype=object)[mask] if label in columns else ''
+
+    added = _row_records(key, new_index.get_level_values(0)[~in_old], new_occurrence[~in_old],
+                         labels(new_rest, ~in_old), 'added')
+    removed = _row_records(key, old_index.get_level_values(0)[~in_new], old_occurrence[~in_new],
+                           labels(old_rest, ~in_new), 'removed')
+
+    # Compare every paired row and column at once
+    common = new_index[in_old]
+    before = old_rest.reindex(common).to_numpy(dtype=object)
+    after = new_rest[in_old].to_numpy(dtype=object)
+    rows, cols = np.nonzero(before != after)
+    changed = pd.DataFrame({
+        key: common.get_level_values(0)[rows],
+        'Occurrence': new_occurrence[in_old][rows],
+        'Change': 'changed',
+        'Field': np.asarray(columns, dtype=object)[cols],
+        'Old': before[rows, cols],
+        'New': after[rows, cols],
+        'Label': labels(new_rest, in_old)[rows] if label in columns else '',
+    })
+
+    records = pd.concat([added, removed, changed], ignore_index=True)
+    return records[[key] + RECORD_COLUMNS]
+
+
+def summarize(records, key):
+    """{'added', 'removed', 'changed' (rows), 'fields' (changed cells)} counts for a diff."""
+    changes = records['Change']
+    changed_rows = records.loc[changes == 'changed', [key, 'Occurrence']].drop_duplicates()
+    return {
+        'added': int((changes == 'added').sum()),
+        'removed': int((changes == 'removed').sum()),
+        'changed': len(changed_rows),
+        'fields': int((changes == 'changed').sum()),
+    }
+
+
+def describe(counts):
+    """'2 changed (3 fields), 1 added' style text, or 'no changes'."""
+    parts = []
+    if counts['changed']:
+        parts.append(f"{counts['changed']} changed ({counts['fields']} fields)")
+    if counts['added']:
+        parts.append(f"{counts['added']} added")
+    if counts['removed']:
+        parts.append(f"{counts['removed']} removed")
+    return ', '.join(parts) or 'no changes'
+
+
+def diff_with_committed(name, revision='HEAD'):
+    """(records, counts) for a dataset's working CSV against its committed version."""
+    path, key, label = DATASETS[name]
+    new = read_snapshot(path)
+    previous = committed_snapshot(path, revision)
+    old = read_snapshot(previous) if previous is not None else new.iloc[0:0]
+    records = diff_frames(old, new, key, label)
+    return records, summarize(records, key)
+
+
+def main():
+    print("🔎 Changes since the last commit...")
+    print()
+    os.makedirs(CHANGES_DIR, exist_ok=True)
+
+    summary = []
+    for name, (path, key, _) in DATASETS.items():
+        records, counts = diff_with_committed(name)
+        records.to_csv(os.path.join(CHANGES_DIR, f"{name}_changes.csv"), index=False)
+        summary.append(f"{name}: {describe(counts)}")
+
+        print(f"📄 {path}: {describe(counts)}")
+        for record in records.head(PREVIEW_ROWS).itertuples(index=False):
+            row_key, occurrence, change, field, old, new, row_label = record
+            shown_key = row_key if occurrence == 1 else f"{row_key} (#{occurrence})"
+            if change == 'changed':
+                print(f"   ✏️  {shown_key} {field}: {old!r} → {new!r}")
+            else:
+                print(f"   {'➕' if change == 'added' else '➖'} {shown_key} {row_label}")
+        if len(records) > PREVIEW_ROWS:
+            print(f"   ... {len(records) - PREVIEW_ROWS} more in {CHANGES_DIR}/{name}_changes.csv")
+        print()
+
+    with open(os.path.join(CHANGES_DIR, 'summary.txt'), 'w', encoding='utf-8') as f:
+        f.write('; '.join(summary) + '\n')
+
+
+if __name__ == "__main__":
+    main()
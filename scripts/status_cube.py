@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Single-pass status aggregation for the closeout dashboard
+Counts Completed / In Progress / Not Started for every requested dimension
+with one bincount over (dimension value, status) codes, so adding a
+dimension does not add another groupby over the requirements. The same codes
+also give the drilldown index: row positions per (dimension, value, status).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Normalized status values and the column labels used in the stats tables
+STATUS_ORDER = ['Complete', 'In Progress', 'Not Started']
+STATUS_LABELS = ['Completed', 'In Progress', 'Not Started']
+
+
+def build_status_cube(df, dimensions, status_col='Status_Normalized', with_index=False):
+    """
+    Aggregate status counts for several dimensions at once.
+
+    dimensions maps a source column to the label used for it in the output
+    table, e.g. {'Category': 'Phase', 'Deliverable Type': 'Format'}.
+
+    Returns a dict with:
+      'totals' - overall counts per status label plus 'Total' and 'Completion_Pct'
+      'tables' - {source column: DataFrame[label, Completed, In Progress,
+                  Not Started, Total, Completion_Pct]} sorted by value, with
+                  blank (NaN) values dropped like a default groupby
+      'index'  - only with with_index=True: {output label: {value: [row
+                  positions per status, in STATUS_LABELS order]}}, positions
+                  being 0-based offsets into df in original row order
+    """
+    n_status = len(STATUS_ORDER)
+    status_codes = pd.Categorical(df[status_col], categories=STATUS_ORDER).codes.astype(np.int64)
+
+    # Factorize every dimension and shift its codes into its own block of the cube
+    blocks = []
+    all_codes = []
+    all_rows = []
+    offset = 0
+    for column in dimensions:
+        codes, uniques = pd.factorize(df[column], sort=True)
+        valid = (codes >= 0) & (status_codes >= 0)
+        all_codes.append((offset + codes[valid]) * n_status + status_codes[valid])
+        all_rows.append(np.flatnonzero(valid))
+        blocks.append((column, uniques, offset))
+        offset += len(uniques)
+
+    overall = np.bincount(status_codes[status_codes >= 0], minlength=n_status)
+    combined = np.concatenate(all_codes) if all_codes else np.zeros(0, dtype=np.int64)
+    cube = np.bincount(combined, minlength=offset * n_status)
+    cube = cube.reshape(offset, n_status)
+
+    tables = {}
+    for column, uniques, start in blocks:
+        counts = cube[start:start + len(uniques)]
+        table = pd.DataFrame(counts, columns=STATUS_LABELS)
+        table.insert(0, dimensions[column], np.asarray(uniques))
+        table['Total'] = counts.sum(axis=1)
+        table['Completion_Pct'] = (table['Completed'] / table['Total'] * 100).round(1)
+        tables[column] = table
+
+    total = int(overall.sum())
+    totals = {label: int(count) for label, count in zip(STATUS_LABELS, overall)}
+    totals['Total'] = total
+    totals['Completion_Pct'] = (totals['Completed'] / total * 100) if total > 0 else 0
+
+    result = {'totals': totals, 'tables': tables}
+    if with_index:
+        result['index'] = _drilldown_index(dimensions, blocks, combined, all_rows, cube)
+    return result
+
+
+def _drilldown_index(dimensions, blocks, combined, all_rows, cube):
+    """Group row positions by cube cell; a stable sort keeps original row order per cell."""
+    n_status = len(STATUS_ORDER)
+    rows = np.concatenate(all_rows) if all_rows else np.zeros(0, dtype=np.int64)
+    sorted_rows = rows[np.argsort(combined, kind='stable')]
+    cells = np.split(sorted_rows, np.cumsum(cube.ravel())[:-1]) if len(cube) else []
+
+    index = {}
+    for column, uniques, start in blocks:
+        index[dimensions[column]] = {
+            str(value): [cells[(start + i) * n_status + k].tolist() for k in range(n_status)]
+            for i, value in enumerate(uniques)
+        }
+    return index
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Status normalization and responsible-party grouping rules
+Shared by the closeout dashboard (Status) and the documents dashboard
+(Review_Status) so both read tracker statuses the same way. The rule tables
+are compiled once into vectorized pandas string operations.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Canonical review states
+COMPLETE = 'complete'
+IN_PROGRESS = 'in_progress'
+NOT_STARTED = 'not_started'
+
+# Rule table: (match type, pattern, state). Patterns are compared against the
+# trimmed, lowercased status text; the first matching rule wins.
+STATUS_RULES = [
+    # Completed synonyms
+    ('exact', 'complete', COMPLETE),
+    ('exact', 'completed', COMPLETE),
+    ('exact', 'reviewed', COMPLETE),
+    # Explicit not started markers
+    ('exact', 'not started', NOT_STARTED),
+    ('exact', 'n/a', NOT_STARTED),
+    ('exact', 'na', NOT_STARTED),
+    # Work underway (including the common 'Ongoign' typo)
+    ('exact', 'in progress', IN_PROGRESS),
+    ('exact', 'ongoing', IN_PROGRESS),
+    ('exact', 'ongoign', IN_PROGRESS),
+    ('exact', 'due', IN_PROGRESS),
+    ('exact', 'past due', IN_PROGRESS),
+    ('exact', 'located', IN_PROGRESS),
+    ('exact', 'pending', IN_PROGRESS),
+    # Phase-coded statuses like '03-Internal Response Review'
+    ('regex', r'^\d+\s*-', IN_PROGRESS),
+]
+
+# Blank / missing statuses count as not started; anything unrecognized is in progress
+BLANK_STATE = NOT_STARTED
+DEFAULT_STATE = IN_PROGRESS
+
+# Display labels used by each dashboard
+CLOSEOUT_LABELS = {COMPLETE: 'Complete', IN_PROGRESS: 'In Progress', NOT_STARTED: 'Not Started'}
+DOCUMENT_LABELS = {COMPLETE: 'Reviewed', IN_PROGRESS: 'In Progress', NOT_STARTED: 'Not Started'}
+
+# Responsible party grouping: (substring, group). Case-sensitive, first match wins.
+PARTY_RULES = [
+    ('Design-Builder', 'Design-Builder'),
+    ('Design Builder', 'Design-Builder'),
+    ('WSDOT', 'WSDOT'),
+]
+UNKNOWN_PARTY = 'Unknown'
+
+
+def compile_status_rules(rules=STATUS_RULES, blank_state=BLANK_STATE, default_state=DEFAULT_STATE):
+    """Compile a rule table into a function mapping a Series of raw statuses to canonical states."""
+    exact = {}
+    patterns = []
+    for match_type, pattern, state in rules:
+        if match_type == 'exact':
+            exact.setdefault(pattern, state)
+        elif match_type == 'regex':
+            patterns.append((pattern, state))
+        else:
+            raise ValueError(f"Unknown status rule type: {match_type}")
+
+    def to_state(values):
+        text = values.astype('string').str.strip().str.lower()
+        states = text.map(exact).astype(object)
+
+        for pattern, state in patterns:
+            unmatched = states.isna()
+            if not unmatched.any():
+                break
+            hits = unmatched & text.str.contains(pattern, regex=True, na=False)
+            states[hits.to_numpy(dtype=bool)] = state
+
+        blank = (text.isna() | (text == '')).to_numpy(dtype=bool, na_value=True)
+        states[blank] = blank_state
+        return states.fillna(default_state)
+
+    return to_state
+
+
+_status_to_state = compile_status_rules()
+
+
+def normalize_status(values, labels=CLOSEOUT_LABELS):
+    """Normalize a Series of raw statuses to the given dashboard labels."""
+    return _status_to_state(values).map(labels)
+
+
+def normalize_review_status(values):
+    """Documents dashboard flavour: Reviewed / In Progress / Not Started."""
+    return normalize_status(values, labels=DOCUMENT_LABELS)
+
+
+def group_responsible_party(values, rules=PARTY_RULES, unknown=UNKNOWN_PARTY):
+    """Collapse Responsibility values into party groups (e.g. all Design-Builder variants)."""
+    text = values.astype('string')
+    conditions = [text.str.contains(substring, regex=False, na=False).to_numpy(dtype=bool)
+                  for substring, _ in rules]
+    choices = [group for _, group in rules]
+    fallback = text.fillna(unknown).astype(object).to_numpy()
+    return pd.Series(np.select(conditions, choices, default=fallback), index=values.index, dtype=object)
@@ -1,43 +1,187 @@
 #!/usr/bin/env python3
 """
 Sync documents tracker from Google Sheets to local CSV
+Sends a conditional request (ETag / Last-Modified from the previous sync),
+streams the download into a temp file next to the tracker, checks its header
+and row count, and only then renames it over data/documents_tracker.csv, so
+a failed or partial download never touches the tracker.
+
+sync_from_sheets() returns True when the tracker changed and False when it
+did not (304 Not Modified, or the same bytes again); the result is also
+kept in data/.documents_tracker_sync.json for later stages.
 """
 
-import subprocess
+import csv
+import hashlib
+import http.client
+import json
+import os
 import sys
+import urllib.error
+import urllib.request
 from datetime import datetime
 
 # Google Sheets published CSV URL
 SHEETS_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vSP4O7viw6_OG70HMK7jVZTSYtG-uvoi0Q4Iyk_mvFnseTLqrf_Fdet_U9FX33e6ihkn9XLXuxEA2Bq/pub?output=csv"
 LOCAL_CSV = "data/documents_tracker.csv"
 
-print("📥 Syncing from Google Sheets...")
-print()
-
-try:
-    # Download from Google Sheets using curl
-    print(f"⬇️  Downloading from Google Sheets...")
-    result = subprocess.run(
-        ['curl', '-sL', SHEETS_URL, '-o', LOCAL_CSV],
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
-        raise Exception(f"curl failed with code {result.returncode}: {result.stderr}")
-
-    # Get line count
-    with open(LOCAL_CSV, 'r') as f:
-        lines = sum(1 for _ in f)
-
-    print(f"✅ Synced successfully!")
-    print(f"📊 {lines} rows downloaded")
-    print(f"💾 Saved to: {LOCAL_CSV}")
-    print(f"🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+# Validators and outcome of the last sync
+SYNC_STATE = "data/.documents_tracker_sync.json"
+
+TIMEOUT_SECONDS = 60
+CHUNK_BYTES = 64 * 1024
+
+# Columns the documents dashboard reads; a download without them is rejected
+# (e.g. the sign-in page Google serves when the sheet is unpublished)
+REQUIRED_COLUMNS = ['Doc_Number', 'Document_Name', 'Category', 'Contract_Section',
+                    'Review_Status', 'Representative_File', 'File_Path']
+
+# Reject downloads with fewer data rows than this, or with less than this
+# share of the current tracker's rows (a truncated export)
+MIN_ROWS = 1
+MIN_ROW_RATIO = 0.5
+
+
+class SyncError(Exception):
+    """The download failed or did not look like the tracker."""
+
+
+def load_sync_state(state_path=SYNC_STATE):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(state, state_path=SYNC_STATE):
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_shape(path):
+    """(header, data row count) of a CSV file; quoted multi-line cells count once."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = sum(1 for row in reader if any(cell.strip() for cell in row))
+    return header, rows
+
+
+def validate_csv(path, current_rows=None):
+    """Raise SyncError unless the file has the tracker's columns and a plausible row count."""
+    try:
+        header, rows = read_shape(path)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise SyncError(f"Download is not a readable CSV: {e}")
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise SyncError(f"Download is missing columns: {', '.join(missing)}")
+    if rows < MIN_ROWS:
+        raise SyncError(f"Download has only {rows} rows")
+    if current_rows and rows < current_rows * MIN_ROW_RATIO:
+        raise SyncError(f"Download has {rows} rows, the tracker has {current_rows} - looks truncated")
+    return rows
+
+
+def download(url, tmp_path, state):
+    """
+    Stream url into tmp_path. Returns the response headers, or None when
+    the server answered 304 Not Modified.
+    """
+    request = urllib.request.Request(url, headers={'User-Agent': 'montlake-sync'})
+    if state.get('etag'):
+        request.add_header('If-None-Match', state['etag'])
+    if state.get('last_modified'):
+        request.add_header('If-Modified-Since', state['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as response, open(tmp_path, 'wb') as f:
+            expected = response.headers.get('Content-Length')
+            received = 0
+            for chunk in iter(lambda: response.read(CHUNK_BYTES), b''):
+                f.write(chunk)
+                received += len(chunk)
+            if expected is not None and received != int(expected):
+                raise SyncError(f"Download ended after {received} of {expected} bytes")
+            return response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        raise SyncError(f"HTTP {e.code} {e.reason}")
+    except urllib.error.URLError as e:
+        raise SyncError(f"Could not reach Google Sheets: {e.reason}")
+    except (OSError, http.client.HTTPException) as e:
+        raise SyncError(f"Download failed: {e!r}")
+
+
+def sync_from_sheets(url=SHEETS_URL, local_csv=LOCAL_CSV, state_path=SYNC_STATE):
+    """
+    Refresh local_csv from the published sheet. Returns True when the
+    tracker changed. Raises SyncError (leaving the tracker as it was) when
+    the download fails or does not validate.
+    """
+    print("📥 Syncing from Google Sheets...")
     print()
 
-except Exception as e:
-    print(f"❌ Error syncing from Google Sheets:")
-    print(f"   {str(e)}")
+    state = load_sync_state(state_path)
+    have_local = os.path.exists(local_csv)
+    if not have_local:
+        state = {}  # Validators are meaningless without the file they describe
+    tmp_path = local_csv + '.download'
+
+    try:
+        print(f"⬇️  Downloading from Google Sheets...")
+        headers = download(url, tmp_path, state)
+
+        if headers is None:
+            changed = False
+            print(f"✅ Not modified since the last sync")
+        else:
+            current_rows = read_shape(local_csv)[1] if have_local else None
+            rows = validate_csv(tmp_path, current_rows)
+            changed = not have_local or file_hash(tmp_path) != file_hash(local_csv)
+            if changed:
+                os.replace(tmp_path, local_csv)
+                print(f"✅ Synced successfully!")
+                print(f"📊 {rows} rows downloaded")
+                print(f"💾 Saved to: {local_csv}")
+            else:
+                print(f"✅ Sheet unchanged ({rows} rows)")
+            state['etag'] = headers.get('ETag')
+            state['last_modified'] = headers.get('Last-Modified')
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    now = datetime.now()
+    state['checked_at'] = now.isoformat(timespec='seconds')
+    state['changed'] = changed
+    if changed:
+        state['changed_at'] = state['checked_at']
+    save_sync_state(state, state_path)
+
+    print(f"🕒 {now.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
-    sys.exit(1)
+    return changed
+
+
+if __name__ == "__main__":
+    try:
+        sync_from_sheets()
+    except Exception as e:
+        print(f"❌ Error syncing from Google Sheets:")
+        print(f"   {str(e)}")
+        print()
+        sys.exit(1)
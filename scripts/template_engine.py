@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Minimal template engine for the dashboards
+Page markup lives in templates/ as plain HTML/CSS/JS (no f-string brace
+escaping). Two tags are supported:
+    {{ name }}       - insert context value `name`
+    {{> partial }}   - insert templates/partials/<partial>.html rendered with
+                       the same context
+Templates are compiled once and recompiled only when their file mtime
+changes; rendered output is cached per (template, context) so unchanged
+partials like the footer or a status badge are not re-rendered.
+"""
+
+import os
+import re
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+PARTIAL_DIR = 'partials'
+
+# Only identifiers are tags, so CSS/JS braces pass through untouched
+TAG_PATTERN = re.compile(r'\{\{\s*(>?)\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+# Render cache entries kept before the oldest are dropped
+RENDER_CACHE_SIZE = 1024
+
+_compiled = {}  # path -> (mtime, parts)
+_rendered = {}  # (name, template_dir, signature, context items) -> text
+
+
+def _template_path(name, template_dir):
+    return os.path.join(template_dir, name)
+
+
+def _partial_name(partial):
+    return f"{PARTIAL_DIR}/{partial}.html"
+
+
+def compile_template(text):
+    """
+    Split template text into parts: literal strings, ('var', name) and
+    ('partial', name) tuples.
+    """
+    parts = []
+    position = 0
+    for match in TAG_PATTERN.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        kind = 'partial' if match.group(1) else 'var'
+        parts.append((kind, match.group(2)))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    return parts
+
+
+def get_template(name, template_dir=TEMPLATE_DIR):
+    """Compiled parts for a template, recompiling only when the file's mtime changed."""
+    path = _template_path(name, template_dir)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _compiled.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached
+    with open(path, encoding='utf-8') as f:
+        entry = (mtime, compile_template(f.read()))
+    _compiled[path] = entry
+    return entry
+
+
+def _closure(name, template_dir, seen=None):
+    """
+    (name, mtime) for a template and every partial it includes, plus the
+    context variables they use, so edits invalidate renders and partials are
+    cached on just the values they read.
+    """
+    seen = set() if seen is None else seen
+    if name in seen:
+        raise ValueError(f"Recursive partial include: {name}")
+    seen.add(name)
+    mtime, parts = get_template(name, template_dir)
+    signature = [(name, mtime)]
+    variables = set()
+    for part in parts:
+        if isinstance(part, tuple):
+            if part[0] == 'var':
+                variables.add(part[1])
+            else:
+                sub_signature, sub_variables = _closure(_partial_name(part[1]), template_dir, seen)
+                signature.extend(sub_signature)
+                variables |= sub_variables
+    seen.discard(name)
+    return tuple(signature), variables
+
+
+def _render_parts(name, context, template_dir):
+    _, parts = get_template(name, template_dir)
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part[0] == 'var':
+            if part[1] not in context:
+                raise KeyError(f"Template {name} needs '{part[1]}'")
+            out.append(str(context[part[1]]))
+        else:
+            # Partials go through the render cache keyed on only the values they use
+            partial = _partial_name(part[1])
+            _, variables = _closure(partial, template_dir)
+            out.append(render(partial, template_dir=template_dir,
+                              **{k: context[k] for k in variables if k in context}))
+    return ''.join(out)
+
+
+def render(name, cache=True, template_dir=TEMPLATE_DIR, **context):
+    """
+    Render templates/<name> with the given context.
+    Pass cache=False for one-off pages with large context values.
+    """
+    if not cache:
+        return _render_parts(name, context, template_dir)
+
+    signature, _ = _closure(name, template_dir)
+    key = (name, template_dir, signature,
+           tuple(sorted((k, str(v)) for k, v in context.items())))
+    text = _rendered.get(key)
+    if text is None:
+        text = _render_parts(name, context, template_dir)
+        if len(_rendered) >= RENDER_CACHE_SIZE:
+            _rendered.pop(next(iter(_rendered)))
+        _rendered[key] = text
+    return text
+
+
+def render_partial(partial, cache=True, template_dir=TEMPLATE_DIR, **context):
+    """Render templates/partials/<partial>.html on its own."""
+    return render(_partial_name(partial), cache=cache, template_dir=template_dir, **context)
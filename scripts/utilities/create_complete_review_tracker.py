@@ -4,10 +4,15 @@ Create COMPLETE contract document review tracker
 Includes all contract documents, not just appendices
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fs_index import open_index
+
 print("📊 Creating Complete Contract Document Review Tracker...")
 print()
 
@@ -24,6 +29,10 @@ base_path = Path("/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartme
 rfp_path = base_path / "120_RFP Conformed to COs"
 co_path = base_path / "050_Change Orders"
 
+# OneDrive listings, sizes and dates come from the shared index; the tracker
+# shows sizes and dates, so everything is re-listed (full refresh)
+index = open_index(rfp_path, full=True)
+
 # 1. Change Orders - we already have these downloaded
 co_folder = Path("/Users/z/Desktop/git/Change Orders 166-189")
 if co_folder.exists():
@@ -41,15 +50,16 @@ if co_folder.exists():
 
 # 2. Contract Form
 contract_form = rfp_path / "Contract Form.docx"
-if contract_form.exists():
+contract_form_entry = index.stat(contract_form)
+if contract_form_entry:
     other_docs.append({
         'Category': '2 - Contract Form',
         'Appendix_Number': '',
         'Subfolder': '',
         'Filename': 'Contract Form.docx',
         'File_Type': '.DOCX',
-        'Size_MB': f"{contract_form.stat().st_size / (1024*1024):.2f}",
-        'Modified_Date': datetime.fromtimestamp(contract_form.stat().st_mtime).strftime('%Y-%m-%d'),
+        'Size_MB': f"{contract_form_entry.size / (1024*1024):.2f}",
+        'Modified_Date': datetime.fromtimestamp(contract_form_entry.mtime).strftime('%Y-%m-%d'),
         'Full_Path': str(contract_form)
     })
 
@@ -68,49 +78,54 @@ other_docs.append({
 
 # 4. General Provisions - RFP Chapter 1
 chapter1 = rfp_path / "Chapter 1.docx"
-if chapter1.exists():
+chapter1_entry = index.stat(chapter1)
+if chapter1_entry:
     other_docs.append({
         'Category': '4 - General Provisions (Ch 1)',
         'Appendix_Number': '',
         'Subfolder': '',
         'Filename': 'Chapter 1.docx',
         'File_Type': '.DOCX',
-        'Size_MB': f"{chapter1.stat().st_size / (1024*1024):.2f}",
-        'Modified_Date': datetime.fromtimestamp(chapter1.stat().st_mtime).strftime('%Y-%m-%d'),
+        'Size_MB': f"{chapter1_entry.size / (1024*1024):.2f}",
+        'Modified_Date': datetime.fromtimestamp(chapter1_entry.mtime).strftime('%Y-%m-%d'),
         'Full_Path': str(chapter1)
     })
 
 # 5. Community Workforce Agreement
 cwa_path = rfp_path / "Appendices" / "Z - Community Workforce Agreement"
-if cwa_path.exists():
-    for cwa_file in sorted(cwa_path.rglob("*.pdf")):
+if index.exists(cwa_path):
+    for cwa_entry in index.files(cwa_path, extensions=['.pdf']):
+        cwa_file = Path(cwa_entry.path)
         other_docs.append({
             'Category': '5 - Community Workforce Agreement',
             'Appendix_Number': 'Z1',
             'Subfolder': str(cwa_file.parent.relative_to(cwa_path)),
             'Filename': cwa_file.name,
             'File_Type': '.PDF',
-            'Size_MB': f"{cwa_file.stat().st_size / (1024*1024):.2f}",
-            'Modified_Date': datetime.fromtimestamp(cwa_file.stat().st_mtime).strftime('%Y-%m-%d'),
+            'Size_MB': f"{cwa_entry.size / (1024*1024):.2f}",
+            'Modified_Date': datetime.fromtimestamp(cwa_entry.mtime).strftime('%Y-%m-%d'),
             'Full_Path': str(cwa_file)
         })
 
 # 6. Technical Requirements - RFP Chapter 2
 chapter2 = rfp_path / "Chapter Two.docx"
-if chapter2.exists():
+chapter2_entry = index.stat(chapter2)
+if chapter2_entry:
     other_docs.append({
         'Category': '6 - Technical Requirements (Ch 2)',
         'Appendix_Number': '',
         'Subfolder': '',
         'Filename': 'Chapter Two.docx',
         'File_Type': '.DOCX',
-        'Size_MB': f"{chapter2.stat().st_size / (1024*1024):.2f}",
-        'Modified_Date': datetime.fromtimestamp(chapter2.stat().st_mtime).strftime('%Y-%m-%d'),
+        'Size_MB': f"{chapter2_entry.size / (1024*1024):.2f}",
+        'Modified_Date': datetime.fromtimestamp(chapter2_entry.mtime).strftime('%Y-%m-%d'),
         'Full_Path': str(chapter2)
     })
 
 # 7. Appendices are already included in appendices_df
 
+index.close()
+
 # 8. Design-Builder's Proposal Documents (need to locate)
 other_docs.append({
     'Category': '8 - Design-Builder Proposal',
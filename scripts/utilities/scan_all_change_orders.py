@@ -1,69 +1,101 @@
 #!/usr/bin/env python3
 """
-Scan ALL change orders (001-189) and catalog them
+Scan ALL change orders and catalog them
 Identify executed vs missing COs
+
+The change order tree is read in one concurrent pass (see parallel_walk.py)
+into a CO number -> folder map and a CO number -> executed PDF map, instead
+of re-listing every batch folder once per CO number.
 """
 
 import os
-from pathlib import Path
 import re
+import sys
+from fnmatch import fnmatchcase
+from pathlib import Path
 from datetime import datetime
 
+# Shared directory walker lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from parallel_walk import parallel_walk, list_entries
+
 # Base path to change orders
 CO_PATH = Path("/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation/TheBRIDGE - Montlake - Change Management  Documents/050_Change Orders")
 
-def scan_change_orders():
+# CO range to report. LAST_CO = None runs through the highest CO found on disk
+# (never stopping short of EXPECTED_LAST_CO), since new COs keep being issued.
+FIRST_CO = 1
+LAST_CO = None
+EXPECTED_LAST_CO = 189
+
+BATCH_PATTERN = "Change Orders *"
+CO_FOLDER_PATTERN = re.compile(r'^(\d{3,})_')
+EXECUTED_FOLDER = "executed co (final docs)"  # Compared case-insensitively
+SIGNED_PATTERN = "*signed*.pdf"
+
+
+def build_change_order_index():
+    """
+    Walk the batch folders once and return (co_folders, executed_pdfs):
+    CO number -> CO folder Path and CO number -> first signed PDF Path.
+    A CO number found in more than one folder keeps the first in sorted order.
+    """
+    co_folders = {}
+    executed_pdfs = {}
+
+    def visit(path, depth):
+        dir_entries, file_entries = list_entries(path)
+        if depth == 0:
+            # Batch folders
+            return None, [entry.path for entry in dir_entries if fnmatchcase(entry.name, BATCH_PATTERN)]
+        if depth == 1:
+            # CO folders inside a batch
+            return None, [entry.path for entry in dir_entries if CO_FOLDER_PATTERN.match(entry.name)]
+        if depth == 2:
+            # Executed folder inside a CO folder ("Final Docs"/"final docs" variants)
+            executed = [entry for entry in dir_entries if entry.name.lower() == EXECUTED_FOLDER]
+            executed.sort(key=lambda entry: entry.name != "Executed CO (Final Docs)")
+            return None, [entry.path for entry in executed[:1]]
+        # Signed PDFs inside the executed folder
+        return [Path(entry.path) for entry in file_entries if fnmatchcase(entry.name, SIGNED_PATTERN)], []
+
+    for path, depth, signed, _ in parallel_walk(CO_PATH, visit, max_depth=3, sort=True):
+        if depth == 2:
+            folder = Path(path)
+            co_folders.setdefault(int(CO_FOLDER_PATTERN.match(folder.name).group(1)), folder)
+        elif depth == 3 and signed:
+            co_folder = Path(path).parent
+            co_num = int(CO_FOLDER_PATTERN.match(co_folder.name).group(1))
+            if co_folders.get(co_num) == co_folder:
+                executed_pdfs[co_num] = signed[0]
+
+    return co_folders, executed_pdfs
+
+
+def scan_change_orders(first_co=FIRST_CO, last_co=LAST_CO):
     """Scan all change order folders and find executed PDFs"""
 
-    print("🔍 Scanning Change Orders 001-189...")
+    co_folders, executed_pdfs = build_change_order_index()
+    if last_co is None:
+        last_co = max([EXPECTED_LAST_CO] + list(co_folders))
+
+    print(f"🔍 Scanning Change Orders {first_co:03d}-{last_co:03d}...")
+    print(f"📁 Indexed {len(co_folders)} CO folders, {len(executed_pdfs)} executed PDFs")
     print()
 
     change_orders = []
 
-    # Expected range: CO 001 through CO 189
-    for co_num in range(1, 190):
+    for co_num in range(first_co, last_co + 1):
         co_id = f"{co_num:03d}"
-
-        # Search for this CO folder
-        co_found = False
-        co_folder = None
-        executed_pdf = None
-
-        # Look through all batch folders
-        for batch_folder in sorted(CO_PATH.glob("Change Orders *")):
-            # Find folder matching this CO number
-            for folder in batch_folder.iterdir():
-                if not folder.is_dir():
-                    continue
-
-                # Extract CO number from folder name
-                match = re.search(rf'^{co_id}_', folder.name)
-                if match:
-                    co_found = True
-                    co_folder = folder
-
-                    # Look for executed PDF
-                    executed_folder = co_folder / "Executed CO (Final Docs)"
-                    if not executed_folder.exists():
-                        # Try alternate naming
-                        executed_folder = co_folder / "Executed CO (final docs)"
-
-                    if executed_folder.exists():
-                        # Find the -signed.pdf file
-                        signed_pdfs = list(executed_folder.glob("*signed*.pdf"))
-                        if signed_pdfs:
-                            executed_pdf = signed_pdfs[0]
-
-                    break
-
-            if co_found:
-                break
+        co_folder = co_folders.get(co_num)
+        executed_pdf = executed_pdfs.get(co_num)
 
         # Record findings
-        if co_found:
+        if co_folder:
             if executed_pdf:
-                size_mb = executed_pdf.stat().st_size / (1024*1024)
-                mod_date = datetime.fromtimestamp(executed_pdf.stat().st_mtime).strftime('%Y-%m-%d')
+                info = executed_pdf.stat()
+                size_mb = info.st_size / (1024*1024)
+                mod_date = datetime.fromtimestamp(info.st_mtime).strftime('%Y-%m-%d')
 
                 change_orders.append({
                     'CO_Number': co_id,
@@ -80,10 +112,10 @@ def scan_change_orders():
                     'CO_Number': co_id,
                     'Status': 'FOLDER EXISTS - NO EXECUTED PDF',
                     'Filename': '',
-                    'Folder': co_folder.name if co_folder else '',
+                    'Folder': co_folder.name,
                     'Size_MB': '0.00',
                     'Modified_Date': '',
-                    'Full_Path': str(co_folder) if co_folder else '',
+                    'Full_Path': str(co_folder),
                     'Notes': 'Folder exists but no signed/executed PDF found'
                 })
         else:
@@ -116,7 +148,8 @@ def main():
     print()
     print("SUMMARY:")
     print("-" * 80)
-    print(f"Total COs (001-189):     189")
+    first_id, last_id = change_orders[0]['CO_Number'], change_orders[-1]['CO_Number']
+    print(f"Total COs ({first_id}-{last_id}):     {len(change_orders)}")
     print(f"Executed PDFs Found:     {executed}")
     print(f"Folder Only (No PDF):    {folder_only}")
     print(f"Missing Completely:      {missing}")
@@ -6,10 +6,15 @@ Creates a comprehensive map for closeout requirement searching
 
 import os
 import re
+import sys
 from pathlib import Path
 import csv
 from datetime import datetime
 
+# Shared OneDrive index lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fs_index import open_index
+
 # Base path to appendices
 APPENDICES_PATH = Path("/Users/z/Library/CloudStorage/OneDrive-WashingtonStateDepartmentofTransportation/TheBRIDGE - Montlake - Change Management  Documents/120_RFP Conformed to COs/Appendices")
 
@@ -21,15 +26,13 @@ def extract_appendix_number(path_str):
         return match.group(1)
     return ""
 
-def get_file_info(file_path):
-    """Get file information"""
-    try:
-        stat = file_path.stat()
-        size_mb = stat.st_size / (1024 * 1024)
-        mod_time = datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d')
-        return size_mb, mod_time
-    except:
+def get_file_info(entry):
+    """Get file information from an index entry"""
+    if entry.size is None or entry.mtime is None:
         return 0, ""
+    size_mb = entry.size / (1024 * 1024)
+    mod_time = datetime.fromtimestamp(entry.mtime).strftime('%Y-%m-%d')
+    return size_mb, mod_time
 
 def scan_appendices():
     """Scan all appendices and create inventory"""
@@ -38,25 +41,31 @@ def scan_appendices():
 
     print("🔍 Scanning appendices...")
 
+    # Listings and file sizes/dates come from the OneDrive index; the report
+    # shows sizes and dates, so everything is re-listed (full refresh)
+    index = open_index(APPENDICES_PATH, full=True)
+
     # Walk through all directories
-    for category_dir in sorted(APPENDICES_PATH.iterdir()):
-        if not category_dir.is_dir():
+    for category_entry in index.listdir(APPENDICES_PATH):
+        if not category_entry.is_dir:
             continue
 
-        category_name = category_dir.name
+        category_dir = Path(category_entry.path)
+        category_name = category_entry.name
         print(f"  📁 {category_name}")
 
         # Count files in this category
         file_count = 0
 
         # Walk through subdirectories
-        for root, dirs, files in os.walk(category_dir):
+        for root, dirs, files in index.walk(category_dir):
             root_path = Path(root)
 
             # Get relative path from category
             rel_path = root_path.relative_to(category_dir)
 
-            for file in sorted(files):
+            for entry in files:
+                file = entry.name
                 if file.startswith('.') or file.startswith('~'):
                     continue
 
@@ -73,7 +82,7 @@ def scan_appendices():
                 appendix_num = extract_appendix_number(str(file_path))
 
                 # Get file info
-                size_mb, mod_date = get_file_info(file_path)
+                size_mb, mod_date = get_file_info(entry)
 
                 # Store data
                 appendix_data.append({
@@ -89,6 +98,7 @@ def scan_appendices():
 
         print(f"     Found {file_count} files")
 
+    index.close()
     return appendix_data
 
 def create_summary(appendix_data):
@@ -0,0 +1,80 @@
+"""Rebuilds must leave the previous data asset readable for cached page shells."""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+# data_assets.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from data_assets import write_asset, prune_assets
+
+
+def rebuild(asset_dir, payload, generation):
+    """What a generator does on each update: write the asset, then prune."""
+    url = write_asset('closeout-requirements', payload, asset_dir=asset_dir)
+    # Space the generations out so mtime order never depends on timer resolution
+    os.utime(url, ns=(generation * 10**9, generation * 10**9))
+    prune_assets('closeout-requirements.', keep=[url], asset_dir=asset_dir)
+    return url
+
+
+def test_rebuild_keeps_previous_asset_readable(tmp_path):
+    asset_dir = str(tmp_path)
+    first = rebuild(asset_dir, {'rows': 1}, 1)
+    second = rebuild(asset_dir, {'rows': 2}, 2)
+
+    # A shell cached from the first build still gets its data
+    with open(first, encoding='utf-8') as f:
+        assert json.load(f) == {'rows': 1}
+    with open(first + '.gz', 'rb') as f:
+        assert json.loads(gzip.decompress(f.read())) == {'rows': 1}
+    with open(second, encoding='utf-8') as f:
+        assert json.load(f) == {'rows': 2}
+
+
+def test_older_generations_are_pruned(tmp_path):
+    asset_dir = str(tmp_path)
+    first = rebuild(asset_dir, {'rows': 1}, 1)
+    second = rebuild(asset_dir, {'rows': 2}, 2)
+    third = rebuild(asset_dir, {'rows': 3}, 3)
+
+    assert not os.path.exists(first)
+    assert not os.path.exists(first + '.gz')
+    assert os.path.exists(second) and os.path.exists(third)
+
+
+def test_unchanged_rebuild_keeps_both_versions(tmp_path):
+    asset_dir = str(tmp_path)
+    first = rebuild(asset_dir, {'rows': 1}, 1)
+    second = rebuild(asset_dir, {'rows': 2}, 2)
+    again = rebuild(asset_dir, {'rows': 2}, 3)
+
+    assert again == second
+    assert os.path.exists(first) and os.path.exists(second)
+
+
+def test_each_asset_name_keeps_its_own_previous_version(tmp_path):
+    # contractdocs-<section> assets share one prune prefix
+    asset_dir = str(tmp_path)
+    old = {s: write_asset(f"contractdocs-{s}", {'html': s}, asset_dir=asset_dir) for s in ('a', 'b')}
+    new = {s: write_asset(f"contractdocs-{s}", {'html': s * 2}, asset_dir=asset_dir) for s in ('a', 'b')}
+    prune_assets('contractdocs-', keep=list(new.values()), asset_dir=asset_dir)
+
+    for url in list(old.values()) + list(new.values()):
+        assert os.path.exists(url)
+
+
+def test_edited_asset_is_restored(tmp_path):
+    asset_dir = str(tmp_path)
+    url = write_asset('closeout-requirements', {'rows': 1}, asset_dir=asset_dir)
+    with open(url, 'w', encoding='utf-8') as f:
+        f.write('{"rows": 99}')
+    os.remove(url + '.gz')
+
+    assert write_asset('closeout-requirements', {'rows': 1}, asset_dir=asset_dir) == url
+    with open(url, encoding='utf-8') as f:
+        assert json.load(f) == {'rows': 1}
+    with open(url + '.gz', 'rb') as f:
+        assert json.loads(gzip.decompress(f.read())) == {'rows': 1}
@@ -0,0 +1,39 @@
+"""Reports that show sizes and dates need a full refresh to see in-place edits."""
+
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+# fs_index.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from fs_index import open_index
+
+
+def indexed_size(root, index_path, full):
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = open_index(root, index_path=index_path, full=full)
+    try:
+        return index.stat(os.path.join(root, 'a.pdf')).size
+    finally:
+        index.close()
+
+
+def edit_in_place(root):
+    """Rewrite a file without its folder's mtime moving (as OneDrive edits do)."""
+    folder = os.stat(root)
+    with open(os.path.join(root, 'a.pdf'), 'wb') as f:
+        f.write(b'x' * 5000)
+    os.utime(root, ns=(folder.st_atime_ns, folder.st_mtime_ns))
+
+
+def test_full_refresh_sees_in_place_edit(tmp_path):
+    root, index_path = str(tmp_path / 'root'), str(tmp_path / 'index.sqlite')
+    os.mkdir(root)
+    (tmp_path / 'root' / 'a.pdf').write_bytes(b'x' * 10)
+    assert indexed_size(root, index_path, full=False) == 10
+
+    edit_in_place(root)
+    assert indexed_size(root, index_path, full=False) == 10  # Folder unchanged: served from the store
+    assert indexed_size(root, index_path, full=True) == 5000
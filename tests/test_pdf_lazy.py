@@ -0,0 +1,259 @@
+"""The first-page-only PDF reader agrees with PyPDF2, and gives up cleanly on files it cannot read."""
+
+import sys
+import zlib
+from pathlib import Path
+
+import PyPDF2
+import pytest
+
+# extract_document_titles.py and pdf_lazy.py live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from extract_document_titles import read_pdf_info, read_pdf_info_lazy
+from pdf_lazy import LazyPdf, LazyPdfError
+
+FONT = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+TEXT = (b'BT /F1 18 Tf 72 720 Td (SR 520 Montlake Project) Tj 0 -30 Td (Design Build Contract Special Provisions) Tj '
+        b'0 -30 Td (Chapter 2 Environmental Commitments) Tj ET')
+
+
+def stream(data, compress=False, **entries):
+    """Stream object body; extra dictionary entries are given as raw bytes."""
+    if compress:
+        data = zlib.compress(data)
+        entries['Filter'] = b'/FlateDecode'
+    extra = b''.join(b' /%s %s' % (key.encode(), value) for key, value in entries.items())
+    return b'<< /Length %d%s >>\nstream\n%s\nendstream' % (len(data), extra, data)
+
+
+def build_pdf(path, objects, info=None, xref_stream=False, packed=()):
+    """
+    Write objects ({number: body}, catalog is 1) as a PDF with a classic xref
+    table, or an xref stream when xref_stream is set. Numbers in packed go
+    into an object stream (which needs an xref stream).
+    """
+    out = bytearray(b'%PDF-1.5\n%\xe2\xe3\xcf\xd3\n')
+    where = {}  # number -> (type, field 2, field 3) as in an xref stream row
+    for num, body in sorted(objects.items()):
+        if num not in packed:
+            where[num] = (1, len(out), 0)
+            out += b'%d 0 obj\n%s\nendobj\n' % (num, body)
+    size = max(objects) + 1
+    if packed:
+        header, data = [], b''
+        for index, num in enumerate(sorted(packed)):
+            header.append(b'%d %d' % (num, len(data)))
+            data += objects[num] + b'\n'
+            where[num] = (2, size, index)
+        header = b' '.join(header) + b'\n'
+        where[size] = (1, len(out), 0)
+        out += b'%d 0 obj\n%s\nendobj\n' % (size, stream(header + data, compress=True, Type=b'/ObjStm',
+                                                              N=b'%d' % len(packed), First=b'%d' % len(header)))
+        size += 1
+    trailer = b'/Size %d /Root 1 0 R' % (size + 1 if xref_stream else size)
+    if info:
+        trailer += b' /Info %d 0 R' % info
+
+    start = len(out)
+    if xref_stream:
+        where[size] = (1, start, 0)
+        rows = b''.join(bytes([kind]) + a.to_bytes(4, 'big') + b.to_bytes(2, 'big')
+                        for kind, a, b in (where.get(num, (0, 0, 65535)) for num in range(size + 1)))
+        out += b'%d 0 obj\n%s\nendobj\n' % (size, stream(rows, compress=True, Type=b'/XRef', W=b'[1 4 2]',
+                                                              **{'Size': b'%d' % (size + 1), 'Root': b'1 0 R'},
+                                                              **({'Info': b'%d 0 R' % info} if info else {})))
+    else:
+        out += b'xref\n0 %d\n0000000000 65535 f\r\n' % size
+        for num in range(1, size):
+            out += b'%010d 00000 n\r\n' % where[num][1] if num in where else b'0000000000 00000 f\r\n'
+        out += b'trailer\n<< %s >>\n' % trailer
+    out += b'startxref\n%d\n%%%%EOF\n' % start
+    Path(path).write_bytes(bytes(out))
+    return str(path)
+
+
+def one_page(content=TEXT, compress=False, font=FONT):
+    return {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        2: b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        3: b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 5 0 R >> >> '
+           b'/Contents 4 0 R >>',
+        4: stream(content, compress=compress),
+        5: font,
+    }
+
+
+def assert_same_as_pypdf2(path):
+    lazy = read_pdf_info_lazy(path)
+    assert lazy == read_pdf_info(path, lazy=False)
+    return lazy
+
+
+def test_title_from_first_page_text(tmp_path):
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', one_page()))
+    assert info == {'title': 'Design Build Contract Special Provisions', 'page_count': 1, 'metadata': {}}
+
+
+def test_compressed_content_stream(tmp_path):
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', one_page(compress=True)))
+    assert info['title'] == 'Design Build Contract Special Provisions'
+
+
+def test_info_dictionary(tmp_path):
+    objects = one_page()
+    objects[6] = (b'<< /Title (Appendix E2 \\(Conformed\\)) /Author <FEFF00570053004400D6005400BB> '
+                  b'/Producer (Scan\\222Pro) /CreationDate (D:20140812093000-07\'00\') /Trapped /False >>')
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects, info=6))
+    assert info['title'] == 'Appendix E2 (Conformed)'
+    assert info['metadata']['/Author'] == 'WSDÖT»'
+    assert info['metadata']['/Producer'] == 'Scan™Pro'
+    assert info['metadata']['/Trapped'] == '/False'
+
+
+def test_short_metadata_title_falls_through_to_page_text(tmp_path):
+    objects = one_page()
+    objects[6] = b'<< /Title (Doc) >>'
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects, info=6))
+    assert info['title'] == 'Design Build Contract Special Provisions'
+
+
+def test_nested_page_tree_with_inherited_resources(tmp_path):
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        2: b'<< /Type /Pages /Kids [3 0 R 9 0 R] /Count 3 /Resources << /Font << /F1 5 0 R >> >> >>',
+        3: b'<< /Type /Pages /Parent 2 0 R /Kids [6 0 R 7 0 R] /Count 2 >>',
+        4: stream(TEXT),
+        5: FONT,
+        6: b'<< /Type /Page /Parent 3 0 R /MediaBox [0 0 612 792] /Contents [4 0 R 8 0 R] >>',
+        7: b'<< /Type /Page /Parent 3 0 R /MediaBox [0 0 612 792] >>',
+        8: stream(b'BT /F1 12 Tf 72 600 Td (Continued on the next page) Tj ET'),
+        9: b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>',
+    }
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects))
+    assert info['page_count'] == 3
+
+
+def test_to_unicode_cmap(tmp_path):
+    # Codes 1-5 spell out the text only through the CMap
+    cmap = (b'/CIDInit /ProcSet findresource begin 12 dict begin begincmap\n'
+            b'1 begincodespacerange <00> <FF> endcodespacerange\n'
+            b'2 beginbfchar <01> <0052> <02> <0020> endbfchar\n'
+            b'1 beginbfrange <03> <05> <0045> endbfrange\n'
+            b'endcmap CMapName currentdict /CMap defineresource pop end end')
+    objects = one_page(content=b'BT /F1 12 Tf 72 720 Td <0103040502010304050201030405> Tj ET',
+                       font=b'<< /Type /Font /Subtype /TrueType /BaseFont /Arial /ToUnicode 6 0 R >>')
+    objects[6] = stream(cmap, compress=True)
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects))
+    assert info['title'] == 'REFG REFG REFG'
+
+
+def test_xref_stream(tmp_path):
+    objects = one_page(compress=True)
+    objects[6] = b'<< /Title (Technical Requirements Section 2.7) >>'
+    info = assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects, info=6, xref_stream=True))
+    assert info['title'] == 'Technical Requirements Section 2.7'
+
+
+def test_object_stream(tmp_path):
+    objects = one_page(compress=True)
+    objects[6] = b'<< /Subject (Object stream entries) >>'
+    path = build_pdf(tmp_path / 'a.pdf', objects, info=6, xref_stream=True, packed={1, 2, 3, 5, 6})
+    info = assert_same_as_pypdf2(path)
+    assert info['metadata'] == {'/Subject': 'Object stream entries'}
+    assert info['title'] == 'Design Build Contract Special Provisions'
+
+
+def test_file_written_by_pypdf2(tmp_path):
+    writer = PyPDF2.PdfWriter()
+    for _ in range(4):
+        writer.add_blank_page(width=612, height=792)
+    writer.add_metadata({'/Title': 'Appendix M1 - Design Build Quality Manual', '/Author': 'Design-Builder'})
+    path = tmp_path / 'a.pdf'
+    with open(path, 'wb') as f:
+        writer.write(f)
+    info = assert_same_as_pypdf2(str(path))
+    assert info['title'] == 'Appendix M1 - Design Build Quality Manual'
+    assert info['page_count'] == 4
+
+
+def test_document_without_pages(tmp_path):
+    objects = {1: b'<< /Type /Catalog /Pages 2 0 R >>', 2: b'<< /Type /Pages /Kids [] /Count 0 >>'}
+    assert assert_same_as_pypdf2(build_pdf(tmp_path / 'a.pdf', objects)) == {
+        'title': '', 'page_count': 0, 'metadata': {}}
+
+
+def test_unsupported_font_encoding_falls_back_to_pypdf2(tmp_path):
+    font = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding << /Differences [65 /B] >> >>'
+    path = build_pdf(tmp_path / 'a.pdf', one_page(font=font))
+    with pytest.raises(LazyPdfError):
+        read_pdf_info_lazy(path)
+    assert read_pdf_info(path, lazy=True) == read_pdf_info(path, lazy=False)
+
+
+# ---------------------------------------------------------------- malformed input
+
+def malformed(tmp_path, data):
+    path = tmp_path / 'bad.pdf'
+    path.write_bytes(data)
+    return str(path)
+
+
+def good_pdf_bytes(tmp_path):
+    return Path(build_pdf(tmp_path / 'good.pdf', one_page())).read_bytes()
+
+
+def test_empty_file_raises(tmp_path):
+    with pytest.raises(LazyPdfError):
+        LazyPdf(malformed(tmp_path, b''))
+
+
+def test_not_a_pdf_raises(tmp_path):
+    with pytest.raises(LazyPdfError):
+        LazyPdf(malformed(tmp_path, b'<!DOCTYPE html><html><body>Sign in</body></html>\n' * 20))
+
+
+def test_truncated_file_raises(tmp_path):
+    data = good_pdf_bytes(tmp_path)
+    with pytest.raises(LazyPdfError, match='startxref'):
+        LazyPdf(malformed(tmp_path, data[:len(data) // 2]))
+
+
+@pytest.mark.parametrize('offset', [b'12', b'999999', b'-5'])
+def test_bad_startxref_offset_raises(tmp_path, offset):
+    data = good_pdf_bytes(tmp_path)
+    start = data.rindex(b'startxref')
+    data = data[:start] + b'startxref\n' + offset + b'\n%%EOF\n'
+    with pytest.raises(LazyPdfError):
+        LazyPdf(malformed(tmp_path, data))
+
+
+def test_irregular_xref_entries_raise(tmp_path):
+    # 19-byte entries: the reader indexes entries by arithmetic, so it must refuse them
+    data = good_pdf_bytes(tmp_path).replace(b'65535 f\r\n', b'65535 f\n')
+    with pytest.raises(LazyPdfError, match='Irregular'):
+        LazyPdf(malformed(tmp_path, data))
+
+
+def test_encrypted_file_raises(tmp_path):
+    data = good_pdf_bytes(tmp_path).replace(b'/Root 1 0 R', b'/Root 1 0 R /Encrypt 5 0 R')
+    with pytest.raises(LazyPdfError, match='Encrypted'):
+        LazyPdf(malformed(tmp_path, data))
+
+
+def test_reference_loop_raises(tmp_path):
+    objects = one_page()
+    objects[6] = b'6 0 R'
+    with pytest.raises(LazyPdfError, match='loop'):
+        read_pdf_info_lazy(build_pdf(tmp_path / 'a.pdf', objects, info=6))
+
+
+def test_unsupported_filter_raises(tmp_path):
+    objects = one_page()
+    objects[4] = stream(TEXT, Filter=b'/LZWDecode')
+    with pytest.raises(LazyPdfError, match='Unsupported filter'):
+        read_pdf_info_lazy(build_pdf(tmp_path / 'a.pdf', objects))
+
+
+def test_unterminated_string_raises(tmp_path):
+    with pytest.raises(LazyPdfError):
+        read_pdf_info_lazy(build_pdf(tmp_path / 'a.pdf', one_page(content=b'BT /F1 12 Tf (No closing paren Tj ET')))
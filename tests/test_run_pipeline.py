@@ -0,0 +1,56 @@
+"""A dashboard stage is only skipped while the assets its page loads are intact."""
+
+import sys
+from pathlib import Path
+
+# run_pipeline.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+import run_pipeline
+from run_pipeline import Stage, is_up_to_date, path_hash
+
+STAGE = Stage(name='dashboard', script='', function='', inputs=['data.csv'],
+              outputs=['page.html', 'assets/data/page-*'])
+
+
+def build(root):
+    (root / 'assets' / 'data').mkdir(parents=True, exist_ok=True)
+    (root / 'data.csv').write_text('a,b\n1,2\n')
+    (root / 'page.html').write_text('<html></html>')
+    (root / 'assets' / 'data' / 'page-section.0123456789ab.json').write_text('{"rows": 1}')
+
+
+def recorded(stage):
+    """Manifest entries as _run_stages writes them after a successful run."""
+    inputs = {path: path_hash(path) for path in stage.inputs}
+    return inputs, {path: {'stage': stage.name, 'inputs': inputs, 'templates': {}, 'sha256': path_hash(path)}
+                    for path in stage.outputs}
+
+
+def test_intact_build_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_pipeline, 'REPO_ROOT', str(tmp_path))
+    build(tmp_path)
+    inputs, artifacts = recorded(STAGE)
+    assert is_up_to_date(STAGE, inputs, {}, artifacts)
+
+
+def test_deleted_assets_rebuild(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_pipeline, 'REPO_ROOT', str(tmp_path))
+    build(tmp_path)
+    inputs, artifacts = recorded(STAGE)
+    for item in (tmp_path / 'assets' / 'data').iterdir():
+        item.unlink()
+    assert not is_up_to_date(STAGE, inputs, {}, artifacts)
+
+
+def test_edited_asset_rebuilds(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_pipeline, 'REPO_ROOT', str(tmp_path))
+    build(tmp_path)
+    inputs, artifacts = recorded(STAGE)
+    (tmp_path / 'assets' / 'data' / 'page-section.0123456789ab.json').write_text('{"rows": 2}')
+    assert not is_up_to_date(STAGE, inputs, {}, artifacts)
+
+
+def test_pattern_matching_nothing_has_a_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_pipeline, 'REPO_ROOT', str(tmp_path))
+    assert path_hash('assets/js/plotly-*') is not None
+    assert path_hash('missing.html') is None
@@ -0,0 +1,131 @@
+"""Keyed row-level diff between two snapshots of a tracker CSV."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# snapshot_diff.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from snapshot_diff import diff_frames, summarize, describe, read_snapshot
+
+KEY = 'Doc_Number'
+
+
+def frame(*rows):
+    return pd.DataFrame(rows, columns=[KEY, 'Document_Name', 'Review_Status'], dtype=str)
+
+
+def records(old, new, label='Document_Name'):
+    """Diff records as (key, occurrence, change, field, old, new) tuples."""
+    diff = diff_frames(old, new, KEY, label)
+    return [tuple(row) for row in diff[[KEY, 'Occurrence', 'Change', 'Field', 'Old', 'New']].itertuples(index=False)]
+
+
+OLD = frame(
+    ('1', 'Contract Form', 'Reviewed'),
+    ('2', 'General Provisions', 'Not Started'),
+    ('3', 'Technical Requirements', 'In Progress'),
+)
+
+
+def test_identical_snapshots_have_no_changes():
+    diff = diff_frames(OLD, OLD.copy(), KEY)
+    assert diff.empty
+    assert describe(summarize(diff, KEY)) == 'no changes'
+
+
+def test_added_removed_and_changed_rows():
+    new = frame(
+        ('1', 'Contract Form', 'Reviewed'),
+        ('3', 'Technical Requirements', 'Reviewed'),
+        ('4', 'Appendices', 'Not Started'),
+    )
+    assert records(OLD, new) == [
+        ('4', 1, 'added', '', '', ''),
+        ('2', 1, 'removed', '', '', ''),
+        ('3', 1, 'changed', 'Review_Status', 'In Progress', 'Reviewed'),
+    ]
+    labels = diff_frames(OLD, new, KEY, 'Document_Name')['Label'].tolist()
+    assert labels == ['Appendices', 'General Provisions', 'Technical Requirements']
+    assert summarize(diff_frames(OLD, new, KEY), KEY) == {'added': 1, 'removed': 1, 'changed': 1, 'fields': 1}
+
+
+def test_every_changed_field_is_a_record():
+    new = frame(
+        ('1', 'Contract Form (Conformed)', 'In Progress'),
+        ('2', 'General Provisions', 'Not Started'),
+        ('3', 'Technical Requirements', 'In Progress'),
+    )
+    assert records(OLD, new) == [
+        ('1', 1, 'changed', 'Document_Name', 'Contract Form', 'Contract Form (Conformed)'),
+        ('1', 1, 'changed', 'Review_Status', 'Reviewed', 'In Progress'),
+    ]
+    assert summarize(diff_frames(OLD, new, KEY), KEY) == {'added': 0, 'removed': 0, 'changed': 1, 'fields': 2}
+
+
+def test_reordered_rows_are_unchanged():
+    assert diff_frames(OLD, OLD.iloc[::-1], KEY).empty
+
+
+def test_duplicate_key_with_middle_row_removed():
+    old = frame(
+        ('52', 'Plans A', 'Reviewed'),
+        ('52', 'Plans B', 'Reviewed'),
+        ('52', 'Plans C', 'Reviewed'),
+    )
+    new = frame(
+        ('52', 'Plans A', 'Reviewed'),
+        ('52', 'Plans C', 'Reviewed'),
+    )
+    # Only the middle copy is reported, not "B changed to C, C removed"
+    assert records(old, new) == [('52', 2, 'removed', '', '', '')]
+
+
+def test_duplicate_key_changes_pair_in_file_order():
+    old = frame(
+        ('52', 'Plans A', 'Reviewed'),
+        ('52', 'Plans B', 'Reviewed'),
+    )
+    new = frame(
+        ('52', 'Plans A', 'Not Started'),
+        ('52', 'Plans B', 'In Progress'),
+    )
+    assert records(old, new) == [
+        ('52', 1, 'changed', 'Review_Status', 'Reviewed', 'Not Started'),
+        ('52', 2, 'changed', 'Review_Status', 'Reviewed', 'In Progress'),
+    ]
+
+
+def test_blank_keys_are_left_out():
+    old = frame(('', 'Section heading', ''), ('1', 'Contract Form', 'Reviewed'))
+    new = frame((' ', 'Renamed heading', ''), ('1', 'Contract Form', 'Reviewed'))
+    assert diff_frames(old, new, KEY).empty
+
+
+def test_column_added_between_snapshots():
+    new = OLD.assign(Notes=['', 'Check chapter 1', ''])
+    # An added column reads as '' in the old snapshot, so only non-blank cells change
+    assert records(OLD, new) == [('2', 1, 'changed', 'Notes', '', 'Check chapter 1')]
+
+
+def test_column_dropped_between_snapshots():
+    new = OLD.drop(columns=['Review_Status'])
+    assert [r[:4] for r in records(OLD, new)] == [
+        ('1', 1, 'changed', 'Review_Status'),
+        ('2', 1, 'changed', 'Review_Status'),
+        ('3', 1, 'changed', 'Review_Status'),
+    ]
+
+
+def test_empty_previous_snapshot():
+    diff = diff_frames(OLD.iloc[0:0], OLD, KEY, 'Document_Name')
+    assert diff['Change'].tolist() == ['added'] * 3
+    assert diff[KEY].tolist() == ['1', '2', '3']
+    assert summarize(diff, KEY) == {'added': 3, 'removed': 0, 'changed': 0, 'fields': 0}
+
+
+def test_cells_compare_as_sheet_text():
+    old = read_snapshot(b'Doc_Number,Document_Name,Review_Status\n007,Plans,\n')
+    new = read_snapshot(b'Doc_Number,Document_Name,Review_Status\n007,Plans,nan\n')
+    assert records(old, new) == [('007', 1, 'changed', 'Review_Status', '', 'nan')]
@@ -0,0 +1,100 @@
+"""The single-pass status cube agrees with a plain groupby per dimension."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# status_cube.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from status_cube import build_status_cube, STATUS_LABELS, STATUS_ORDER
+
+DIMENSIONS = {'Category': 'Phase', 'Deliverable Type': 'Format', 'Grouped_Party': 'Party'}
+
+
+@pytest.fixture
+def df():
+    # Non-default index: drilldown positions are offsets, not labels
+    return pd.DataFrame({
+        'Category': ['Design', 'Construction', 'Design', None, 'Closeout', 'Construction', 'Design', 'Closeout'],
+        'Deliverable Type': ['Report', 'Plan', 'Plan', 'Report', None, 'Report', 'Report', 'Plan'],
+        'Grouped_Party': ['WSDOT', 'Design-Builder', 'Design-Builder', 'WSDOT', 'Unknown', 'WSDOT',
+                          'Design-Builder', 'Design-Builder'],
+        'Status_Normalized': ['Complete', 'In Progress', 'Not Started', 'Complete', 'Complete',
+                              'Not Started', 'Complete', 'In Progress'],
+    }, index=[40, 11, 7, 3, 25, 90, 0, 5])
+
+
+def groupby_table(df, column, label):
+    """What the dashboard computed before the cube: one groupby().agg() per dimension."""
+    flags = df.assign(
+        Completed=df['Status_Normalized'] == 'Complete',
+        **{'In Progress': df['Status_Normalized'] == 'In Progress',
+           'Not Started': df['Status_Normalized'] == 'Not Started'},
+    )
+    table = flags.groupby(column).agg(
+        Completed=('Completed', 'sum'),
+        **{'In Progress': ('In Progress', 'sum'), 'Not Started': ('Not Started', 'sum')},
+        Total=('Status_Normalized', 'count'),
+    ).reset_index().rename(columns={column: label})
+    table['Completion_Pct'] = (table['Completed'] / table['Total'] * 100).round(1)
+    return table
+
+
+def test_tables_match_groupby(df):
+    cube = build_status_cube(df, DIMENSIONS)
+    for column, label in DIMENSIONS.items():
+        expected = groupby_table(df, column, label)
+        actual = cube['tables'][column]
+        assert list(actual.columns) == [label] + STATUS_LABELS + ['Total', 'Completion_Pct']
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_totals(df):
+    totals = build_status_cube(df, DIMENSIONS)['totals']
+    assert totals == {
+        'Completed': 4, 'In Progress': 2, 'Not Started': 2, 'Total': 8,
+        'Completion_Pct': 50.0,
+    }
+
+
+def test_drilldown_index_lists_row_positions(df):
+    index = build_status_cube(df, DIMENSIONS, with_index=True)['index']
+    status = df['Status_Normalized'].to_numpy()
+    for column, label in DIMENSIONS.items():
+        values = df[column].to_numpy()
+        expected = {
+            str(value): [np.flatnonzero((values == value) & (status == state)).tolist() for state in STATUS_ORDER]
+            for value in sorted(df[column].dropna().unique())
+        }
+        assert index[label] == expected
+
+    # Spot check against the fixture: Design rows are positions 0, 2 and 6
+    assert index['Phase']['Design'] == [[0, 6], [], [2]]
+
+
+def test_drilldown_ranges_add_up_to_table_counts(df):
+    cube = build_status_cube(df, DIMENSIONS, with_index=True)
+    for column, label in DIMENSIONS.items():
+        table = cube['tables'][column].set_index(label)
+        for value, cells in cube['index'][label].items():
+            assert [len(rows) for rows in cells] == table.loc[value, STATUS_LABELS].tolist()
+
+
+def test_unknown_status_is_left_out(df):
+    df = df.copy()
+    df.iloc[0, df.columns.get_loc('Status_Normalized')] = 'On Hold'
+    cube = build_status_cube(df, DIMENSIONS, with_index=True)
+    assert cube['totals']['Total'] == 7
+    assert cube['tables']['Category'].set_index('Phase').loc['Design', 'Total'] == 2
+    assert 0 not in sum(cube['index']['Phase']['Design'], [])
+
+
+def test_empty_frame():
+    empty = pd.DataFrame({'Category': [], 'Status_Normalized': []}, dtype=object)
+    cube = build_status_cube(empty, {'Category': 'Phase'}, with_index=True)
+    assert cube['totals']['Total'] == 0 and cube['totals']['Completion_Pct'] == 0
+    assert cube['tables']['Category'].empty
+    assert cube['index'] == {'Phase': {}}
@@ -0,0 +1,87 @@
+"""The shared status rule table reads statuses like the old per-dashboard code did."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# status_rules.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from status_rules import normalize_status, normalize_review_status, group_responsible_party
+
+# (raw status, closeout label, documents label)
+CASES = [
+    ('Complete', 'Complete', 'Reviewed'),
+    ('completed', 'Complete', 'Reviewed'),
+    ('reviewed', 'Complete', 'Reviewed'),
+    ('  Reviewed  ', 'Complete', 'Reviewed'),
+    ('Not Started', 'Not Started', 'Not Started'),
+    ('n/a', 'Not Started', 'Not Started'),
+    ('N/A', 'Not Started', 'Not Started'),
+    ('NA', 'Not Started', 'Not Started'),
+    ('', 'Not Started', 'Not Started'),
+    ('   ', 'Not Started', 'Not Started'),
+    (None, 'Not Started', 'Not Started'),
+    (np.nan, 'Not Started', 'Not Started'),
+    ('In Progress', 'In Progress', 'In Progress'),
+    ('In progress', 'In Progress', 'In Progress'),
+    ('Ongoing', 'In Progress', 'In Progress'),
+    ('Ongoign', 'In Progress', 'In Progress'),
+    ('Due', 'In Progress', 'In Progress'),
+    ('Past Due', 'In Progress', 'In Progress'),
+    ('Located', 'In Progress', 'In Progress'),
+    ('Pending', 'In Progress', 'In Progress'),
+    ('03-Internal Response Review', 'In Progress', 'In Progress'),
+    ('12 - WSDOT Review', 'In Progress', 'In Progress'),
+    ('Something new', 'In Progress', 'In Progress'),
+]
+
+
+def old_closeout_status(value):
+    """The closeout dashboard's hand-written normalize_status before the rule table."""
+    if pd.isna(value):
+        return 'Not Started'
+    text = str(value).strip()
+    if not text:
+        return 'Not Started'
+    if text == 'Ongoign':
+        text = 'Ongoing'
+    lower = text.lower()
+    if lower in {'complete', 'completed', 'reviewed'}:
+        return 'Complete'
+    if lower in {'not started', 'n/a', 'na'}:
+        return 'Not Started'
+    return 'In Progress'
+
+
+RAW = pd.Series([raw for raw, _, _ in CASES], dtype=object)
+
+
+@pytest.mark.parametrize('raw, closeout, documents', CASES)
+def test_expected_labels(raw, closeout, documents):
+    values = pd.Series([raw], dtype=object)
+    assert normalize_status(values).tolist() == [closeout]
+    assert normalize_review_status(values).tolist() == [documents]
+
+
+def test_closeout_labels_match_old_apply():
+    assert normalize_status(RAW).tolist() == RAW.apply(old_closeout_status).tolist()
+
+
+def test_documents_labels_are_the_closeout_states_relabelled():
+    old = RAW.apply(old_closeout_status).replace({'Complete': 'Reviewed'})
+    assert normalize_review_status(RAW).tolist() == old.tolist()
+
+
+def test_index_is_kept():
+    values = pd.Series(['Reviewed', 'Due'], index=[10, 3])
+    assert normalize_status(values).index.tolist() == [10, 3]
+
+
+def test_responsible_party_groups():
+    values = pd.Series(['Design-Builder (DB)', 'Design Builder', 'WSDOT / Design-Builder', 'WSDOT / DB',
+                        'City of Seattle', None], dtype=object)
+    assert group_responsible_party(values).tolist() == [
+        'Design-Builder', 'Design-Builder', 'Design-Builder', 'WSDOT', 'City of Seattle', 'Unknown']
@@ -0,0 +1,177 @@
+"""
+Conditional, validated sync against a local stand-in for the published sheet
+The stand-in serves a CSV the way the published sheet does (ETag /
+Last-Modified, 304 on a matching conditional request) and can misbehave on
+purpose: cut the transfer short, serve an HTML page instead of the CSV, or
+answer with an HTTP error.
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# sync_from_sheets.py lives in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from sync_from_sheets import sync_from_sheets, SyncError
+
+SAMPLE_CSV = Path(__file__).resolve().parents[1] / 'data' / 'documents_tracker.csv'
+
+SIGN_IN_PAGE = b'<!DOCTYPE html><html><head><title>Sign in - Google Accounts</title></head><body></body></html>'
+
+
+class SheetStandIn:
+    """Serves `body` at /pub?output=csv on 127.0.0.1 until stopped."""
+
+    def __init__(self, body):
+        self.validators = True  # Send ETag / Last-Modified and honor conditional requests
+        self.truncate = False   # Promise the full Content-Length, send half, close
+        self.status = 200       # Anything else is sent as an HTTP error
+        self.requests = []      # Request headers seen, in order
+        self.set_body(body)
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requests.append(dict(self.headers))
+                if stand_in.status != 200:
+                    self.send_error(stand_in.status)
+                    return
+                # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110)
+                if_none_match = self.headers.get('If-None-Match')
+                if if_none_match is not None:
+                    not_modified = if_none_match == stand_in.etag
+                else:
+                    not_modified = self.headers.get('If-Modified-Since') == stand_in.last_modified
+                if stand_in.validators and not_modified:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                body = stand_in.body
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/csv; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                if stand_in.validators:
+                    self.send_header('ETag', stand_in.etag)
+                    self.send_header('Last-Modified', stand_in.last_modified)
+                self.end_headers()
+                self.wfile.write(body[:len(body) // 2] if stand_in.truncate else body)
+                if stand_in.truncate:
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass  # Keep the test output readable
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def set_body(self, body):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        self.last_modified = formatdate(usegmt=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/pub?output=csv"
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def body():
+    return SAMPLE_CSV.read_bytes()
+
+
+@pytest.fixture
+def sheet(body):
+    stand_in = SheetStandIn(body)
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def local_csv(tmp_path):
+    return str(tmp_path / 'documents_tracker.csv')
+
+
+@pytest.fixture
+def sync(sheet, local_csv, tmp_path):
+    """A call that syncs from the stand-in into tmp_path and returns sync_from_sheets()'s result."""
+    state_path = str(tmp_path / '.documents_tracker_sync.json')
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sync_from_sheets(sheet.url, local_csv, state_path)
+    return run
+
+
+def assert_rejected(sync, local_csv):
+    """The sync raises SyncError and leaves the tracker and no download behind."""
+    before = Path(local_csv).read_bytes()
+    with pytest.raises(SyncError):
+        sync()
+    assert Path(local_csv).read_bytes() == before
+    assert not os.path.exists(local_csv + '.download')
+
+
+def test_first_sync_downloads_the_tracker(sync, local_csv, body):
+    assert sync() is True
+    assert Path(local_csv).read_bytes() == body
+
+
+def test_second_sync_is_not_modified(sync, sheet):
+    sync()
+    assert sync() is False
+    assert sheet.requests[-1].get('If-None-Match') == sheet.etag
+
+
+def test_same_bytes_without_validators_are_unchanged(sync, sheet):
+    sync()
+    sheet.validators = False
+    assert sync() is False
+
+
+def test_edited_sheet_is_changed(sync, sheet, local_csv, body):
+    sync()
+    edited = body.replace(b'Not Started', b'In Progress', 1)
+    sheet.set_body(edited)
+    assert sync() is True
+    assert Path(local_csv).read_bytes() == edited
+
+
+def test_cut_off_transfer_is_rejected(sync, sheet, local_csv):
+    sync()
+    sheet.set_body(sheet.body + b'\n')  # New validators so the request is not a 304
+    sheet.truncate = True
+    assert_rejected(sync, local_csv)
+
+
+def test_html_page_is_rejected(sync, sheet, local_csv):
+    sync()
+    sheet.set_body(SIGN_IN_PAGE)
+    assert_rejected(sync, local_csv)
+
+
+def test_export_with_a_quarter_of_the_rows_is_rejected(sync, sheet, local_csv, body):
+    sync()
+    lines = body.splitlines(keepends=True)
+    sheet.set_body(b''.join(lines[:len(lines) // 4]))
+    assert_rejected(sync, local_csv)
+
+
+def test_http_error_is_rejected(sync, sheet, local_csv):
+    sync()
+    sheet.status = 500
+    assert_rejected(sync, local_csv)
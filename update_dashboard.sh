@@ -18,17 +18,6 @@ echo "🔍 Montlake All Dashboards Update Tool"
 echo "========================================"
 echo ""
 
-# Sync documents tracker from Google Sheets
-echo "📥 Syncing documents tracker from Google Sheets..."
-python3 scripts/sync_from_sheets.py
-
-if [ $? -ne 0 ]; then
-    echo "❌ Error syncing from Google Sheets"
-    exit 1
-fi
-
-echo ""
-
 # Function to find CSV files
 find_csv_files() {
     find "$DESKTOP_DIR" "$DOWNLOADS_DIR" -maxdepth 1 -name "*.csv" -type f 2>/dev/null | grep -i "montlake\|closeout" | sort
@@ -100,53 +89,54 @@ if ! grep -q "data/current_closeout.csv" scripts/closeout_dashboard_v3.py; then
 fi
 
 echo ""
-echo "🎨 Generating dashboards..."
+echo "🎨 Syncing documents tracker and generating dashboards..."
 echo ""
 
-# Generate closeout documents dashboard
-echo "1️⃣  Generating closeout documents dashboard..."
-python3 scripts/closeout_dashboard_v3.py
-
-if [ $? -ne 0 ]; then
-    echo "❌ Error generating closeout dashboard"
+# Sync from Google Sheets, build the closeout dashboard (copied to index.html
+# for the GitHub Pages homepage) and the documents dashboard.
+# Independent stages run in parallel; stages with unchanged inputs are skipped.
+if ! python3 scripts/run_pipeline.py; then
+    echo "❌ Error updating dashboards"
     exit 1
 fi
 
-# Copy to root (for GitHub Pages homepage)
-echo "   ✅ Closeout dashboard created"
-cp /Users/z/Desktop/montlake_closeout.html index.html
-
-# Generate documents dashboard
-echo "2️⃣  Generating documents dashboard..."
-python3 scripts/generate_documents_dashboard.py
-
-if [ $? -ne 0 ]; then
-    echo "❌ Error generating documents dashboard"
-    exit 1
-fi
-
-echo "   ✅ Documents dashboard created"
-
-# Show changes
+# Row-level changes since the last commit (reports/changes/), summarized in
+# the default commit message
 echo ""
-echo "📊 Git Status:"
-git status --short
-
-echo ""
-read -p "💬 Commit message (or press Enter for default): " COMMIT_MSG
-
-if [ -z "$COMMIT_MSG" ]; then
-    COMMIT_MSG="Update dashboard from $ORIGINAL_NAME ($(date '+%Y-%m-%d %H:%M'))"
+CHANGE_SUMMARY=""
+if python3 scripts/snapshot_diff.py; then
+    CHANGE_SUMMARY=$(cat reports/changes/summary.txt)
 fi
 
-# Commit changes
-echo "💾 Committing changes..."
-git add $CLOSEOUT_CSV scripts/closeout_dashboard_v3.py scripts/generate_documents_dashboard.py data/documents_tracker.csv index.html contractdocs.html
+# Stage changes. Unchanged data leaves the dashboards byte-identical (the
+# generated-at time lives in assets/generated_at/ and only moves when a
+# page changed), so there is nothing to commit in that case.
+git add $CLOSEOUT_CSV scripts/closeout_dashboard_v3.py scripts/generate_documents_dashboard.py data/documents_tracker.csv index.html contractdocs.html assets
 
 # Check if there are changes to commit
 if git diff --staged --quiet; then
+    echo ""
     echo "ℹ️  No changes to commit (data unchanged)"
 else
+    # Show changes
+    echo ""
+    echo "📊 Git Status:"
+    git status --short
+
+    echo ""
+    read -p "💬 Commit message (or press Enter for default): " COMMIT_MSG
+
+    if [ -z "$COMMIT_MSG" ]; then
+        COMMIT_MSG="Update dashboard from $ORIGINAL_NAME ($(date '+%Y-%m-%d %H:%M'))"
+        if [ -n "$CHANGE_SUMMARY" ]; then
+            COMMIT_MSG="$COMMIT_MSG
+
+$CHANGE_SUMMARY"
+        fi
+    fi
+
+    # Commit changes
+    echo "💾 Committing changes..."
     git commit -m "$COMMIT_MSG"
 
     # Push to GitHub